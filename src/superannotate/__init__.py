@@ -7,23 +7,13 @@ __version__ = "4.4.8dev"
 
 sys.path.append(os.path.split(os.path.realpath(__file__))[0])
 
+import importlib  # noqa
 import logging.config  # noqa
-import requests  # noqa
 from packaging.version import parse  # noqa
-from superannotate.lib.app.input_converters import convert_json_version  # noqa
-from superannotate.lib.app.input_converters import convert_project_type  # noqa
-from superannotate.lib.app.analytics.class_analytics import class_distribution  # noqa
-from superannotate.lib.app.exceptions import AppException  # noqa
-from superannotate.lib.app.input_converters import convert_json_version  # noqa
-from superannotate.lib.app.input_converters import convert_project_type  # noqa
-from superannotate.lib.app.input_converters import export_annotation  # noqa
-from superannotate.lib.app.input_converters import import_annotation  # noqa
-from superannotate.lib.app.interface.sdk_interface import SAClient  # noqa
 from superannotate.lib.core import PACKAGE_VERSION_INFO_MESSAGE  # noqa
 from superannotate.lib.core import PACKAGE_VERSION_MAJOR_UPGRADE  # noqa
 from superannotate.lib.core import PACKAGE_VERSION_UPGRADE  # noqa
 from superannotate.logger import get_default_logger  # noqa
-import superannotate.lib.core.enums as enums  # noqa
 
 SESSIONS = {}
 
@@ -44,11 +34,42 @@ __all__ = [
 
 __author__ = "Superannotate"
 
+# Public names are resolved on first access, so that importing the package
+# does not pull in the client, converters and analytics dependencies.
+_LAZY_ATTRIBUTES = {
+    "SAClient": "superannotate.lib.app.interface.sdk_interface",
+    "enums": "superannotate.lib.core.enums",
+    "AppException": "superannotate.lib.app.exceptions",
+    "class_distribution": "superannotate.lib.app.analytics.class_analytics",
+    "convert_json_version": "superannotate.lib.app.input_converters",
+    "import_annotation": "superannotate.lib.app.input_converters",
+    "export_annotation": "superannotate.lib.app.input_converters",
+    "convert_project_type": "superannotate.lib.app.input_converters",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if name == "enums" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 logging.getLogger("botocore").setLevel(logging.CRITICAL)
 logger = get_default_logger()
 
 
 def log_version_info():
+    import requests
+
     local_version = parse(__version__)
     if local_version.is_prerelease:
         logger.info(PACKAGE_VERSION_INFO_MESSAGE.format(__version__))
@@ -1,7 +1,6 @@
 from pathlib import Path
 
 import pandas as pd
-import plotly.express as px
 from lib.app.interface.base_interface import Tracker
 from superannotate.lib.app.exceptions import AppException
 from superannotate.lib.core import DEPRICATED_DOCUMENT_VIDEO_MESSAGE
@@ -60,6 +59,8 @@ def class_distribution(export_root, project_names, visualize=False):
     df = df.sort_values(["count"], ascending=False)
 
     if visualize:
+        import plotly.express as px
+
         fig = px.bar(
             df,
             x="className",
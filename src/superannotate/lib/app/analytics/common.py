@@ -1,8 +1,10 @@
 import json
+from collections import Counter
+from itertools import repeat
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 from lib.app.exceptions import AppException
 from superannotate.logger import get_default_logger
 
@@ -387,17 +389,21 @@ def instance_consensus(inst_1, inst_2):
     :param inst_2: Second instance for consensus score.
     :type inst_2: shapely object or a tag
     """
-    if inst_1.type == inst_2.type == "Polygon":
+    if inst_1.geom_type == inst_2.geom_type == "Polygon":
         intersect = inst_1.intersection(inst_2)
         union = inst_1.union(inst_2)
         score = intersect.area / union.area
-    elif inst_1.type == inst_2.type == "Point":
+    elif inst_1.geom_type == inst_2.geom_type == "Point":
         score = -1 * inst_1.distance(inst_2)
     else:
         raise NotImplementedError
 
     return score
 
+def _is_nan(value):
+    return isinstance(value, float) and value != value
+
+
 def calculate_tag_consensus(image_df):
     column_names = [
         "creatorEmail",
@@ -408,131 +414,194 @@ def calculate_tag_consensus(image_df):
         "attributeGroupName",
         "attributeName"
     ]
-
+    image_df = image_df.reset_index()
     image_data = {}
     for column_name in column_names:
-        image_data[column_name] = []
-
-    image_df=image_df.reset_index()
-    image_data["score"] = []
-    for i, irow in image_df.iterrows():
-        for c in column_names:
-            image_data[c].append(irow[c])
-        image_data["score"].append(0)
-        for j, jrow in image_df.iterrows():
-            if i == j:
-                continue
-            if (irow["className"] == jrow["className"]) and irow["attributeGroupName"] == jrow["attributeGroupName"] and irow["attributeName"] == jrow["attributeName"]:
-                image_data["score"][i]+=1
+        image_data[column_name] = image_df[column_name].tolist()
+
+    # a tag scores one for every other tag of the item with the same class and attribute,
+    # NaN never compares equal, so tags with NaN keys score zero
+    keys = list(
+        zip(
+            image_df["itemName"],
+            image_df["className"],
+            image_df["attributeGroupName"],
+            image_df["attributeName"],
+        )
+    )
+    keys_count = Counter(keys)
+    image_data["score"] = [
+        0 if any(_is_nan(value) for value in key) else keys_count[key] - 1
+        for key in keys
+    ]
     return image_data
 
-def consensus(df, item_name, annot_type):
-    """Helper function that computes consensus score for instances of a single image:
 
-    :param df: Annotation data of all images
-    :type df: pandas.DataFrame
+class _Box:
+    """Axis-aligned box, scored arithmetically instead of with shapely."""
 
-    :param image_name: The image name for which the consensus score will be computed
-    :type image_name: str
+    __slots__ = ("bounds", "area")
 
-    :param annot_type: Type of annotation instances to consider. Available candidates are: ["bbox", "polygon", "point"]
-    :type dataset_format: str
-    """
+    def __init__(self, x1, y1, x2, y2):
+        self.bounds = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        self.area = (self.bounds[2] - self.bounds[0]) * (
+            self.bounds[3] - self.bounds[1]
+        )
+
+    @property
+    def is_valid(self):
+        return self.area > 0
+
+
+def _get_instance(annot_type, inst_data):
+    if annot_type == "bbox":
+        return _Box(inst_data["x1"], inst_data["y1"], inst_data["x2"], inst_data["y2"])
 
     try:
-        from shapely.geometry import Point, Polygon, box
+        from shapely.geometry import Point, Polygon
     except ImportError:
         raise ImportError(
             "To use superannotate.benchmark or superannotate.consensus functions please install shapely package."
         )
 
-    image_df = df[df["itemName"] == item_name]
-    all_projects = list(set(df["folderName"]))
-    column_names = [
-        "creatorEmail",
-        "itemName",
-        "instanceId",
-        "area",
-        "className",
-        "attributes",
-        "folderName",
-        "score",
-    ]
-    instance_id = 0
-    image_data = {}
-    for column_name in column_names:
-        image_data[column_name] = []
+    if annot_type == "polygon":
+        shapely_format = []
+        for i in range(0, len(inst_data) - 1, 2):
+            shapely_format.append((inst_data[i], inst_data[i + 1]))
+        return Polygon(shapely_format)
+    elif annot_type == "point":
+        return Point(inst_data["x"], inst_data["y"])
 
-    if annot_type == "tag":
-        return calculate_tag_consensus(image_df)
-    projects_shaply_objs = {}
-    # generate shapely objects of instances
-    for _, row in image_df.iterrows():
-        if row["folderName"] not in projects_shaply_objs:
-            projects_shaply_objs[row["folderName"]] = []
-        inst_data = row["meta"]
-        if annot_type == "bbox":
-            inst_coords = inst_data
-            x1, x2 = inst_coords["x1"], inst_coords["x2"]
-            y1, y2 = inst_coords["y1"], inst_coords["y2"]
-            inst = box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
-        elif annot_type == "polygon":
-            inst_coords = inst_data
-            shapely_format = []
-            for i in range(0, len(inst_coords) - 1, 2):
-                shapely_format.append((inst_coords[i], inst_coords[i + 1]))
-            inst = Polygon(shapely_format)
-        elif annot_type == "point":
-            inst = Point(inst_data["x"], inst_data["y"])
-        if  annot_type != "tag" and inst.is_valid:
-            projects_shaply_objs[row["folderName"]].append(
-                (inst, row["className"], row["creatorEmail"], row["attributes"])
+
+class _ItemInstances:
+    """Instances of an item by folder, with the score matrices of the folder pairs."""
+
+    def __init__(self, annot_type, folders_instances):
+        self.annot_type = annot_type
+        self.instances = folders_instances
+        self.visited = {
+            folder_name: [False] * len(instances)
+            for folder_name, instances in folders_instances.items()
+        }
+        self._bounds = {
+            folder_name: np.array(
+                [inst[0].bounds for inst in instances], dtype=float
+            ).reshape(-1, 4)
+            for folder_name, instances in folders_instances.items()
+        }
+        self._classes = {
+            folder_name: np.array([inst[1] for inst in instances], dtype=object)
+            for folder_name, instances in folders_instances.items()
+        }
+        self._scores = {}
+
+    def _get_scores_matrix(self, folder_name, other_folder_name):
+        bounds = self._bounds[folder_name][:, None, :]
+        other_bounds = self._bounds[other_folder_name][None, :, :]
+        if self.annot_type == "point":
+            dx = bounds[..., 0] - other_bounds[..., 0]
+            dy = bounds[..., 1] - other_bounds[..., 1]
+            return -np.sqrt(dx * dx + dy * dy)
+        width = np.minimum(bounds[..., 2], other_bounds[..., 2]) - np.maximum(
+            bounds[..., 0], other_bounds[..., 0]
+        )
+        height = np.minimum(bounds[..., 3], other_bounds[..., 3]) - np.maximum(
+            bounds[..., 1], other_bounds[..., 1]
+        )
+        if self.annot_type == "bbox":
+            intersection = np.maximum(width, 0) * np.maximum(height, 0)
+            areas = (bounds[..., 2] - bounds[..., 0]) * (
+                bounds[..., 3] - bounds[..., 1]
             )
+            other_areas = (other_bounds[..., 2] - other_bounds[..., 0]) * (
+                other_bounds[..., 3] - other_bounds[..., 1]
+            )
+            return intersection / (areas + other_areas - intersection)
+        # polygons have a positive IoU only if their bounding boxes overlap
+        scores = np.zeros(width.shape)
+        instances = self.instances[folder_name]
+        other_instances = self.instances[other_folder_name]
+        for i, j in zip(*np.nonzero((width > 0) & (height > 0))):
+            scores[i, j] = instance_consensus(instances[i][0], other_instances[j][0])
+        return scores
+
+    def scores(self, folder_name, other_folder_name):
+        """
+        Scores of the folder instances (rows) with the other folder instances (columns),
+        -inf for instances of different classes.
+        """
+        key = (folder_name, other_folder_name)
+        if key not in self._scores:
+            scores = self._get_scores_matrix(folder_name, other_folder_name)
+            scores[
+                self._classes[folder_name][:, None]
+                != self._classes[other_folder_name][None, :]
+            ] = float("-inf")
+            self._scores[key] = scores.tolist()
+            self._scores[(other_folder_name, folder_name)] = scores.T.tolist()
+        return self._scores[key]
+
+    def best_match(self, folder_name, inst_id, other_folder_name):
+        if self.annot_type in ["polygon", "bbox", "tag"]:
+            max_score = 0
+        else:
+            max_score = float("-inf")
+        max_inst_id = None
+        visited = self.visited[other_folder_name]
+        for other_id, score in enumerate(
+            self.scores(folder_name, other_folder_name)[inst_id]
+        ):
+            if not visited[other_id] and score > max_score:
+                max_score = score
+                max_inst_id = other_id
+        return max_inst_id
+
+
+def _item_consensus(item_name, rows, annot_type, folders_count, image_data):
+    folders_instances = {}
+    # generate instances
+    for folder_name, meta, class_name, creator_email, attributes in rows:
+        instances = folders_instances.setdefault(folder_name, [])
+        inst = _get_instance(annot_type, meta)
+        if inst.is_valid:
+            instances.append((inst, class_name, creator_email, attributes))
         else:
             logger.info(
                 "Invalid %s instance occured, skipping to the next one.", annot_type
             )
-    visited_instances = {}
-    for proj, instances in projects_shaply_objs.items():
-        visited_instances[proj] = [False] * len(instances)
+    item_instances = _ItemInstances(annot_type, folders_instances)
 
     # match instances
-    for curr_proj, curr_proj_instances in projects_shaply_objs.items():
-        for curr_id, curr_inst_data in enumerate(curr_proj_instances):
-            curr_inst, curr_class, _, _ = curr_inst_data
-            if visited_instances[curr_proj][curr_id] == True:
+    instance_id = 0
+    for curr_folder, curr_folder_instances in folders_instances.items():
+        for curr_id, curr_inst_data in enumerate(curr_folder_instances):
+            if item_instances.visited[curr_folder][curr_id]:
                 continue
             max_instances = []
-            for other_proj, other_proj_instances in projects_shaply_objs.items():
-                if curr_proj == other_proj:
-                    max_instances.append((curr_proj, *curr_inst_data))
-                    visited_instances[curr_proj][curr_id] = True
+            for other_folder in folders_instances:
+                if curr_folder == other_folder:
+                    max_instances.append((curr_folder, curr_id, *curr_inst_data))
+                    item_instances.visited[curr_folder][curr_id] = True
                 else:
-                    if annot_type in ["polygon", "bbox", "tag"]:
-                        max_score = 0
-                    else:
-                        max_score = float("-inf")
-                    max_inst_data = None
-                    max_inst_id = -1
-                    for other_id, other_inst_data in enumerate(other_proj_instances):
-                        other_inst, other_class, _, _ = other_inst_data
-                        if visited_instances[other_proj][other_id] == True:
-                            continue
-                        score = instance_consensus(curr_inst, other_inst)
-                        if score > max_score and other_class == curr_class:
-                            max_score = score
-                            max_inst_data = other_inst_data
-                            max_inst_id = other_id
-                    if max_inst_data is not None:
-                        max_instances.append((other_proj, *max_inst_data))
-                        visited_instances[other_proj][max_inst_id] = True
+                    max_inst_id = item_instances.best_match(
+                        curr_folder, curr_id, other_folder
+                    )
+                    if max_inst_id is not None:
+                        max_instances.append(
+                            (
+                                other_folder,
+                                max_inst_id,
+                                *folders_instances[other_folder][max_inst_id],
+                            )
+                        )
+                        item_instances.visited[other_folder][max_inst_id] = True
             if len(max_instances) == 1:
-                image_data["creatorEmail"].append(max_instances[0][3])
-                image_data["attributes"].append(max_instances[0][4])
-                image_data["area"].append(max_instances[0][1].area)
+                image_data["creatorEmail"].append(max_instances[0][4])
+                image_data["attributes"].append(max_instances[0][5])
+                image_data["area"].append(max_instances[0][2].area)
                 image_data["itemName"].append(item_name)
                 image_data["instanceId"].append(instance_id)
-                image_data["className"].append(max_instances[0][2])
+                image_data["className"].append(max_instances[0][3])
                 image_data["folderName"].append(max_instances[0][0])
                 image_data["score"].append(0)
             else:
@@ -540,24 +609,126 @@ def consensus(df, item_name, annot_type):
                     proj_cons = 0
                     for other_match_data in max_instances:
                         if curr_match_data[0] != other_match_data[0]:
-                            score = instance_consensus(
-                                curr_match_data[1], other_match_data[1]
-                            )
+                            score = item_instances.scores(
+                                curr_match_data[0], other_match_data[0]
+                            )[curr_match_data[1]][other_match_data[1]]
                             proj_cons += 1.0 if score <= 0 else score
-                    image_data["creatorEmail"].append(curr_match_data[3])
-                    image_data["attributes"].append(curr_match_data[4])
-                    image_data["area"].append(curr_match_data[1].area)
+                    image_data["creatorEmail"].append(curr_match_data[4])
+                    image_data["attributes"].append(curr_match_data[5])
+                    image_data["area"].append(curr_match_data[2].area)
                     image_data["itemName"].append(item_name)
                     image_data["instanceId"].append(instance_id)
-                    image_data["className"].append(curr_match_data[2])
+                    image_data["className"].append(curr_match_data[3])
                     image_data["folderName"].append(curr_match_data[0])
-                    image_data["score"].append(proj_cons / (len(all_projects) - 1))
+                    image_data["score"].append(proj_cons / (folders_count - 1))
             instance_id += 1
+    return image_data
+
 
+def _items_consensus(items, annot_type, folders_count):
+    column_names = [
+        "creatorEmail",
+        "itemName",
+        "instanceId",
+        "area",
+        "className",
+        "attributes",
+        "folderName",
+        "score",
+    ]
+    image_data = {}
+    for column_name in column_names:
+        image_data[column_name] = []
+    for item_name, rows in items:
+        _item_consensus(item_name, rows, annot_type, folders_count, image_data)
     return image_data
 
 
+def _get_item_rows(df):
+    return zip(
+        df["folderName"],
+        df["meta"],
+        df["className"],
+        df["creatorEmail"],
+        df["attributes"],
+    )
+
+
+def calculate_consensus(df, annot_type, executor=None, chunk_size=100):
+    """Computes consensus score for instances of all items in the DataFrame, grouping it by item once.
+
+    :param df: Annotation data of all items
+    :type df: pandas.DataFrame
+
+    :param annot_type: Type of annotation instances to consider. Available candidates are: ["bbox", "polygon", "point", "tag"]
+    :type annot_type: str
+
+    :param executor: If given, chunks of items are scored in it, e.g. in a process pool
+    :type executor: concurrent.futures.Executor
+
+    :param chunk_size: Number of items sent to the executor at once
+    :type chunk_size: int
+
+    :return: consensus data with a row for each instance
+    :rtype: pandas DataFrame
+    """
+    groups = df.groupby("itemName", sort=False).indices
+    # rows of an item are consecutive from here on, in the order of the items
+    df = df.iloc[np.concatenate(list(groups.values()))] if groups else df
+    if annot_type == "tag":
+        return pd.DataFrame(calculate_tag_consensus(df))
+
+    folders_count = len(set(df["folderName"]))
+    rows = list(_get_item_rows(df))
+    items, start = [], 0
+    for item_name, indices in groups.items():
+        items.append((item_name, rows[start : start + len(indices)]))
+        start += len(indices)
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if executor and len(chunks) > 1:
+        results = executor.map(
+            _items_consensus,
+            chunks,
+            repeat(annot_type),
+            repeat(folders_count),
+        )
+        consensus_data = None
+        for image_data in results:
+            if consensus_data is None:
+                consensus_data = image_data
+            else:
+                for column_name, values in image_data.items():
+                    consensus_data[column_name].extend(values)
+    else:
+        consensus_data = _items_consensus(items, annot_type, folders_count)
+    return pd.DataFrame(consensus_data)
+
+
+def consensus(df, item_name, annot_type):
+    """Helper function that computes consensus score for instances of a single image:
+
+    :param df: Annotation data of all images
+    :type df: pandas.DataFrame
+
+    :param image_name: The image name for which the consensus score will be computed
+    :type image_name: str
+
+    :param annot_type: Type of annotation instances to consider. Available candidates are: ["bbox", "polygon", "point"]
+    :type dataset_format: str
+    """
+    image_df = df[df["itemName"] == item_name]
+    if annot_type == "tag":
+        return calculate_tag_consensus(image_df)
+    return _items_consensus(
+        [(item_name, _get_item_rows(image_df))],
+        annot_type,
+        len(set(df["folderName"])),
+    )
+
+
 def consensus_plot(consensus_df, *_, **__):
+    import plotly.express as px
+
     plot_data = consensus_df.copy()
 
     # annotator-wise boxplot
@@ -1,6 +1,16 @@
+import collections
+import itertools
 import json
+import os
+from functools import lru_cache
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
 
+import cv2
 import numpy as np
+from PIL import Image
 from superannotate.logger import get_default_logger
 from tqdm import tqdm
 
@@ -71,3 +81,81 @@ def tqdm_converter(total_num, images_converted, images_not_converted, finish_eve
             else:
                 pbar.update(total_num - pbar.n)
                 break
+
+
+def _call_chunk(func: Callable, chunk: list) -> list:
+    return [func(item) for item in chunk]
+
+
+def map_items(
+    func: Callable, items: Iterable, workers: int = 1, chunksize: int = 8
+) -> Iterator:
+    """
+    Calls func for each item and yields the results in the items order.
+    With more than one worker the items are sent to a process pool in chunks,
+    at most workers * 2 chunks are in flight, func and the items should be picklable.
+    """
+    if not workers or workers <= 1:
+        yield from map(func, items)
+        return
+    from lib.core.usecases.base import get_process_executor
+
+    items = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items, chunksize)), [])
+    with get_process_executor(max_workers=workers) as executor:
+        pending = collections.deque(
+            executor.submit(_call_chunk, func, chunk)
+            for chunk in itertools.islice(chunks, workers * 2)
+        )
+        try:
+            while pending:
+                results = pending.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(executor.submit(_call_chunk, func, chunk))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+EXIF_ORIENTATION = 0x0112
+# the orientations of the images rotated by 90 or 270 degrees
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def _read_image_size(path: str, oriented: bool) -> Tuple[int, int]:
+    try:
+        # PIL opens the images lazily, only the header is read here
+        with Image.open(path) as image:
+            width, height = image.size
+            if (
+                oriented
+                and image.getexif().get(EXIF_ORIENTATION) in TRANSPOSED_ORIENTATIONS
+            ):
+                width, height = height, width
+        return height, width
+    # the images over PIL's pixels limit are not an OSError, cv2 reads them
+    except (OSError, Image.DecompressionBombError):
+        pass
+    image = cv2.imread(path, cv2.IMREAD_COLOR if oriented else cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise OSError(f"Can't read the {path} image.")
+    return image.shape[0], image.shape[1]
+
+
+@lru_cache(maxsize=4096)
+def _read_image_size_memo(path: str, mtime: int, oriented: bool) -> Tuple[int, int]:
+    return _read_image_size(path, oriented)
+
+
+def get_image_size(path, oriented: bool = True, memo: bool = True) -> Tuple[int, int]:
+    """
+    Returns the height and width of the image reading only its header,
+    the formats PIL can't identify are decoded with cv2.
+    With oriented the EXIF orientation is applied as cv2.imread does by default,
+    with memo the sizes are memoized by the path and modification time.
+    """
+    path = str(path)
+    if not memo:
+        return _read_image_size(path, oriented)
+    return _read_image_size_memo(path, os.stat(path).st_mtime_ns, oriented)
@@ -6,7 +6,6 @@ from typing import Tuple
 from typing import Union
 
 import boto3
-import pandas as pd
 from superannotate.lib.app.exceptions import AppException
 from superannotate.lib.core import ATTACHED_VIDEO_ANNOTATION_POSTFIX
 from superannotate.lib.core import PIXEL_ANNOTATION_POSTFIX
@@ -77,6 +76,8 @@ def get_s3_annotation_paths(folder_path, s3_bucket, annotation_paths, recursive)
 
 
 def get_name_url_duplicated_from_csv(csv_path):
+    import pandas as pd
+
     image_data = pd.read_csv(csv_path, dtype=str)
     if "url" not in image_data.columns:
         raise AppException("Column 'url' is required")
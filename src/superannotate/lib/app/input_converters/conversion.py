@@ -143,6 +143,7 @@ def export_annotation(
     dataset_name,
     project_type="Vector",
     task="object_detection",
+    workers=1,
 ):
     """
     Converts SuperAnnotate annotation format to the other annotation formats. Currently available (project_type, task) combinations for converter
@@ -179,6 +180,8 @@ def export_annotation(
                  'instance_segmentation' 'Pixel' project_type converts instance masks and 'Vector' project_type generates bounding boxes and polygons from instance masks. Masks should be in the input folder if it is 'Pixel' project_type.
                  'object_detection' converts objects from/to available annotation format
     :type task: str
+    :param workers: Number of processes to convert the images on (Default: 1)
+    :type workers: int
     """
 
     if project_type in [
@@ -194,6 +197,7 @@ def export_annotation(
         (dataset_format, "dataset_format", str),
         (project_type, "project_type", str),
         (task, "task", str),
+        (workers, "workers", int),
     ]
     _passes_type_sanity(params_info)
     input_dir, output_dir = _change_type(input_dir, output_dir)
@@ -216,6 +220,7 @@ def export_annotation(
         dataset_name=dataset_name,
         project_type=project_type,
         task=task,
+        workers=workers,
     )
 
     _passes_converter_sanity(args, "export")
@@ -233,6 +238,7 @@ def import_annotation(
     task="object_detection",
     images_root="",
     images_extensions=None,
+    workers=1,
 ):
     """Converts other annotation formats to SuperAnnotate annotation format. Currently available (project_type, task) combinations for converter
     presented below:
@@ -361,6 +367,8 @@ def import_annotation(
     :type images_root: str
     :param image_extensions: List of image files xtensions in the images_root folder
     :type image_extensions: list
+    :param workers: Number of processes to convert the images on (Default: 1)
+    :type workers: int
 
     """
 
@@ -372,6 +380,7 @@ def import_annotation(
         (project_type, "project_type", str),
         (task, "task", str),
         (images_root, "images_root", str),
+        (workers, "workers", int),
     ]
 
     if images_extensions is not None:
@@ -400,6 +409,7 @@ def import_annotation(
         task=task,
         images_root=images_root,
         images_extensions=images_extensions,
+        workers=workers,
     )
 
     _passes_converter_sanity(args, "import")
@@ -408,18 +418,21 @@ def import_annotation(
 
 
 @Tracker
-def convert_project_type(input_dir, output_dir):
+def convert_project_type(input_dir, output_dir, workers=1):
     """Converts SuperAnnotate 'Vector' project type to 'Pixel' or reverse.
 
     :param input_dir: Path to the dataset folder that you want to convert.
     :type input_dir: Pathlike(str or Path)
     :param output_dir: Path to the folder where you want to have converted files.
     :type output_dir: Pathlike(str or Path)
+    :param workers: Number of processes to convert the images on (Default: 1)
+    :type workers: int
 
     """
     params_info = [
         (input_dir, "input_dir", (str, Path)),
         (output_dir, "output_dir", (str, Path)),
+        (workers, "workers", int),
     ]
     _passes_type_sanity(params_info)
     json_paths = list(Path(str(input_dir)).glob("*.json"))
@@ -432,7 +445,7 @@ def convert_project_type(input_dir, output_dir):
 
     input_dir, output_dir = _change_type(input_dir, output_dir)
 
-    sa_convert_project_type(input_dir, output_dir)
+    sa_convert_project_type(input_dir, output_dir, workers)
 
 
 @Tracker
@@ -2,6 +2,7 @@
 """
 from superannotate.logger import get_default_logger
 
+from ...common import map_items
 from .coco_converters.coco_to_sa_pixel import coco_instance_segmentation_to_sa_pixel
 from .coco_converters.coco_to_sa_pixel import coco_panoptic_segmentation_to_sa_pixel
 from .coco_converters.coco_to_sa_vector import coco_instance_segmentation_to_sa_vector
@@ -149,6 +150,8 @@ class baseStrategy:
         self.output_dir = args.output_dir
         self.task = args.task
         self.direction = args.direction
+        # number of processes that convert the images, 1 converts in this process
+        self.workers = getattr(args, "workers", 1)
         self.conversion_algorithm = CONVERSION_ALGORITHMS[self.direction][
             args.dataset_format
         ][self.project_type][self.task]
@@ -174,3 +177,10 @@ class baseStrategy:
 
     def set_num_converted(self, num_converted_):
         self.num_converted = num_converted_
+
+    def map_items(self, func, items):
+        """
+        Converts the items with func on self.workers processes,
+        yields the results in the items order.
+        """
+        return map_items(func, items, self.workers)
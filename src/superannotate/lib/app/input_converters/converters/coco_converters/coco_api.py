@@ -39,63 +39,42 @@ def _maskfrRLE(rle):
 
 
 def _toString(rle_counts):
-    rle_string = ""
-    for i, count in enumerate(rle_counts):
-        if i > 2:
-            count -= rle_counts[i - 2]
-
-        more = True
-        while more:
-            if count > 0:
-                count_binary = bin(count)
-                if len(count_binary[2:]) % 5 != 0:
-                    count_binary = (
-                        "0b" + "0" * (5 - len(count_binary[2:]) % 5) + count_binary[2:]
-                    )
-            else:
-                count_binary = bin(((1 << 35) - 1) & count)
-
-            count = count >> 5
-            last_bits = count_binary[-5:]
-
-            value = int(last_bits, 2)
-            if last_bits[0] == "1":
-                more = count != -1
-            else:
-                more = count != 0
-
-            if more:
-                char = (value | 0x20) + 48
-            else:
-                char = value + 48
-
-            rle_string += chr(char)
-
-    return rle_string
+    # counts after the third are stored as deltas, in 5 bit groups with a continuation flag
+    counts = np.array(rle_counts, dtype=np.int64)
+    if not counts.size:
+        return ""
+    counts[3:] -= counts[1:-2].copy()
+
+    groups, active = [], []
+    remaining = np.ones(counts.shape, dtype=bool)
+    while remaining.any():
+        value = counts & 0x1F
+        counts >>= 5
+        more = np.where(value & 0x10, counts != -1, counts != 0)
+        groups.append(value + 48 + (more << 5))
+        active.append(remaining)
+        remaining = remaining & more
+
+    # groups of a count are consecutive in the string
+    chars = np.stack(groups, axis=1)[np.stack(active, axis=1)]
+    return chars.astype(np.uint8).tobytes().decode("ascii")
 
 
 def _frString(rle_string):
-    counts = []
-    i = 0
-    while i < len(rle_string):
-        more = True
-        k = 0
-        count = 0
-        while more:
-            value = ord(rle_string[i]) - 48
-            count |= (value & 0x1F) << 5 * k
-            more = value & 0x20
-            i += 1
-            k += 1
-            if not more and (value & 0x10):
-                count |= -1 << 5 * k
-
-        if len(counts) > 2:
-            count += counts[len(counts) - 2]
-
-        counts.append(count)
-
-    return counts
+    if not rle_string:
+        return []
+    values = np.frombuffer(rle_string.encode("ascii"), dtype=np.uint8).astype(np.int64)
+    values -= 48
+    ends = np.flatnonzero(~values & 0x20)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    shifts = 5 * (np.arange(len(values)) - np.repeat(starts, ends - starts + 1))
+    counts = np.bitwise_or.reduceat((values & 0x1F) << shifts, starts)
+    negative = (values[ends] & 0x10).astype(bool)
+    counts[negative] |= -1 << (shifts[ends][negative] + 5)
+
+    counts[1::2] = np.cumsum(counts[1::2])
+    counts[2::2] = np.cumsum(counts[2::2])
+    return counts.tolist()
 
 
 def _area(bitmask):
@@ -5,14 +5,15 @@ from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 
-import cv2
 import numpy as np
 from PIL import Image
 from superannotate.logger import get_default_logger
 
+from ....common import get_image_size
 from ....common import id2rgb
 from ....common import write_to_json
 from ..baseStrategy import baseStrategy
+from .coco_reader import CocoReader
 
 logger = get_default_logger()
 
@@ -196,22 +197,7 @@ class CocoBaseStrategy(baseStrategy):
         return sa_annotation_json
 
     def get_image_dimensions(self, image_path):
-
-        img_height = None
-        img_width = None
-
-        img = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
-        if img is not None:
-            dimensions = img.shape
-            img_height, img_width = (dimensions[0], dimensions[1])
-        else:
-            try:
-                img = Image.open(image_path)
-                img_width, img_height = img.size()
-            except Exception as e:
-                raise
-
-        return img_height, img_width
+        return get_image_size(image_path, oriented=False)
 
     def _prepare_single_image_commons_pixel(self, id_, metadata):
 
@@ -273,8 +259,7 @@ class CocoBaseStrategy(baseStrategy):
         return image_info
 
     def _create_sa_classes(self, json_path):
-        json_data = json.load(open(json_path))
-        classes_list = json_data["categories"]
+        classes_list = CocoReader(json_path).read_array("categories")
 
         classes = []
         for data in classes_list:
@@ -0,0 +1,198 @@
+"""
+Streaming COCO JSON reading
+"""
+import json
+import math
+import os
+import re
+import tempfile
+import zlib
+from collections import defaultdict
+from typing import Any
+from typing import Iterator
+from typing import Tuple
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# the COCO JSON size grouped in memory at once
+BUCKET_SIZE = 64 * 1024 * 1024
+MAX_BUCKETS_COUNT = 128
+
+
+class _JsonStream:
+    def __init__(self, file, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size: int) -> bool:
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        # the consumed part of the buffer is dropped
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._read(self._chunk_size):
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Invalid COCO JSON, expected one of {chars!r}.")
+        self._pos += 1
+        return char
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+                # a number can continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # the read size grows with the value, so big values are decoded a few times
+            self._read(max(self._chunk_size, len(self._buffer)))
+
+
+class CocoReader:
+    """
+    Streams the items of the top level arrays of a COCO JSON file,
+    only the current item is held in memory.
+    Each iteration is a pass over the file.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path):
+        self._path = path
+
+    def iter_arrays(self, *keys: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the key and the item for each item of the given top level arrays
+        in the file order, the other values are skipped.
+        """
+        with open(self._path, encoding="utf-8") as file:
+            stream = _JsonStream(file, self.CHUNK_SIZE)
+            stream.expect("{")
+            if stream.peek() == "}":
+                return
+            while True:
+                key = stream.decode()
+                stream.expect(":")
+                if stream.peek() == "[":
+                    stream.expect("[")
+                    if stream.peek() == "]":
+                        stream.expect("]")
+                    else:
+                        while True:
+                            item = stream.decode()
+                            if key in keys:
+                                yield key, item
+                            if stream.expect(",]") == "]":
+                                break
+                else:
+                    stream.decode()
+                if stream.expect(",}") == "}":
+                    return
+
+    def read_array(self, key: str) -> list:
+        return [item for _, item in self.iter_arrays(key)]
+
+    def get_buckets_count(self) -> int:
+        return min(
+            MAX_BUCKETS_COUNT,
+            max(1, math.ceil(os.path.getsize(self._path) / BUCKET_SIZE)),
+        )
+
+
+class ImageGroups:
+    """
+    Groups the instances by their image ids.
+    With more than one bucket the images and instances are split by the image id
+    into temporary files, so only a bucket is grouped in memory at once.
+    """
+
+    def __init__(self, buckets_count: int = 1):
+        self._buckets_count = buckets_count
+        self._images = []
+        self._image_id_to_instances = defaultdict(list)
+        self._tmp_dir = None
+        self._files = {}
+        if buckets_count > 1:
+            self._tmp_dir = tempfile.TemporaryDirectory()
+            for name in ("images", "instances"):
+                self._files[name] = [
+                    open(os.path.join(self._tmp_dir.name, f"{name}_{i}.jsonl"), "w+")
+                    for i in range(buckets_count)
+                ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        for files in self._files.values():
+            for file in files:
+                file.close()
+        if self._tmp_dir:
+            self._tmp_dir.cleanup()
+
+    def _spill(self, name: str, image_id, item):
+        bucket = zlib.crc32(str(image_id).encode()) % self._buckets_count
+        file = self._files[name][bucket]
+        file.write(json.dumps([image_id, item]))
+        file.write("\n")
+
+    def add_image(self, image_id, image):
+        if self._files:
+            self._spill("images", image_id, image)
+        else:
+            self._images.append((image_id, image))
+
+    def add_instance(self, image_id, instance):
+        if self._files:
+            self._spill("instances", image_id, instance)
+        else:
+            self._image_id_to_instances[image_id].append(instance)
+
+    @staticmethod
+    def _group(images, instances) -> Iterator[Tuple[Any, list]]:
+        image_id_to_instances = defaultdict(list)
+        for image_id, instance in instances:
+            image_id_to_instances[image_id].append(instance)
+        for image_id, image in images:
+            yield image, image_id_to_instances.get(image_id, [])
+
+    def __iter__(self) -> Iterator[Tuple[Any, list]]:
+        """
+        Yields each image with its instances in their adding order,
+        with more than one bucket the images are yielded in the buckets order.
+        The instances of unknown images are dropped.
+        """
+        if not self._files:
+            for image_id, image in self._images:
+                yield image, self._image_id_to_instances.get(image_id, [])
+            return
+        for images_file, instances_file in zip(
+            self._files["images"], self._files["instances"]
+        ):
+            images_file.seek(0)
+            instances_file.seek(0)
+            yield from self._group(
+                map(json.loads, images_file), map(json.loads, instances_file)
+            )
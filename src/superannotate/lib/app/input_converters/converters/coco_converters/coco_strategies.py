@@ -1,5 +1,6 @@
 """
 """
+import itertools
 import threading
 from pathlib import Path
 
@@ -28,6 +29,29 @@ class CocoPanopticConverterStrategy(CocoBaseStrategy):
         )
         return res
 
+    def _make_images(self, jsons):
+        annot_id_generator = self._make_id_generator()
+        segment_id = 1
+        for json_ in jsons:
+            yield next(annot_id_generator), json_, segment_id
+            # a segment id is taken for each instance with parts
+            segment_id += sum("parts" in instance for instance in json_["instances"])
+
+    def _convert_image(self, image):
+        idx, json_, segment_id = image
+        res = self._sa_to_coco_single(idx, json_, itertools.count(segment_id))
+
+        panoptic_mask = json_["metadata"]["panoptic_mask"]
+
+        Image.fromarray(id2rgb(res[2])).save(panoptic_mask)
+
+        annotation = {
+            "image_id": res[0]["id"],
+            "file_name": Path(panoptic_mask).name,
+            "segments_info": res[1],
+        }
+        return res[0], annotation
+
     def sa_to_output_format(self):
         out_json = self._create_skeleton()
         out_json["categories"] = self._create_categories(
@@ -36,9 +60,6 @@ class CocoPanopticConverterStrategy(CocoBaseStrategy):
 
         images = []
         annotations = []
-        id_generator = self._make_id_generator()
-        annot_id_generator = self._make_id_generator()
-
         jsons = self.make_anno_json_generator()
         images_converted = []
         images_not_converted = []
@@ -51,23 +72,12 @@ class CocoPanopticConverterStrategy(CocoBaseStrategy):
         )
         logger.info("Converting to COCO JSON format")
         tqdm_thread.start()
-        for json_ in jsons:
-            idx = next(annot_id_generator)
-            res = self._sa_to_coco_single(idx, json_, id_generator)
-
-            panoptic_mask = json_["metadata"]["panoptic_mask"]
-
-            Image.fromarray(id2rgb(res[2])).save(panoptic_mask)
-
-            annotation = {
-                "image_id": res[0]["id"],
-                "file_name": Path(panoptic_mask).name,
-                "segments_info": res[1],
-            }
+        for image_info, annotation in self.map_items(
+            self._convert_image, self._make_images(jsons)
+        ):
             annotations.append(annotation)
-
-            images.append(res[0])
-            images_converted.append(json_)
+            images.append(image_info)
+            images_converted.append(image_info)
 
         out_json["annotations"] = annotations
         out_json["images"] = images
@@ -117,6 +127,12 @@ class CocoObjectDetectionStrategy(CocoBaseStrategy):
         )
         return res
 
+    def _convert_image(self, image):
+        idx, json_ = image
+        id_generator = self._make_id_generator()
+        res = self._sa_to_coco_single(idx, json_, id_generator)
+        return res[0], res[1], next(id_generator) - 1
+
     def sa_to_output_format(self):
         out_json = self._create_skeleton()
         out_json["categories"] = self._create_categories(
@@ -125,7 +141,6 @@ class CocoObjectDetectionStrategy(CocoBaseStrategy):
 
         images = []
         annotations = []
-        id_generator = self._make_id_generator()
         annot_id_generator = self._make_id_generator()
         jsons = self.make_anno_json_generator()
 
@@ -140,20 +155,21 @@ class CocoObjectDetectionStrategy(CocoBaseStrategy):
         )
         logger.info("Converting to COCO JSON format")
         tqdm_thread.start()
-        for json_ in jsons:
-            idx = next(annot_id_generator)
-            try:
-                images_converted.append(json_)
-                res = self._sa_to_coco_single(idx, json_, id_generator)
-            except Exception as e:
-                images_not_converted.append(json_)
-                raise
-
-            images.append(res[0])
-            if len(res[1]) < 1:
+        # the images are converted with their own annotation ids starting from 1,
+        # which are shifted here to keep the ids unique and in the images order
+        anno_id_offset = 0
+        for image_info, image_annotations, ids_count in self.map_items(
+            self._convert_image,
+            ((next(annot_id_generator), json_) for json_ in jsons),
+        ):
+            images_converted.append(image_info)
+            images.append(image_info)
+            if len(image_annotations) < 1:
                 self.increase_converted_count()
-            for ann in res[1]:
+            for ann in image_annotations:
+                ann["id"] += anno_id_offset
                 annotations.append(ann)
+            anno_id_offset += ids_count
         out_json["annotations"] = annotations
         out_json["images"] = images
 
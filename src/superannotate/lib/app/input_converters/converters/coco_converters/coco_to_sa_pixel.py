@@ -1,7 +1,6 @@
 """
 COCO to SA conversion method
 """
-import json
 import threading
 from pathlib import Path
 
@@ -18,6 +17,8 @@ from ..sa_json_helper import _create_pixel_instance
 from ..sa_json_helper import _create_sa_json
 from .coco_api import _maskfrRLE
 from .coco_api import decode
+from .coco_reader import CocoReader
+from .coco_reader import ImageGroups
 
 logger = get_default_logger()
 
@@ -32,19 +33,20 @@ def annot_to_bitmask(annot):
 
 
 def coco_panoptic_segmentation_to_sa_pixel(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
-    hex_colors = blue_color_generator(len(coco_json["categories"]))
-
+    reader = CocoReader(coco_path)
     cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
-        cat_id_to_cat[cat["id"]] = cat["name"]
-
     img_id_to_shape = {}
-    for img in coco_json["images"]:
-        img_id_to_shape[str(img["id"])] = {
-            "height": img["height"],
-            "width": img["width"],
-        }
+    annotations_count = 0
+    for key, item in reader.iter_arrays("categories", "images", "annotations"):
+        if key == "categories":
+            cat_id_to_cat[item["id"]] = item["name"]
+        elif key == "images":
+            img_id_to_shape[str(item["id"])] = {
+                "height": item["height"],
+                "width": item["width"],
+            }
+        else:
+            annotations_count += 1
 
     images_converted = []
     images_not_converted = []
@@ -52,7 +54,7 @@ def coco_panoptic_segmentation_to_sa_pixel(coco_path, output_dir):
     tqdm_thread = threading.Thread(
         target=tqdm_converter,
         args=(
-            len(coco_json["annotations"]),
+            annotations_count,
             images_converted,
             images_not_converted,
             finish_event,
@@ -61,7 +63,7 @@ def coco_panoptic_segmentation_to_sa_pixel(coco_path, output_dir):
     )
     logger.info("Converting to SuperAnnotate JSON format")
     tqdm_thread.start()
-    for annot in coco_json["annotations"]:
+    for _, annot in reader.iter_arrays("annotations"):
         annot_name = Path(annot["file_name"]).stem
         img_cv = cv2.imread(str(output_dir / ("%s.png" % annot_name)))
         if img_cv is None:
@@ -104,81 +106,81 @@ def coco_panoptic_segmentation_to_sa_pixel(coco_path, output_dir):
 
 
 def coco_instance_segmentation_to_sa_pixel(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
+    reader = CocoReader(coco_path)
     cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
+    for cat in reader.read_array("categories"):
         cat_id_to_cat[cat["id"]] = cat
 
-    images_dict = {}
-    for img in coco_json["images"]:
-        images_dict[int(img["id"])] = {
-            "shape": (img["height"], img["width"], 4),
-            "file_name": img["file_name"],
-            "annotations": [],
-        }
-
-    for annot in coco_json["annotations"]:
-        if int(annot["image_id"]) not in images_dict:
-            continue
-        images_dict[annot["image_id"]]["annotations"].append(annot)
-
     images_converted = []
     images_not_converted = []
     finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(
-            len(images_dict.items()),
-            images_converted,
-            images_not_converted,
-            finish_event,
-        ),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for id_, annotations in images_dict.items():
-        file_name = "%s___pixel.json" % annotations["file_name"]
-        hexcolors = blue_color_generator(len(annotations["annotations"]))
-        mask = np.zeros(annotations["shape"])
-        H, W, _ = mask.shape
-
-        sa_instances = []
-        for i, annot in enumerate(annotations["annotations"]):
-            hexcolor = hexcolors[i]
-            color = hex_to_rgb(hexcolor)
-            if isinstance(annot["segmentation"], dict):
-                bitmask = annot_to_bitmask(annot["segmentation"])
-                mask[bitmask == 1] = list(color)[::-1] + [255]
+    images_count = 0
+    with ImageGroups(reader.get_buckets_count()) as image_groups:
+        for key, item in reader.iter_arrays("images", "annotations"):
+            if key == "images":
+                images_count += 1
+                image_groups.add_image(
+                    int(item["id"]),
+                    {
+                        "shape": (item["height"], item["width"], 4),
+                        "file_name": item["file_name"],
+                    },
+                )
             else:
-                for segment in annot["segmentation"]:
-                    bitmask = np.zeros((H, W)).astype(np.uint8)
-                    pts = np.array(
-                        [
-                            segment[2 * i : 2 * (i + 1)]
-                            for i in range(len(segment) // 2)
-                        ],
-                        dtype=np.int32,
-                    )
-                    cv2.fillPoly(bitmask, [pts], 1)
-                    mask[bitmask == 1] = list(color)[::-1] + [255]
-
-            parts = [{"color": hexcolor}]
-            sa_obj = _create_pixel_instance(
-                parts, [], cat_id_to_cat[annot["category_id"]]["name"]
-            )
-            sa_instances.append(sa_obj)
-
-        sa_metadata = {
-            "name": images_dict[id_]["file_name"],
-            "width": images_dict[id_]["shape"][1],
-            "height": images_dict[id_]["shape"][0],
-        }
-        images_converted.append(annotations["file_name"])
-        json_template = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, json_template)
-        cv2.imwrite(
-            str(output_dir / ("%s___save.png" % annotations["file_name"])), mask
+                image_groups.add_instance(int(item["image_id"]), item)
+
+        tqdm_thread = threading.Thread(
+            target=tqdm_converter,
+            args=(
+                images_count,
+                images_converted,
+                images_not_converted,
+                finish_event,
+            ),
+            daemon=True,
         )
+        logger.info("Converting to SuperAnnotate JSON format")
+        tqdm_thread.start()
+        for image, image_annotations in image_groups:
+            file_name = "%s___pixel.json" % image["file_name"]
+            hexcolors = blue_color_generator(len(image_annotations))
+            mask = np.zeros(image["shape"])
+            H, W, _ = mask.shape
+
+            sa_instances = []
+            for i, annot in enumerate(image_annotations):
+                hexcolor = hexcolors[i]
+                color = hex_to_rgb(hexcolor)
+                if isinstance(annot["segmentation"], dict):
+                    bitmask = annot_to_bitmask(annot["segmentation"])
+                    mask[bitmask == 1] = list(color)[::-1] + [255]
+                else:
+                    for segment in annot["segmentation"]:
+                        bitmask = np.zeros((H, W)).astype(np.uint8)
+                        pts = np.array(
+                            [
+                                segment[2 * i : 2 * (i + 1)]
+                                for i in range(len(segment) // 2)
+                            ],
+                            dtype=np.int32,
+                        )
+                        cv2.fillPoly(bitmask, [pts], 1)
+                        mask[bitmask == 1] = list(color)[::-1] + [255]
+
+                parts = [{"color": hexcolor}]
+                sa_obj = _create_pixel_instance(
+                    parts, [], cat_id_to_cat[annot["category_id"]]["name"]
+                )
+                sa_instances.append(sa_obj)
+
+            sa_metadata = {
+                "name": image["file_name"],
+                "width": image["shape"][1],
+                "height": image["shape"][0],
+            }
+            images_converted.append(image["file_name"])
+            json_template = _create_sa_json(sa_instances, sa_metadata)
+            write_to_json(output_dir / file_name, json_template)
+            cv2.imwrite(str(output_dir / ("%s___save.png" % image["file_name"])), mask)
     finish_event.set()
     tqdm_thread.join()
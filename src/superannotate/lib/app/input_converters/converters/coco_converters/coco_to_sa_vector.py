@@ -1,23 +1,28 @@
 """
 COCO to SA conversion methods
 """
-import json
-import threading
+import array
+from collections import Counter
 from pathlib import Path
+from typing import Iterable
 
 import cv2
 import numpy as np
 from superannotate.logger import get_default_logger
+from tqdm import tqdm
 
-from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_sa_json
 from ..sa_json_helper import _create_vector_instance
 from .coco_api import _maskfrRLE
 from .coco_api import decode
+from .coco_reader import CocoReader
+from .coco_reader import ImageGroups
 
 logger = get_default_logger()
 
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
 
 def annot_to_polygon(annot):
     if isinstance(annot["counts"], list):
@@ -37,110 +42,126 @@ def annot_to_polygon(annot):
     return segments
 
 
-def save_sa_jsons(coco_json, img_id_to_annot, output_dir):
-    images_converted = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["images"]), images_converted, [], finish_event),
-        daemon=True,
-    )
+def save_sa_jsons(image_groups, images_count, output_dir):
     logger.info("Writting to disk")
-    tqdm_thread.start()
-    for img in coco_json["images"]:
-        if "file_name" in img:
-            image_path = Path(img["file_name"]).name
-        else:
-            image_path = img["coco_url"].split("/")[-1]
-
-        if str(img["id"]) not in img_id_to_annot:
-            sa_instances = []
+    with tqdm(total=images_count) as progress:
+        for img, sa_instances in image_groups:
+            if "file_name" in img:
+                image_path = Path(img["file_name"]).name
+            else:
+                image_path = img["coco_url"].split("/")[-1]
+
+            file_name = "%s___objects.json" % image_path
+
+            sa_metadata = {
+                "name": image_path,
+                "width": img["width"],
+                "height": img["height"],
+            }
+            json_template = _create_sa_json(sa_instances, sa_metadata)
+            write_to_json(output_dir / file_name, json_template)
+            progress.update()
+
+
+def _is_int64(value) -> bool:
+    return type(value) is int and INT64_MIN <= value <= INT64_MAX
+
+
+def find_grouped_ids(ids: Iterable) -> set:
+    """
+    Returns the ids that occur more than once.
+    The int64 ids, the common case, are kept in a compact array,
+    the other ids fall back to sets.
+    """
+    int_ids = array.array("q")
+    seen_ids, grouped_ids = set(), set()
+    for id_ in ids:
+        if isinstance(id_, float) and id_.is_integer():
+            id_ = int(id_)
+        if _is_int64(id_):
+            int_ids.append(id_)
+        elif id_ in seen_ids:
+            grouped_ids.add(id_)
         else:
-            sa_instances = img_id_to_annot[str(img["id"])]
-        file_name = "%s___objects.json" % image_path
-
-        sa_metadata = {
-            "name": image_path,
-            "width": img["width"],
-            "height": img["height"],
-        }
-        json_template = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, json_template)
-    finish_event.set()
-    tqdm_thread.join()
+            seen_ids.add(id_)
+    unique_ids, id_counts = np.unique(
+        np.frombuffer(int_ids, dtype=np.int64), return_counts=True
+    )
+    grouped_ids.update(unique_ids[id_counts > 1].tolist())
+    return grouped_ids
+
+
+def read_coco_summary(reader, group_ids: bool = False):
+    """
+    Reads the categories and counts the images and annotations.
+    With group_ids also finds the ids shared by several annotations,
+    whose polygons are grouped in SA JSON.
+    """
+    categories = []
+    counts = Counter()
+
+    def iter_ids():
+        for key, item in reader.iter_arrays("categories", "images", "annotations"):
+            counts[key] += 1
+            if key == "categories":
+                categories.append(item)
+            elif group_ids and key == "annotations" and "id" in item:
+                yield item["id"]
+
+    grouped_ids = find_grouped_ids(iter_ids())
+    return categories, counts, grouped_ids
+
+
+def convert_annotations(reader, annotation_to_sa, counts, output_dir):
+    """
+    Streams the COCO annotations through annotation_to_sa, which yields
+    the SA instances with their image ids, and writes the SA JSONs by image.
+    """
+    with ImageGroups(reader.get_buckets_count()) as image_groups:
+        logger.info("Converting to SuperAnnotate JSON format")
+        with tqdm(total=counts["annotations"]) as progress:
+            for key, item in reader.iter_arrays("images", "annotations"):
+                if key == "images":
+                    image_groups.add_image(str(item["id"]), item)
+                    continue
+                for image_id, sa_obj in annotation_to_sa(item):
+                    image_groups.add_instance(image_id, sa_obj)
+                progress.update()
+        save_sa_jsons(image_groups, counts["images"], output_dir)
 
 
 def coco_instance_segmentation_to_sa_vector(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
+    reader = CocoReader(coco_path)
+    categories, counts, grouped_ids = read_coco_summary(reader, group_ids=True)
     cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
+    for cat in categories:
         cat_id_to_cat[cat["id"]] = cat
 
-    instance_groups = {}
-    for annot in coco_json["annotations"]:
-        if "id" in annot:
-            if annot["id"] in instance_groups:
-                instance_groups[annot["id"]] += 1
-            else:
-                instance_groups[annot["id"]] = 1
-
-    image_id_to_annotations = {}
-    annotations_processed = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["annotations"]), annotations_processed, [], finish_event),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for annot in coco_json["annotations"]:
+    def annotation_to_sa(annot):
         if isinstance(annot["segmentation"], dict):
             annot["segmentation"] = annot_to_polygon(annot["segmentation"])
 
         cat = cat_id_to_cat[annot["category_id"]]
         groupid = 0
+        if "id" in annot and annot["id"] in grouped_ids:
+            groupid = annot["id"]
         for polygon in annot["segmentation"]:
-            if (
-                "id" in annot
-                and annot["id"] in instance_groups
-                and instance_groups[annot["id"]] > 1
-            ):
-                groupid = annot["id"]
-
             sa_obj = _create_vector_instance("polygon", polygon, {}, [], cat["name"])
             if groupid != 0:
                 sa_obj["groupId"] = groupid
+            yield str(annot["image_id"]), sa_obj
 
-            if str(annot["image_id"]) not in image_id_to_annotations:
-                image_id_to_annotations[str(annot["image_id"])] = [sa_obj]
-            else:
-                image_id_to_annotations[str(annot["image_id"])].append(sa_obj)
-        annotations_processed.append(annot)
-    finish_event.set()
-    tqdm_thread.join()
-    save_sa_jsons(coco_json, image_id_to_annotations, output_dir)
+    convert_annotations(reader, annotation_to_sa, counts, output_dir)
 
 
 def coco_object_detection_to_sa_vector(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
+    reader = CocoReader(coco_path)
+    categories, counts, _ = read_coco_summary(reader)
     cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
+    for cat in categories:
         cat_id_to_cat[cat["id"]] = cat
 
-    image_id_to_annotations = {}
-    annotations_processed = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["annotations"]), annotations_processed, [], finish_event),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for annot in coco_json["annotations"]:
-        if isinstance(annot["segmentation"], dict):
-            annot["segmentation"] = annot_to_polygon(annot["segmentation"])
+    def annotation_to_sa(annot):
         cat = cat_id_to_cat[annot["category_id"]]
 
         points = (
@@ -151,22 +172,17 @@ def coco_object_detection_to_sa_vector(coco_path, output_dir):
         )
 
         sa_obj = _create_vector_instance("bbox", points, {}, [], cat["name"])
+        yield str(annot["image_id"]), sa_obj
 
-        if str(annot["image_id"]) not in image_id_to_annotations:
-            image_id_to_annotations[str(annot["image_id"])] = [sa_obj]
-        else:
-            image_id_to_annotations[str(annot["image_id"])].append(sa_obj)
-        annotations_processed.append(annot)
-    finish_event.set()
-    tqdm_thread.join()
-    save_sa_jsons(coco_json, image_id_to_annotations, output_dir)
+    convert_annotations(reader, annotation_to_sa, counts, output_dir)
 
 
 def coco_keypoint_detection_to_sa_vector(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
+    reader = CocoReader(coco_path)
+    categories, counts, _ = read_coco_summary(reader)
 
     cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
+    for cat in categories:
         cat_id_to_cat[cat["id"]] = {
             "name": cat["name"],
             "keypoints": cat["keypoints"],
@@ -174,17 +190,7 @@ def coco_keypoint_detection_to_sa_vector(coco_path, output_dir):
             "supercategory": cat["supercategory"],
         }
 
-    image_id_to_annotations = {}
-    annotations_processed = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["annotations"]), annotations_processed, [], finish_event),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for annot in coco_json["annotations"]:
+    def annotation_to_sa(annot):
         if annot["num_keypoints"] > 0:
             sa_points = [
                 item
@@ -242,11 +248,6 @@ def coco_keypoint_detection_to_sa_vector(coco_path, output_dir):
                     connections,
                     template_name=cat_id_to_cat[annot["category_id"]]["name"],
                 )
-                if str(annot["image_id"]) not in image_id_to_annotations:
-                    image_id_to_annotations[str(annot["image_id"])] = [sa_obj]
-                else:
-                    image_id_to_annotations[str(annot["image_id"])].append(sa_obj)
-        annotations_processed.append(annot)
-    finish_event.set()
-    tqdm_thread.join()
-    save_sa_jsons(coco_json, image_id_to_annotations, output_dir)
+                yield str(annot["image_id"]), sa_obj
+
+    convert_annotations(reader, annotation_to_sa, counts, output_dir)
@@ -4,10 +4,10 @@ Googlecloud to SA conversion method
 import threading
 from pathlib import Path
 
-import cv2
 import pandas as pd
 from superannotate.logger import get_default_logger
 
+from ....common import get_image_size
 from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_sa_json
@@ -38,8 +38,7 @@ def googlecloud_to_sa_vector(path, output_dir):
         file_name = row[1].split("/")[-1]
         try:
             images_converted.append(file_name)
-            img = cv2.imread(str(dir_name / file_name))
-            H, W, _ = img.shape
+            H, W = get_image_size(dir_name / file_name)
         except Exception as e:
             logger.warning("Can't open %s image.", file_name)
             images_not_converted.append(file_name)
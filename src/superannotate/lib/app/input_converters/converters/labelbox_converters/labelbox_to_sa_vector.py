@@ -3,9 +3,9 @@ Labelbox to SA conversion method
 """
 import threading
 
-import cv2
 from superannotate.logger import get_default_logger
 
+from ....common import get_image_size
 from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_sa_json
@@ -89,8 +89,7 @@ def labelbox_to_sa(json_data, output_dir, task):
         images_converted.append(data["External ID"])
         file_name = "%s___objects.json" % data["External ID"]
         try:
-            img = cv2.imread(str(output_dir / data["External ID"]))
-            H, W, _ = img.shape
+            H, W = get_image_size(output_dir / data["External ID"])
         except Exception as e:
             logger.warning(
                 "Can't open %s image. 'height' and 'width' for SA JSON metadata will set to zero",
@@ -4,9 +4,9 @@ VGG to SA conversion method.
 import json
 import threading
 
-import cv2
 from superannotate.logger import get_default_logger
 
+from ....common import get_image_size
 from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_sa_json
@@ -44,7 +44,7 @@ def vgg_to_sa(json_data, task, output_dir):
     class_id_map = {}
     for _, img in images.items():
         try:
-            H, W, _ = cv2.imread(str(output_dir / img["filename"])).shape
+            H, W = get_image_size(output_dir / img["filename"])
         except Exception:
             logger.warning(
                 "Can't open %s image. 'height' and 'width' for SA JSON metadata will set to zero",
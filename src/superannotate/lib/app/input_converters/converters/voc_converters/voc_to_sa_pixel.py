@@ -1,6 +1,7 @@
 """
 VOC to SA conversion method
 """
+import functools
 import threading
 
 import cv2
@@ -9,6 +10,7 @@ from superannotate.logger import get_default_logger
 
 from ....common import blue_color_generator
 from ....common import hex_to_rgb
+from ....common import map_items
 from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_pixel_instance
@@ -85,10 +87,41 @@ def _generate_instances(polygon_instances, voc_instances, bluemask_colors):
     return instances
 
 
-def voc_instance_segmentation_to_sa_pixel(voc_root, output_dir):
-    classes = []
+def _voc_instance_segmentation_to_sa(filename, voc_root, output_dir):
     object_masks_dir = voc_root / "SegmentationObject"
     annotation_dir = voc_root / "Annotations"
+    polygon_instances, sa_mask, bluemask_colors = _generate_polygons(
+        object_masks_dir / filename.name
+    )
+    voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
+    classes = [class_ for class_, _ in voc_instances]
+
+    maped_instances = _generate_instances(
+        polygon_instances, voc_instances, bluemask_colors
+    )
+
+    sa_instances = []
+    for instance in maped_instances:
+        parts = [{"color": instance["blue_color"]}]
+        sa_obj = _create_pixel_instance(
+            parts, instance["classAttributes"], instance["className"]
+        )
+        sa_instances.append(sa_obj)
+
+    file_name = "%s.jpg___pixel.json" % (filename.stem)
+    height, width = _get_image_shape_from_xml(annotation_dir / filename.name)
+    sa_metadata = {"name": filename.stem, "height": height, "width": width}
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_name, sa_json)
+
+    mask_name = "%s.jpg___save.png" % (filename.stem)
+    cv2.imwrite(str(output_dir / mask_name), sa_mask[:, :, ::-1])
+    return classes
+
+
+def voc_instance_segmentation_to_sa_pixel(voc_root, output_dir, workers=1):
+    classes = []
+    object_masks_dir = voc_root / "SegmentationObject"
 
     file_list = list(object_masks_dir.glob("*"))
     if not file_list:
@@ -105,35 +138,16 @@ def voc_instance_segmentation_to_sa_pixel(voc_root, output_dir):
     )
     logger.info("Converting to SuperAnnotate JSON format")
     tqdm_thread.start()
-    for filename in file_list:
-        polygon_instances, sa_mask, bluemask_colors = _generate_polygons(
-            object_masks_dir / filename.name
-        )
-        voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
-        for class_, _ in voc_instances:
-            classes.append(class_)
-
-        maped_instances = _generate_instances(
-            polygon_instances, voc_instances, bluemask_colors
-        )
-
-        sa_instances = []
-        for instance in maped_instances:
-            parts = [{"color": instance["blue_color"]}]
-            sa_obj = _create_pixel_instance(
-                parts, instance["classAttributes"], instance["className"]
-            )
-            sa_instances.append(sa_obj)
-
+    image_classes = map_items(
+        functools.partial(
+            _voc_instance_segmentation_to_sa, voc_root=voc_root, output_dir=output_dir
+        ),
+        file_list,
+        workers,
+    )
+    for filename, classes_ in zip(file_list, image_classes):
+        classes.extend(classes_)
         images_converted.append(filename)
-        file_name = "%s.jpg___pixel.json" % (filename.stem)
-        height, width = _get_image_shape_from_xml(annotation_dir / filename.name)
-        sa_metadata = {"name": filename.stem, "height": height, "width": width}
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, sa_json)
-
-        mask_name = "%s.jpg___save.png" % (filename.stem)
-        cv2.imwrite(str(output_dir / mask_name), sa_mask[:, :, ::-1])
     finish_event.set()
     tqdm_thread.join()
     return classes
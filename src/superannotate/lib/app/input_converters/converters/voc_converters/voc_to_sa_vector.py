@@ -1,12 +1,14 @@
 """
 VOC to SA conversion method
 """
+import functools
 import threading
 
 import cv2
 import numpy as np
 from superannotate.logger import get_default_logger
 
+from ....common import map_items
 from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_sa_json
@@ -79,10 +81,36 @@ def _generate_instances(polygon_instances, voc_instances):
     return instances
 
 
-def voc_instance_segmentation_to_sa_vector(voc_root, output_dir):
-    classes = []
+def _voc_instance_segmentation_to_sa(filename, voc_root, output_dir):
     object_masks_dir = voc_root / "SegmentationObject"
     annotation_dir = voc_root / "Annotations"
+    polygon_instances = _generate_polygons(object_masks_dir / filename.name)
+    voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
+    classes = [class_ for class_, _ in voc_instances]
+
+    maped_instances = _generate_instances(polygon_instances, voc_instances)
+    sa_instances = []
+    for instance in maped_instances:
+        sa_obj = _create_vector_instance(
+            "polygon",
+            instance["polygon"],
+            {},
+            instance["classAttributes"],
+            instance["className"],
+        )
+        sa_instances.append(sa_obj)
+
+    file_name, height, width = _get_image_metadata(annotation_dir / filename.name)
+    file_path = f"{file_name}___objects.json"
+    sa_metadata = {"name": str(filename), "height": height, "width": width}
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_path, sa_json)
+    return classes
+
+
+def voc_instance_segmentation_to_sa_vector(voc_root, output_dir, workers=1):
+    classes = []
+    object_masks_dir = voc_root / "SegmentationObject"
     file_list = list(object_masks_dir.glob("*"))
     if not file_list:
         logger.warning(
@@ -99,37 +127,46 @@ def voc_instance_segmentation_to_sa_vector(voc_root, output_dir):
     )
     logger.info("Converting to SuperAnnotate JSON format")
     tqdm_thread.start()
-    for filename in file_list:
-        polygon_instances = _generate_polygons(object_masks_dir / filename.name)
-        voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
-        for class_, _ in voc_instances:
-            classes.append(class_)
-
-        maped_instances = _generate_instances(polygon_instances, voc_instances)
-        sa_instances = []
-        for instance in maped_instances:
-            sa_obj = _create_vector_instance(
-                "polygon",
-                instance["polygon"],
-                {},
-                instance["classAttributes"],
-                instance["className"],
-            )
-            sa_instances.append(sa_obj)
-
+    image_classes = map_items(
+        functools.partial(
+            _voc_instance_segmentation_to_sa, voc_root=voc_root, output_dir=output_dir
+        ),
+        file_list,
+        workers,
+    )
+    for filename, classes_ in zip(file_list, image_classes):
+        classes.extend(classes_)
         images_converted.append(filename)
-        file_name, height, width = _get_image_metadata(annotation_dir / filename.name)
-        file_path = f"{file_name}___objects.json"
-        sa_metadata = {"name": str(filename), "height": height, "width": width}
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_path, sa_json)
 
     finish_event.set()
     tqdm_thread.join()
     return classes
 
 
-def voc_object_detection_to_sa_vector(voc_root, output_dir):
+def _voc_object_detection_to_sa(filename, voc_root, output_dir):
+    annotation_dir = voc_root / "Annotations"
+    classes = []
+    voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
+    sa_instances = []
+    for class_, bbox in voc_instances:
+        class_name = list(class_.keys())[0]
+        classes.append(class_)
+
+        points = (bbox[0], bbox[1], bbox[2], bbox[3])
+        sa_obj = _create_vector_instance(
+            "bbox", points, {}, class_[class_name], class_name
+        )
+        sa_instances.append(sa_obj)
+
+    file_name, height, width = _get_image_metadata(annotation_dir / filename.name)
+    file_path = f"{file_name}___objects.json"
+    sa_metadata = {"name": str(filename), "height": height, "width": width}
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_path, sa_json)
+    return classes
+
+
+def voc_object_detection_to_sa_vector(voc_root, output_dir, workers=1):
     classes = []
     annotation_dir = voc_root / "Annotations"
     file_list = list(annotation_dir.glob("*"))
@@ -146,26 +183,16 @@ def voc_object_detection_to_sa_vector(voc_root, output_dir):
     )
     logger.info("Converting to SuperAnnotate JSON format")
     tqdm_thread.start()
-
-    for filename in file_list:
-        voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
-        sa_instances = []
-        for class_, bbox in voc_instances:
-            class_name = list(class_.keys())[0]
-            classes.append(class_)
-
-            points = (bbox[0], bbox[1], bbox[2], bbox[3])
-            sa_obj = _create_vector_instance(
-                "bbox", points, {}, class_[class_name], class_name
-            )
-            sa_instances.append(sa_obj)
-
+    image_classes = map_items(
+        functools.partial(
+            _voc_object_detection_to_sa, voc_root=voc_root, output_dir=output_dir
+        ),
+        file_list,
+        workers,
+    )
+    for filename, classes_ in zip(file_list, image_classes):
+        classes.extend(classes_)
         images_converted.append(filename)
-        file_name, height, width = _get_image_metadata(annotation_dir / filename.name)
-        file_path = f"{file_name}___objects.json"
-        sa_metadata = {"name": str(filename), "height": height, "width": width}
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_path, sa_json)
 
     finish_event.set()
     tqdm_thread.join()
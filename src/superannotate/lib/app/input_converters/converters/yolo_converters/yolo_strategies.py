@@ -11,7 +11,9 @@ class YoloStrategy(baseStrategy):
         super().__init__(args)
 
     def to_sa_format(self):
-        classes = self.conversion_algorithm(self.export_root, self.output_dir)
+        classes = self.conversion_algorithm(
+            self.export_root, self.output_dir, self.workers
+        )
         sa_classes = self._create_classes(classes)
         (self.output_dir / "classes").mkdir(exist_ok=True)
         write_to_json(self.output_dir / "classes" / "classes.json", sa_classes)
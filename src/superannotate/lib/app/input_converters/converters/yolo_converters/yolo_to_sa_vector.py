@@ -1,13 +1,17 @@
 """
 YOLO to SA conversion method
 """
+import functools
+import os
 import threading
-from glob import glob
+from collections import defaultdict
 from pathlib import Path
 
-import cv2
+import numpy as np
 from superannotate.logger import get_default_logger
 
+from ....common import get_image_size
+from ....common import map_items
 from ....common import tqdm_converter
 from ....common import write_to_json
 from ..sa_json_helper import _create_sa_json
@@ -16,7 +20,67 @@ from ..sa_json_helper import _create_vector_instance
 logger = get_default_logger()
 
 
-def yolo_object_detection_to_sa_vector(data_path, output_dir):
+def _index_directory(data_path):
+    """
+    Scans the directory once, maps each stem of the '<stem>.*' glob patterns
+    to the names of the entries it matches and lists the annotation files.
+    """
+    index = defaultdict(list)
+    annotations = []
+    with os.scandir(data_path) as entries:
+        for entry in entries:
+            # the hidden files are skipped as glob does
+            if entry.name.startswith("."):
+                continue
+            if entry.name.endswith(".txt") and entry.name != "classes.txt":
+                annotations.append(data_path / entry.name)
+            dot = entry.name.find(".")
+            while dot != -1:
+                index[entry.name[:dot]].append(entry.name)
+                dot = entry.name.find(".", dot + 1)
+    return index, annotations
+
+
+def _read_labels(annotation):
+    with open(annotation) as file:
+        rows = [line.split()[:5] for line in file if line.strip()]
+    labels = np.array(rows, dtype=float).reshape(-1, 5)
+    return labels[:, 0].astype(int), labels[:, 1:]
+
+
+def _yolo_to_sa(item, data_path, output_dir, classes):
+    annotation, files_list = item
+    if len(files_list) == 1:
+        logger.warning("'%s' image for annotation doesn't exist", annotation)
+        return False
+    if len(files_list) > 2:
+        logger.warning("'%s' multiple file for this annotation", annotation)
+        return False
+
+    if Path(files_list[0]).suffix == ".txt":
+        file_name = files_list[1]
+    else:
+        file_name = files_list[0]
+
+    H, W = get_image_size(data_path / file_name)
+
+    class_ids, boxes = _read_labels(annotation)
+    centers = boxes[:, :2] * (W, H)
+    half_sizes = boxes[:, 2:] * (W, H) / 2
+    points = np.hstack((centers - half_sizes, centers + half_sizes)).tolist()
+    sa_instances = [
+        _create_vector_instance("bbox", tuple(box), {}, [], classes[class_id])
+        for class_id, box in zip(class_ids.tolist(), points)
+    ]
+
+    file_name = "%s___objects.json" % file_name
+    sa_metadata = {"name": file_name, "width": W, "height": H}
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_name, sa_json)
+    return True
+
+
+def yolo_object_detection_to_sa_vector(data_path, output_dir, workers=1):
     classes = {}
     id_ = 0
     classes_file = open(data_path / "classes.txt")
@@ -26,9 +90,7 @@ def yolo_object_detection_to_sa_vector(data_path, output_dir):
             classes[id_] = key
             id_ += 1
 
-    annotations = [
-        annot for annot in data_path.glob("*.txt") if annot.name != "classes.txt"
-    ]
+    index, annotations = _index_directory(data_path)
 
     images_converted = []
     images_not_converted = []
@@ -40,45 +102,18 @@ def yolo_object_detection_to_sa_vector(data_path, output_dir):
     )
     logger.info("Converting to SuperAnnotate JSON format")
     tqdm_thread.start()
-    for annotation in annotations:
-        file = open(annotation)
-        file_name = "%s.*" % annotation.stem
-        files_list = glob(str(data_path / file_name))
-        if len(files_list) == 1:
-            images_not_converted.append(annotation.name)
-            logger.warning("'%s' image for annotation doesn't exist", annotation)
-            continue
-        if len(files_list) > 2:
-            images_not_converted.append(annotation.name)
-            logger.warning("'%s' multiple file for this annotation", annotation)
-            continue
-
-        if Path(files_list[0]).suffix == ".txt":
-            file_name = files_list[1]
+    converted = map_items(
+        functools.partial(
+            _yolo_to_sa, data_path=data_path, output_dir=output_dir, classes=classes
+        ),
+        ((annotation, index[annotation.stem]) for annotation in annotations),
+        workers,
+    )
+    for annotation, is_converted in zip(annotations, converted):
+        if is_converted:
+            images_converted.append(annotation.name)
         else:
-            file_name = files_list[0]
-
-        img = cv2.imread(file_name)
-        H, W, _ = img.shape
-
-        sa_instances = []
-        for line in file:
-            values = line.split()
-            class_id = int(values[0])
-            points = (
-                float(values[1]) * W - float(values[3]) * W / 2,
-                float(values[2]) * H - float(values[4]) * H / 2,
-                float(values[1]) * W + float(values[3]) * W / 2,
-                float(values[2]) * H + float(values[4]) * H / 2,
-            )
-            sa_obj = _create_vector_instance("bbox", points, {}, [], classes[class_id])
-            sa_instances.append(sa_obj.copy())
-
-        images_converted.append(annotation.name)
-        file_name = "%s___objects.json" % Path(file_name).name
-        sa_metadata = {"name": Path(file_name).name, "width": W, "height": H}
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, sa_json)
+            images_not_converted.append(annotation.name)
 
     finish_event.set()
     tqdm_thread.join()
@@ -1,3 +1,4 @@
+import functools
 import json
 import shutil
 
@@ -5,10 +6,14 @@ import cv2
 import numpy as np
 from lib.app.exceptions import AppException
 from lib.core import DEPRICATED_DOCUMENT_VIDEO_MESSAGE
+from lib.core.label_map import LabelMap
+from lib.core.label_map import pack_color
 from superannotate.logger import get_default_logger
 
 from ..common import blue_color_generator
+from ..common import get_image_size
 from ..common import hex_to_rgb
+from ..common import map_items
 from ..common import write_to_json
 
 logger = get_default_logger()
@@ -18,154 +23,161 @@ def copy_file(src_path, dst_path):
     shutil.copy(src_path, dst_path)
 
 
-def from_pixel_to_vector(json_paths, output_dir):
-    img_names = []
-    for json_path in json_paths:
-        file_name = str(json_path.name).replace("___pixel.json", "___objects.json")
+def _pixel_to_vector(json_path, output_dir):
+    file_name = str(json_path.name).replace("___pixel.json", "___objects.json")
 
-        mask_name = str(json_path).replace("___pixel.json", "___save.png")
-        img = cv2.imread(mask_name)
-        H, W, _ = img.shape
+    mask_name = str(json_path).replace("___pixel.json", "___save.png")
+    # the BGR mask is indexed by the RGB colors of the parts
+    label_map = LabelMap(cv2.imread(mask_name)[:, :, ::-1])
 
-        sa_json = json.load(open(json_path))
-        instances = sa_json["instances"]
-        idx = 0
-        sa_instances = []
-        for instance in instances:
-            if "parts" not in instance.keys():
-                if "type" in instance.keys() and instance["type"] == "meta":
-                    sa_instances.append(instance)
+    sa_json = json.load(open(json_path))
+    instances = sa_json["instances"]
+    idx = 0
+    sa_instances = []
+    for instance in instances:
+        if "parts" not in instance.keys():
+            if "type" in instance.keys() and instance["type"] == "meta":
+                sa_instances.append(instance)
+            continue
+
+        parts = instance["parts"]
+
+        polygons = []
+        for part in parts:
+            part_mask = label_map.get_mask(pack_color(hex_to_rgb(part["color"])))
+            if part_mask is None:
+                polygons.append([])
                 continue
+            mask, offset = part_mask
+            contours, _ = cv2.findContours(
+                mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=offset
+            )
+            part_polygons = []
+            for contour in contours:
+                segment = contour.flatten().tolist()
+                if len(segment) > 6:
+                    part_polygons.append(segment)
+            polygons.append(part_polygons)
+
+        for part_polygons in polygons:
+            if len(part_polygons) > 1:
+                idx += 1
+                group_id = idx
+            else:
+                group_id = 0
+
+            for polygon in part_polygons:
+                temp = instance.copy()
+                del temp["parts"]
+                temp["pointLabels"] = {}
+                temp["groupId"] = group_id
+                temp["type"] = "polygon"
+                temp["points"] = polygon
+                sa_instances.append(temp.copy())
+                temp["type"] = "bbox"
+                temp["points"] = {
+                    "x1": min(polygon[::2]),
+                    "x2": max(polygon[::2]),
+                    "y1": min(polygon[1::2]),
+                    "y2": max(polygon[1::2]),
+                }
+                sa_instances.append(temp.copy())
+
+    sa_json["instances"] = sa_instances
+    write_to_json(output_dir / file_name, sa_json)
+    return file_name.replace("___objects.json", "")
+
+
+def from_pixel_to_vector(json_paths, output_dir, workers=1):
+    return list(
+        map_items(
+            functools.partial(_pixel_to_vector, output_dir=output_dir),
+            json_paths,
+            workers,
+        )
+    )
 
-            parts = instance["parts"]
 
-            polygons = []
-            for part in parts:
-                color = list(hex_to_rgb(part["color"]))
-                mask = np.zeros((H, W), dtype=np.uint8)
-                mask[np.all((img == color[::-1]), axis=2)] = 255
-                contours, _ = cv2.findContours(
-                    mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-                )
-                part_polygons = []
-                for contour in contours:
-                    segment = contour.flatten().tolist()
-                    if len(segment) > 6:
-                        part_polygons.append(segment)
-                polygons.append(part_polygons)
-
-            for part_polygons in polygons:
-                if len(part_polygons) > 1:
-                    idx += 1
-                    group_id = idx
-                else:
-                    group_id = 0
-
-                for polygon in part_polygons:
-                    temp = instance.copy()
-                    del temp["parts"]
-                    temp["pointLabels"] = {}
-                    temp["groupId"] = group_id
-                    temp["type"] = "polygon"
-                    temp["points"] = polygon
-                    sa_instances.append(temp.copy())
-                    temp["type"] = "bbox"
-                    temp["points"] = {
-                        "x1": min(polygon[::2]),
-                        "x2": max(polygon[::2]),
-                        "y1": min(polygon[1::2]),
-                        "y2": max(polygon[1::2]),
-                    }
-                    sa_instances.append(temp.copy())
-
-        sa_json["instances"] = sa_instances
-        write_to_json(output_dir / file_name, sa_json)
-        img_names.append(file_name.replace("___objects.json", ""))
-    return img_names
-
-
-def from_vector_to_pixel(json_paths, output_dir):
-    img_names = []
-    for json_path in json_paths:
-        file_name = str(json_path.name).replace("___objects.json", "___pixel.json")
-
-        img_name = str(json_path).replace("___objects.json", "")
-        img = cv2.imread(img_name)
-        H, W, _ = img.shape
-
-        sa_json = json.load(open(json_path))
-        instances = sa_json["instances"]
-        mask = np.zeros((H, W, 4))
-
-        sa_instances = []
-        blue_colors = blue_color_generator(len(instances))
-        instances_group = {}
-        for idx, instance in enumerate(instances):
-            if instance["type"] == "polygon":
-                if instance["groupId"] in instances_group.keys():
-                    instances_group[instance["groupId"]].append(instance)
-                else:
-                    instances_group[instance["groupId"]] = [instance]
-            elif instance["type"] == "meta":
-                sa_instances.append(instance)
+def _vector_to_pixel(json_path, output_dir):
+    file_name = str(json_path.name).replace("___objects.json", "___pixel.json")
+
+    img_name = str(json_path).replace("___objects.json", "")
+    H, W = get_image_size(img_name)
 
-        idx = 0
-        for key, instances in instances_group.items():
-            if key == 0:
-                for instance in instances:
-                    pts = np.array(
-                        [
-                            instance["points"][2 * i : 2 * (i + 1)]
-                            for i in range(len(instance["points"]) // 2)
-                        ],
-                        dtype=np.int32,
-                    )
-                    bitmask = np.zeros((H, W))
-                    cv2.fillPoly(bitmask, [pts], 1)
-                    mask[bitmask == 1] = list(hex_to_rgb(blue_colors[idx]))[::-1] + [
-                        255
-                    ]
-                    del instance["type"]
-                    del instance["points"]
-                    del instance["pointLabels"]
-                    del instance["groupId"]
-                    instance["parts"] = [{"color": blue_colors[idx]}]
-                    sa_instances.append(instance.copy())
-                    idx += 1
+    sa_json = json.load(open(json_path))
+    instances = sa_json["instances"]
+    mask = np.zeros((H, W, 4), dtype=np.uint8)
+
+    sa_instances = []
+    blue_colors = blue_color_generator(len(instances))
+    instances_group = {}
+    for idx, instance in enumerate(instances):
+        if instance["type"] == "polygon":
+            if instance["groupId"] in instances_group.keys():
+                instances_group[instance["groupId"]].append(instance)
             else:
-                parts = []
-                for instance in instances:
-                    pts = np.array(
-                        [
-                            instance["points"][2 * i : 2 * (i + 1)]
-                            for i in range(len(instance["points"]) // 2)
-                        ],
-                        dtype=np.int32,
-                    )
-                    bitmask = np.zeros((H, W))
-                    cv2.fillPoly(bitmask, [pts], 1)
-                    mask[bitmask == 1] = list(hex_to_rgb(blue_colors[idx]))[::-1] + [
-                        255
-                    ]
-                    parts.append({"color": blue_colors[idx]})
-                    idx += 1
+                instances_group[instance["groupId"]] = [instance]
+        elif instance["type"] == "meta":
+            sa_instances.append(instance)
+
+    idx = 0
+    for key, instances in instances_group.items():
+        if key == 0:
+            for instance in instances:
+                pts = np.array(
+                    [
+                        instance["points"][2 * i : 2 * (i + 1)]
+                        for i in range(len(instance["points"]) // 2)
+                    ],
+                    dtype=np.int32,
+                )
+                cv2.fillPoly(mask, [pts], (*hex_to_rgb(blue_colors[idx])[::-1], 255))
                 del instance["type"]
                 del instance["points"]
                 del instance["pointLabels"]
                 del instance["groupId"]
-                instance["parts"] = parts
+                instance["parts"] = [{"color": blue_colors[idx]}]
                 sa_instances.append(instance.copy())
-
-        mask_name = file_name.replace("___pixel.json", "___save.png")
-        cv2.imwrite(str(output_dir.joinpath(mask_name)), mask)
-
-        sa_json["instances"] = sa_instances
-        write_to_json(output_dir / file_name, sa_json)
-        img_names.append(file_name.replace("___pixel.json", ""))
-    return img_names
+                idx += 1
+        else:
+            parts = []
+            for instance in instances:
+                pts = np.array(
+                    [
+                        instance["points"][2 * i : 2 * (i + 1)]
+                        for i in range(len(instance["points"]) // 2)
+                    ],
+                    dtype=np.int32,
+                )
+                cv2.fillPoly(mask, [pts], (*hex_to_rgb(blue_colors[idx])[::-1], 255))
+                parts.append({"color": blue_colors[idx]})
+                idx += 1
+            del instance["type"]
+            del instance["points"]
+            del instance["pointLabels"]
+            del instance["groupId"]
+            instance["parts"] = parts
+            sa_instances.append(instance.copy())
+
+    mask_name = file_name.replace("___pixel.json", "___save.png")
+    cv2.imwrite(str(output_dir.joinpath(mask_name)), mask)
+
+    sa_json["instances"] = sa_instances
+    write_to_json(output_dir / file_name, sa_json)
+    return file_name.replace("___pixel.json", "")
+
+
+def from_vector_to_pixel(json_paths, output_dir, workers=1):
+    return list(
+        map_items(
+            functools.partial(_vector_to_pixel, output_dir=output_dir),
+            json_paths,
+            workers,
+        )
+    )
 
 
-def sa_convert_project_type(input_dir, output_dir):
+def sa_convert_project_type(input_dir, output_dir, workers=1):
     json_paths = list(input_dir.glob("*.json"))
 
     output_dir.joinpath("classes").mkdir(parents=True)
@@ -175,9 +187,9 @@ def sa_convert_project_type(input_dir, output_dir):
     )
 
     if "___pixel.json" in json_paths[0].name:
-        img_names = from_pixel_to_vector(json_paths, output_dir)
+        img_names = from_pixel_to_vector(json_paths, output_dir, workers)
     elif "___objects.json" in json_paths[0].name:
-        img_names = from_vector_to_pixel(json_paths, output_dir)
+        img_names = from_vector_to_pixel(json_paths, output_dir, workers)
     elif ".json" in json_paths[0].name:
         raise AppException(DEPRICATED_DOCUMENT_VIDEO_MESSAGE)
     else:
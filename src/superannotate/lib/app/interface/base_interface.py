@@ -1,6 +1,10 @@
+import atexit
 import functools
 import os
+import queue
 import sys
+import threading
+import time
 from inspect import signature
 from pathlib import Path
 from types import FunctionType
@@ -15,6 +19,7 @@ from lib.core.exceptions import AppException
 from lib.infrastructure.controller import Controller
 from lib.infrastructure.repositories import ConfigRepository
 from lib.infrastructure.utils import extract_project_folder
+from mixpanel import BufferedConsumer
 from mixpanel import Mixpanel
 from superannotate import __version__
 
@@ -71,14 +76,119 @@ class BaseInterfaceFacade:
         return self._token
 
 
+class TrackingQueue:
+    """
+    Sends the analytics events in batches from a daemon thread, so SDK calls do not wait for the endpoint.
+    Events are dropped when the queue is full, the remaining ones are sent at exit.
+    Setting SA_TRACKING=False disables the tracking.
+    """
+
+    MAX_SIZE = 1000
+    BATCH_SIZE = 50
+    FLUSH_INTERVAL = 5
+    REQUEST_TIMEOUT = 5
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=self.MAX_SIZE)
+        self._consumer = BufferedConsumer(
+            max_size=self.BATCH_SIZE,
+            request_timeout=self.REQUEST_TIMEOUT,
+            retry_limit=1,
+        )
+        self._consumer_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread = None
+        self.dropped_count = 0
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get("SA_TRACKING", "True").lower() not in (
+            "false",
+            "f",
+            "0",
+        )
+
+    def _start(self):
+        with self._thread_lock:
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="sa-tracking", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def put(self, client, event_name: str, properties: dict) -> bool:
+        """
+        The event time is taken on the caller's thread,
+        the events can be sent seconds later.
+        """
+        if not self._thread:
+            self._start()
+        data = {"time": int(time.time()), **properties}
+        try:
+            self._queue.put_nowait((client, event_name, data))
+            return True
+        except queue.Full:
+            self.dropped_count += 1
+            return False
+
+    def _send(self, client, event_name: str, data: dict):
+        # the team is resolved here and not in put, its first access requests
+        # the team from the backend, which would block the tracked SDK call
+        team_data = client.controller.team_data
+        user_id = team_data.creator_id
+        data = {
+            **Tracker.get_default_payload(team_name=team_data.name, user_id=user_id),
+            **data,
+        }
+        with self._consumer_lock:
+            Mixpanel(Tracker.get_mp_token(client), consumer=self._consumer).track(
+                user_id, event_name, data
+            )
+
+    def _flush_consumer(self):
+        with self._consumer_lock:
+            self._consumer.flush()
+
+    def _run(self):
+        while True:
+            try:
+                event = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                try:
+                    self._flush_consumer()
+                except BaseException:
+                    pass
+                continue
+            try:
+                self._send(*event)
+            except BaseException:
+                pass
+
+    def flush(self):
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._send(*event)
+            except BaseException:
+                pass
+        try:
+            self._flush_consumer()
+        except BaseException:
+            pass
+
+
 class Tracker:
-    def get_mp_instance(self) -> Mixpanel:
-        client = self.get_client()
-        mp_token = "ca95ed96f80e8ec3be791e2d3097cf51"
-        if client:
-            if client.host != constants.BACKEND_URL:
-                mp_token = "e741d4863e7e05b1a45833d01865ef0d"
-        return Mixpanel(mp_token)
+    QUEUE = TrackingQueue()
+
+    @staticmethod
+    def get_mp_token(client) -> str:
+        if client.host != constants.BACKEND_URL:
+            return "e741d4863e7e05b1a45833d01865ef0d"
+        return "ca95ed96f80e8ec3be791e2d3097cf51"
 
     @staticmethod
     def get_default_payload(team_name, user_id):
@@ -92,6 +202,7 @@ class Tracker:
     def __init__(self, function):
         self.function = function
         self._client = None
+        self._signature = None
         functools.update_wrapper(self, function)
 
     def get_client(self):
@@ -108,9 +219,10 @@ class Tracker:
         elif hasattr(self._client, "controller"):
             return self._client
 
-    @staticmethod
-    def extract_arguments(function, *args, **kwargs) -> dict:
-        bound_arguments = signature(function).bind(*args, **kwargs)
+    def extract_arguments(self, *args, **kwargs) -> dict:
+        if not self._signature:
+            self._signature = signature(self.function)
+        bound_arguments = self._signature.bind(*args, **kwargs)
         bound_arguments.apply_defaults()
         return dict(bound_arguments.arguments)
 
@@ -138,27 +250,25 @@ class Tracker:
                 properties[key] = str(value)
         return function_name, properties
 
-    def _track(self, user_id: str, event_name: str, data: dict):
+    def _track(self, client, event_name: str, data: dict):
         if "pytest" not in sys.modules:
-            self.get_mp_instance().track(user_id, event_name, data)
+            self.QUEUE.put(client, event_name, data)
 
     def _track_method(self, args, kwargs, success: bool):
         try:
+            if not self.QUEUE.is_enabled():
+                return
             client = self.get_client()
             if not client:
                 return
             function_name = self.function.__name__ if self.function else ""
-            arguments = self.extract_arguments(self.function, *args, **kwargs)
+            arguments = self.extract_arguments(*args, **kwargs)
             event_name, properties = self.default_parser(function_name, arguments)
-            user_id = client.controller.team_data.creator_id
-            team_name = client.controller.team_data.name
-
             properties["Success"] = success
-            default = self.get_default_payload(team_name=team_name, user_id=user_id)
             self._track(
-                user_id,
+                client,
                 event_name,
-                {**default, **properties, **CONFIG.get_current_session().data},
+                {**properties, **CONFIG.get_current_session().data},
             )
         except BaseException:
             pass
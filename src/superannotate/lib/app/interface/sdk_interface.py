@@ -30,6 +30,7 @@ from lib.app.interface.types import EmailStr
 from lib.app.interface.types import FolderStatusEnum
 from lib.app.interface.types import ImageQualityChoices
 from lib.app.interface.types import NotEmptyStr
+from lib.app.interface.types import PositiveInt
 from lib.app.interface.types import ProjectStatusEnum
 from lib.app.interface.types import ProjectTypes
 from lib.app.interface.types import Setting
@@ -62,7 +63,6 @@ from pydantic import StrictBool
 from pydantic.error_wrappers import ValidationError
 from superannotate.logger import get_default_logger
 from tqdm import tqdm
-from flask import Flask, request
 
 logger = get_default_logger()
 
@@ -88,6 +88,8 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
         super().__init__(token, config_path)
 
     def create_listener(self, memory_object):
+        from flask import Flask, request
+
         self.sa_listener = Flask("SuperAnnotate Listener")
         self.sa_listener_memory_object = memory_object
         return self.sa_listener, request
@@ -2116,6 +2118,42 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
             raise AppException(response.errors)
         return response.data
 
+    def iter_annotations(
+        self,
+        project: NotEmptyStr,
+        items: Optional[List[NotEmptyStr]] = None,
+        batch_size: int = 1000,
+    ):
+        """Returns an iterator over the annotations of the given items.
+        Annotations are yielded as soon as they are received, so memory usage does not grow
+        with the number of items. The order of the annotations is not guaranteed.
+
+        :param project: project name or folder path (e.g., “project1/folder1”).
+        :type project: str
+
+        :param items:  item names. If None all items in the project will be exported
+        :type items: list of strs
+
+        :param batch_size: the number of items requested at a time
+        :type batch_size: int
+
+        :return: iterator of annotations
+        :rtype: iterator of dicts
+        """
+        project, folder = self.controller.get_project_folder_by_path(project)
+        use_case = self.controller.annotations.iterate(
+            project, folder, items, batch_size
+        )
+        if not use_case.is_valid():
+            raise AppException(use_case.response.errors)
+
+        def iterate():
+            yield from use_case.execute()
+            if use_case.response.errors:
+                raise AppException(use_case.response.errors)
+
+        return iterate()
+
     def get_annotations_per_frame(
         self, project: NotEmptyStr, video: NotEmptyStr, fps: int = 1
     ):
@@ -2242,6 +2280,49 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
             raise AppException(response.errors)
         return BaseSerializer.serialize_iterable(response.data, exclude={"meta"})
 
+    def iter_query(
+        self,
+        project: NotEmptyStr,
+        query: Optional[NotEmptyStr] = None,
+        subset: Optional[NotEmptyStr] = None,
+        prefetch: Optional[PositiveInt] = None,
+    ):
+        """Returns an iterator over the items that satisfy the given query.
+        Items are yielded as soon as their page is received,
+        while the next pages are being requested.
+        Query syntax should be in SuperAnnotate query language(https://doc.superannotate.com/docs/query-search-1).
+
+        :param project: project name or folder path (e.g., “project1/folder1”)
+        :type project: str
+
+        :param query: SAQuL query string.
+        :type query: str
+
+        :param subset:  subset name. Allows you to query items in a specific subset.
+            To return all the items in the specified subset, set the value of query param to None.
+        :type subset: str
+
+        :param prefetch: the number of pages requested ahead of the consumed one, 4 by default.
+        :type prefetch: int
+
+        :return: iterator of queried items’ metadata
+        :rtype: iterator of dicts
+        """
+        project_name, folder_name = extract_project_folder(project)
+        use_case = self.controller.iter_query_entities(
+            project_name, folder_name, query, subset, prefetch
+        )
+        if not use_case.is_valid():
+            raise AppException(use_case.response.errors)
+
+        def iterate():
+            for item in use_case.execute():
+                yield BaseSerializer(item).serialize(by_alias=False, exclude={"meta"})
+            if use_case.response.errors:
+                raise AppException(use_case.response.errors)
+
+        return iterate()
+
     def get_item_metadata(
         self,
         project: NotEmptyStr,
@@ -14,6 +14,7 @@ from lib.core.enums import UserRole
 from lib.core.exceptions import AppException
 from lib.infrastructure.validators import wrap_error
 from pydantic import BaseModel
+from pydantic import conint
 from pydantic import conlist
 from pydantic import constr
 from pydantic import errors
@@ -28,6 +29,7 @@ from pydantic.errors import PydanticTypeError
 from pydantic.errors import StrRegexError
 
 NotEmptyStr = constr(strict=True, min_length=1)
+PositiveInt = conint(strict=True, gt=0)
 
 
 class EnumMemberError(PydanticTypeError):
@@ -200,10 +202,17 @@ class AnnotationStatuses(StrictStr):
 
 
 def validate_arguments(func):
+    # the validation model is built on the first call and reused afterwards,
+    # building it for every method at class creation would slow down the import
+    validated_func = None
+
     @wraps(func)
     def wrapped(self, *args, **kwargs):
+        nonlocal validated_func
+        if validated_func is None:
+            validated_func = pydantic_validate_arguments(func)
         try:
-            return pydantic_validate_arguments(func)(self, *args, **kwargs)
+            return validated_func(self, *args, **kwargs)
         except ValidationError as e:
             raise AppException(wrap_error(e))
 
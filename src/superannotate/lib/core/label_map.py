@@ -0,0 +1,66 @@
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+
+def pack_colors(image: np.ndarray) -> np.ndarray:
+    """
+    Packs the channels of an H×W×C uint8 image, C <= 4, into an H×W uint32 map.
+    """
+    packed = np.zeros(image.shape[:2], dtype=np.uint32)
+    for channel in range(image.shape[2]):
+        packed <<= 8
+        packed |= image[:, :, channel]
+    return packed
+
+
+def pack_color(color: Sequence[int]) -> int:
+    packed = 0
+    for value in color:
+        packed = packed << 8 | int(value)
+    return packed
+
+
+class LabelMap:
+    """
+    Indexes the pixels of a color mask by their color.
+    The mask pixels are sorted by color once, then the pixels of each color
+    are a slice, so getting all the parts of a mask costs a single pass.
+    """
+
+    def __init__(self, image: np.ndarray):
+        self.height, self.width = image.shape[:2]
+        colors = pack_colors(image).ravel()
+        self._order = np.argsort(colors, kind="stable")
+        sorted_colors = colors[self._order]
+        self._starts = np.flatnonzero(
+            np.concatenate(([True], sorted_colors[1:] != sorted_colors[:-1]))
+        )
+        self._ends = np.append(self._starts[1:], colors.size)
+        self.colors = sorted_colors[self._starts]
+
+    def get_pixels(self, color: int) -> np.ndarray:
+        """
+        Returns the flat indices of the pixels of the packed color in the raster order.
+        """
+        index = np.searchsorted(self.colors, color)
+        if index == len(self.colors) or self.colors[index] != color:
+            return np.empty(0, dtype=np.intp)
+        return self._order[self._starts[index] : self._ends[index]]
+
+    def get_mask(self, color: int) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """
+        Returns the uint8 mask of the packed color cropped to its bounding box
+        with a zero border inside the image, and the (x, y) offset of the crop.
+        """
+        pixels = self.get_pixels(color)
+        if not pixels.size:
+            return None
+        ys, xs = np.divmod(pixels, self.width)
+        x0, y0 = max(xs.min() - 1, 0), max(ys[0] - 1, 0)
+        x1, y1 = min(xs.max() + 2, self.width), min(ys[-1] + 2, self.height)
+        mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        mask[ys - y0, xs - x0] = 255
+        return mask, (int(x0), int(y0))
@@ -1,5 +1,10 @@
 import io
+import math
+from collections import namedtuple
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -15,8 +20,29 @@ from superannotate.logger import get_default_logger
 
 logger = get_default_logger()
 
+ImageDerivatives = namedtuple(
+    "ImageDerivatives",
+    [
+        "width",
+        "height",
+        "thumb",
+        "huge",
+        "huge_width",
+        "huge_height",
+        "low_resolution",
+    ],
+)
+
 
 class ImagePlugin:
+    THUMB_SIZE = (128, 96)
+    HUGE_WIDTH = 600
+    # resize first reduces the image by an integer factor while it stays
+    # at least REDUCING_GAP times larger than the target size
+    REDUCING_GAP = 3.0
+    EXIF_ORIENTATION = 0x0112
+    SWAPPING_ORIENTATIONS = (5, 6, 7, 8)
+
     def __init__(self, image_bytes: io.BytesIO, max_resolution: int = 4096):
         self._image_bytes = image_bytes
         self._image_bytes.seek(0)
@@ -118,6 +144,89 @@ class ImagePlugin:
         width, height = im.size
         return buffer, width, height
 
+    @staticmethod
+    def generate_derivatives(
+        image_bytes: bytes,
+        image_name: str,
+        quality: int,
+        max_resolution: int = 4096,
+    ) -> ImageDerivatives:
+        """
+        Builds the thumbnail, huge and low resolution images of an uploaded image.
+        Works on raw bytes only, so it can be submitted to a process pool.
+        JPEGs that are uploaded unchanged are decoded at reduced scale with draft().
+        """
+        Image.MAX_IMAGE_PIXELS = None
+        image = Image.open(io.BytesIO(image_bytes))
+        origin_width, origin_height = image.size
+        resolution = origin_width * origin_height
+        if resolution > max_resolution:
+            raise ImageProcessingException(
+                f"Image resolution {resolution} too large. Max supported for resolution is {max_resolution}"
+            )
+        width, height = origin_width, origin_height
+        orientation = image.getexif().get(ImagePlugin.EXIF_ORIENTATION)
+        if orientation in ImagePlugin.SWAPPING_ORIENTATIONS:
+            width, height = height, width
+        is_jpeg = Path(image_name).suffix[1:].upper() in ("JPEG", "JPG")
+        keep_original = is_jpeg and quality == 100
+        if keep_original:
+            scale = ImagePlugin.HUGE_WIDTH / width
+            image.draft(
+                image.mode,
+                (math.ceil(origin_width * scale), math.ceil(origin_height * scale)),
+            )
+        image = ImageOps.exif_transpose(image).convert("RGBA")
+
+        thumb = io.BytesIO()
+        background = Image.new("RGB", ImagePlugin.THUMB_SIZE, "black")
+        thumb_image = image.copy()
+        thumb_image.thumbnail(
+            ImagePlugin.THUMB_SIZE,
+            Image.ANTIALIAS,
+            reducing_gap=ImagePlugin.REDUCING_GAP,
+        )
+        (w, h) = thumb_image.size
+        background.paste(
+            thumb_image,
+            (
+                (ImagePlugin.THUMB_SIZE[0] - w) // 2,
+                (ImagePlugin.THUMB_SIZE[1] - h) // 2,
+            ),
+        )
+        background.save(thumb, "JPEG")
+        thumb.seek(0)
+
+        huge = io.BytesIO()
+        h_size = int(height * ImagePlugin.HUGE_WIDTH / width)
+        image.resize(
+            (ImagePlugin.HUGE_WIDTH, h_size),
+            Image.ANTIALIAS,
+            reducing_gap=ImagePlugin.REDUCING_GAP,
+        ).convert("RGB").save(huge, "JPEG")
+        huge.seek(0)
+
+        if keep_original:
+            low_resolution = io.BytesIO(image_bytes)
+        else:
+            low_resolution = io.BytesIO()
+            bg = Image.new("RGBA", image.size, (255, 255, 255))
+            bg.paste(image, mask=image)
+            subsampling = 0 if not is_jpeg and quality == 100 else -1
+            bg.convert("RGB").save(
+                low_resolution, "JPEG", quality=quality, subsampling=subsampling
+            )
+            low_resolution.seek(0)
+        return ImageDerivatives(
+            width=origin_width,
+            height=origin_height,
+            thumb=thumb,
+            huge=huge,
+            huge_width=width,
+            huge_height=height,
+            low_resolution=low_resolution,
+        )
+
     def draw_bbox(self, x1, x2, y1, y2, fill_color, outline_color):
         image = self.get_empty_image()
         draw = ImageDraw.Draw(image)
@@ -172,17 +281,22 @@ class ImagePlugin:
 
 class VideoPlugin:
     @staticmethod
-    def get_frames_count(video_path: str):
+    def get_frames_count(video_path: str) -> int:
+        """
+        Reads the frame count from the container metadata,
+        frames are only counted when the container does not provide it.
+        """
         video = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG)
-        count = 0
-        flag = True
-        while flag:
-            flag, _ = video.read()
-            if flag:
+        try:
+            count = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+            if count > 0:
+                return count
+            count = 0
+            while video.grab():
                 count += 1
-            else:
-                break
-        return count
+            return count
+        finally:
+            video.release()
 
     @staticmethod
     def get_fps(video_path: str) -> Union[int, float]:
@@ -218,27 +332,21 @@ class VideoPlugin:
             return
 
     @staticmethod
-    def frames_generator(
-        video_path: str, start_time, end_time, target_fps: Optional[float], log=True
-    ):
-        video = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG)
-        if not video.isOpened():
-            raise ImageProcessingException(
-                f"Couldn't open video file {str(video_path)}."
-            )
+    def _grab_frames(video, start_time, end_time, target_fps: Optional[float]):
+        """
+        Grabs the frames of the opened video and yields for each frame selected
+        by the target frame rate within the time window.
+        The time window is checked on the decoded timestamps.
+        """
         fps = video.get(cv2.CAP_PROP_FPS)
         if not target_fps:
             target_fps = fps
         if target_fps > fps:
             target_fps = fps
         ratio = fps / target_fps
-        rotate_code = VideoPlugin.get_video_rotate_code(video_path, log)
         frame_no = 0
         frame_no_with_change = 1.0
-        while True:
-            success, frame = video.read()
-            if not success:
-                break
+        while video.grab():
             frame_no += 1
             if round(frame_no_with_change) != frame_no:
                 continue
@@ -248,9 +356,79 @@ class VideoPlugin:
                 break
             if frame_time < start_time:
                 continue
-            if rotate_code:
-                frame = cv2.rotate(frame, rotate_code)
-            yield frame
+            yield
+
+    @staticmethod
+    def _open(video_path: str):
+        video = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG)
+        if not video.isOpened():
+            raise ImageProcessingException(
+                f"Couldn't open video file {str(video_path)}."
+            )
+        return video
+
+    @staticmethod
+    def frames_generator(
+        video_path: str, start_time, end_time, target_fps: Optional[float], log=True
+    ):
+        video = VideoPlugin._open(video_path)
+        rotate_code = VideoPlugin.get_video_rotate_code(video_path, log)
+        # skipped frames are only grabbed, retrieve() converts the selected ones
+        try:
+            for _ in VideoPlugin._grab_frames(video, start_time, end_time, target_fps):
+                success, frame = video.retrieve()
+                if not success:
+                    break
+                if rotate_code:
+                    frame = cv2.rotate(frame, rotate_code)
+                yield frame
+        finally:
+            video.release()
+
+    @staticmethod
+    def get_extractable_frames_count(
+        video_path: str, start_time, end_time, target_fps: Optional[float]
+    ) -> int:
+        """
+        Counts the frames frames_generator yields, the frames are only grabbed.
+        The container frame count and frame rate are not exact for every video,
+        so the frames are selected on the same timestamps as in the extraction.
+        """
+        video = VideoPlugin._open(video_path)
+        try:
+            return sum(
+                1
+                for _ in VideoPlugin._grab_frames(
+                    video, start_time, end_time, target_fps
+                )
+            )
+        finally:
+            video.release()
+
+    @staticmethod
+    def estimate_extractable_frames_count(
+        video_path: str, start_time, end_time, target_fps: Optional[float]
+    ) -> Optional[int]:
+        """
+        Estimates the count of the frames frames_generator yields
+        from the container frame count and frame rate, no frame is decoded.
+        Returns None when the container does not provide them.
+        """
+        video = VideoPlugin._open(video_path)
+        try:
+            fps = video.get(cv2.CAP_PROP_FPS)
+            count = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+        finally:
+            video.release()
+        if fps <= 0 or count <= 0:
+            return None
+        if not target_fps or target_fps > fps:
+            target_fps = fps
+        first_frame = min(count, math.ceil(start_time * fps))
+        last_frame = count
+        if end_time:
+            last_frame = min(count, math.floor(end_time * fps))
+        return max(0, math.ceil((last_frame - first_frame) * target_fps / fps))
 
     @staticmethod
     def get_extractable_frames(
@@ -260,11 +438,8 @@ class VideoPlugin:
         target_fps: float,
     ):
         total = VideoPlugin.get_frames_count(video_path)
-        total_with_fps = sum(
-            1
-            for _ in VideoPlugin.frames_generator(
-                video_path, start_time, end_time, target_fps, log=False
-            )
+        total_with_fps = VideoPlugin.get_extractable_frames_count(
+            video_path, start_time, end_time, target_fps
         )
         zero_fill_count = len(str(total))
         video_name = Path(video_path).stem
@@ -274,40 +449,65 @@ class VideoPlugin:
             frame_names.append(frame_name)
         return frame_names
 
+    @staticmethod
+    def encode_frame(frame, path: str = None) -> Optional[io.BytesIO]:
+        """
+        Encodes the frame to JPEG, writes it to the path if given.
+        """
+        if path:
+            cv2.imwrite(path, frame)
+            return
+        success, buffer = cv2.imencode(".jpg", frame)
+        if not success:
+            raise ImageProcessingException("Couldn't encode video frame.")
+        return io.BytesIO(buffer.tobytes())
+
     @staticmethod
     def extract_frames(
         video_path: str,
         start_time,
         end_time,
-        extract_path: str,
+        extract_path: Optional[str],
         limit: int,
         target_fps: float,
         chunk_size: int = 100,
-    ) -> List[str]:
+        executor: Executor = None,
+    ) -> Iterator[Union[List[str], List[Tuple[str, io.BytesIO]]]]:
+        """
+        Yields chunks of the extracted frame paths.
+        Without extract_path the frames are kept in memory
+        and chunks of (frame name, JPEG bytes) pairs are yielded.
+        Frames are encoded in the executor if given, while the video is decoded.
+        """
         total_num_of_frames = VideoPlugin.get_frames_count(video_path)
         zero_fill_count = len(str(total_num_of_frames))
         video_name = Path(video_path).stem
         extracted_frame_no = 1
-        extracted_frames_paths = []
+        chunk = []
         for frame in VideoPlugin.frames_generator(
             video_path, start_time, end_time, target_fps
         ):
-            if len(extracted_frames_paths) >= limit:
+            if extracted_frame_no > limit:
                 break
-            path = str(
-                Path(extract_path)
-                / (
-                    video_name
-                    + "_"
-                    + str(extracted_frame_no).zfill(zero_fill_count)
-                    + ".jpg"
-                )
-            )
+            name = f"{video_name}_{str(extracted_frame_no).zfill(zero_fill_count)}.jpg"
+            path = str(Path(extract_path) / name) if extract_path else None
             extracted_frame_no += 1
-            cv2.imwrite(path, frame)
-            extracted_frames_paths.append(path)
-            if len(extracted_frames_paths) % chunk_size == 0:
-                yield extracted_frames_paths
-                extracted_frames_paths.clear()
-        if extracted_frames_paths:
-            yield extracted_frames_paths
+            if executor:
+                encoded = executor.submit(VideoPlugin.encode_frame, frame, path)
+            else:
+                encoded = VideoPlugin.encode_frame(frame, path)
+            chunk.append((name, path, encoded))
+            if len(chunk) == chunk_size:
+                yield VideoPlugin._collect_frames(chunk)
+                chunk = []
+        if chunk:
+            yield VideoPlugin._collect_frames(chunk)
+
+    @staticmethod
+    def _collect_frames(chunk: List[tuple]):
+        frames = []
+        for name, path, encoded in chunk:
+            if isinstance(encoded, Future):
+                encoded = encoded.result()
+            frames.append(path if path else (name, encoded))
+        return frames
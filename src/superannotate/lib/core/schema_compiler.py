@@ -0,0 +1,404 @@
+"""
+Compiles draft 7 JSON schemas into plain python predicates.
+
+A compiled predicate only tells whether an instance is valid, it skips the error
+bookkeeping of jsonschema and is meant to be a fast path in front of the full
+validation, which is still used to build the error messages.
+"""
+import re
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from urllib.parse import unquote
+
+from jsonschema import Draft7Validator
+from jsonschema._utils import equal
+from jsonschema._utils import uniq
+
+Predicate = Callable[[Any], bool]
+Discriminator = Callable[[dict], Tuple[tuple, Any]]
+
+TYPE_CHECKER = Draft7Validator.TYPE_CHECKER
+
+
+class UnsupportedSchema(Exception):
+    pass
+
+
+def compile_schema(
+    schema: dict, discriminator: Discriminator = None
+) -> Optional[Predicate]:
+    """
+    Compiles the schema into a predicate.
+    The discriminator returns the path and the value of the constant that selects
+    a oneOf sub schema, it matches the custom oneOf of the annotation validators.
+    Returns None if the schema uses features that are not supported,
+    e.g. remote references.
+    """
+    try:
+        return _SchemaCompiler(schema, discriminator).compile(schema)
+    except UnsupportedSchema:
+        return None
+
+
+def _valid(_):
+    return True
+
+
+def _invalid(_):
+    return False
+
+
+def _all(checks):
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(instance):
+        for _check in checks:
+            if not _check(instance):
+                return False
+        return True
+
+    return check
+
+
+def _is_number(instance):
+    return type(instance) in (int, float) or TYPE_CHECKER.is_type(instance, "number")
+
+
+def _is_integer(instance):
+    return type(instance) is int or TYPE_CHECKER.is_type(instance, "integer")
+
+
+TYPES = {
+    "object": lambda instance: isinstance(instance, dict),
+    "array": lambda instance: isinstance(instance, list),
+    "string": lambda instance: isinstance(instance, str),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": _is_number,
+    "integer": _is_integer,
+}
+
+
+class _SchemaCompiler:
+    def __init__(self, root: dict, discriminator: Optional[Discriminator]):
+        self._root = root
+        self._discriminator = discriminator
+        self._refs: Dict[str, Predicate] = {}
+
+    def compile(self, schema) -> Predicate:
+        if schema is True:
+            return _valid
+        if schema is False:
+            return _invalid
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(schema)
+        if "$id" in schema and schema is not self._root:
+            # references would be resolved against the nested scope
+            raise UnsupportedSchema("$id")
+        checks = []
+        for keyword, value in schema.items():
+            if keyword not in Draft7Validator.VALIDATORS:
+                continue
+            method = getattr(self, f"_{keyword.lstrip('$')}", None)
+            if not method:
+                raise UnsupportedSchema(keyword)
+            check = method(value, schema)
+            if check:
+                checks.append(check)
+        return _all(checks)
+
+    def _resolve(self, ref: str):
+        if not ref.startswith("#"):
+            raise UnsupportedSchema(ref)
+        document = self._root
+        fragment = unquote(ref[1:])
+        for part in fragment.split("/")[1:] if fragment else []:
+            part = part.replace("~1", "/").replace("~0", "~")
+            try:
+                if isinstance(document, list):
+                    document = document[int(part)]
+                else:
+                    document = document[part]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise UnsupportedSchema(ref)
+        return document
+
+    def _ref(self, ref, _):
+        if ref not in self._refs:
+            # the placeholder allows recursive references
+            compiled = []
+            self._refs[ref] = lambda instance: compiled[0](instance)
+            compiled.append(self.compile(self._resolve(ref)))
+            self._refs[ref] = compiled[0]
+        return self._refs[ref]
+
+    @staticmethod
+    def _type(types, _):
+        if isinstance(types, str):
+            types = [types]
+        try:
+            checks = [TYPES[i] for i in types]
+        except (KeyError, TypeError):
+            raise UnsupportedSchema(types)
+        if len(checks) == 1:
+            return checks[0]
+        return lambda instance: any(check(instance) for check in checks)
+
+    def _properties(self, properties, _):
+        checks = [(k, self.compile(v)) for k, v in properties.items()]
+
+        def check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for key, _check in checks:
+                if key in instance and not _check(instance[key]):
+                    return False
+            return True
+
+        return check
+
+    @staticmethod
+    def _required(required, _):
+        def check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for key in required:
+                if key not in instance:
+                    return False
+            return True
+
+        return check
+
+    def _additionalProperties(self, additional, schema):
+        if isinstance(additional, dict):
+            _check = self.compile(additional)
+        elif additional:
+            return None
+        else:
+            _check = _invalid
+        properties = schema.get("properties", {})
+        patterns = [re.compile(i).search for i in schema.get("patternProperties", {})]
+
+        def check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for key, value in instance.items():
+                if key in properties or any(search(key) for search in patterns):
+                    continue
+                if not _check(value):
+                    return False
+            return True
+
+        return check
+
+    def _patternProperties(self, pattern_properties, _):
+        checks = [
+            (re.compile(k).search, self.compile(v))
+            for k, v in pattern_properties.items()
+        ]
+
+        def check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for search, _check in checks:
+                for key, value in instance.items():
+                    if search(key) and not _check(value):
+                        return False
+            return True
+
+        return check
+
+    def _propertyNames(self, property_names, _):
+        _check = self.compile(property_names)
+        return lambda instance: not isinstance(instance, dict) or all(
+            _check(i) for i in instance
+        )
+
+    @staticmethod
+    def _minProperties(count, _):
+        return lambda instance: not isinstance(instance, dict) or len(instance) >= count
+
+    @staticmethod
+    def _maxProperties(count, _):
+        return lambda instance: not isinstance(instance, dict) or len(instance) <= count
+
+    def _dependencies(self, dependencies, _):
+        checks = [
+            (k, v if isinstance(v, list) else self.compile(v))
+            for k, v in dependencies.items()
+        ]
+
+        def check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for key, dependency in checks:
+                if key not in instance:
+                    continue
+                if isinstance(dependency, list):
+                    if any(i not in instance for i in dependency):
+                        return False
+                elif not dependency(instance):
+                    return False
+            return True
+
+        return check
+
+    def _items(self, items, _):
+        if isinstance(items, list):
+            checks = [self.compile(i) for i in items]
+            return lambda instance: not isinstance(instance, list) or all(
+                _check(i) for _check, i in zip(checks, instance)
+            )
+        _check = self.compile(items)
+
+        def check(instance):
+            if not isinstance(instance, list):
+                return True
+            for item in instance:
+                if not _check(item):
+                    return False
+            return True
+
+        return check
+
+    def _additionalItems(self, additional, schema):
+        items = schema.get("items", {})
+        if isinstance(items, dict):
+            return None
+        if not isinstance(items, list):
+            raise UnsupportedSchema(items)
+        count = len(items)
+        if isinstance(additional, dict):
+            _check = self.compile(additional)
+            return lambda instance: not isinstance(instance, list) or all(
+                _check(i) for i in instance[count:]
+            )
+        if additional:
+            return None
+        return lambda instance: not isinstance(instance, list) or len(instance) <= count
+
+    def _contains(self, contains, _):
+        _check = self.compile(contains)
+        return lambda instance: not isinstance(instance, list) or any(
+            _check(i) for i in instance
+        )
+
+    @staticmethod
+    def _minItems(count, _):
+        return lambda instance: not isinstance(instance, list) or len(instance) >= count
+
+    @staticmethod
+    def _maxItems(count, _):
+        return lambda instance: not isinstance(instance, list) or len(instance) <= count
+
+    @staticmethod
+    def _uniqueItems(unique, _):
+        if not unique:
+            return None
+        return lambda instance: not isinstance(instance, list) or uniq(instance)
+
+    @staticmethod
+    def _enum(enums, _):
+        return lambda instance: any(equal(instance, i) for i in enums)
+
+    @staticmethod
+    def _const(const, _):
+        return lambda instance: equal(instance, const)
+
+    @staticmethod
+    def _minimum(minimum, _):
+        return lambda instance: not _is_number(instance) or instance >= minimum
+
+    @staticmethod
+    def _maximum(maximum, _):
+        return lambda instance: not _is_number(instance) or instance <= maximum
+
+    @staticmethod
+    def _exclusiveMinimum(minimum, _):
+        return lambda instance: not _is_number(instance) or instance > minimum
+
+    @staticmethod
+    def _exclusiveMaximum(maximum, _):
+        return lambda instance: not _is_number(instance) or instance < maximum
+
+    @staticmethod
+    def _multipleOf(multiple, _):
+        def check(instance):
+            if not _is_number(instance):
+                return True
+            if isinstance(multiple, float):
+                quotient = instance / multiple
+                return int(quotient) == quotient
+            return not instance % multiple
+
+        return check
+
+    @staticmethod
+    def _minLength(length, _):
+        return lambda instance: not isinstance(instance, str) or len(instance) >= length
+
+    @staticmethod
+    def _maxLength(length, _):
+        return lambda instance: not isinstance(instance, str) or len(instance) <= length
+
+    @staticmethod
+    def _pattern(pattern, _):
+        search = re.compile(pattern).search
+        return lambda instance: not isinstance(instance, str) or bool(search(instance))
+
+    @staticmethod
+    def _format(*_):
+        # formats are not checked without a format checker
+        return None
+
+    def _allOf(self, schemas, _):
+        return _all([self.compile(i) for i in schemas])
+
+    def _anyOf(self, schemas, _):
+        checks = [self.compile(i) for i in schemas]
+        return lambda instance: any(check(instance) for check in checks)
+
+    def _not(self, schema, _):
+        _check = self.compile(schema)
+        return lambda instance: not _check(instance)
+
+    def _if(self, if_schema, schema):
+        _if = self.compile(if_schema)
+        _then = self.compile(schema.get("then", True))
+        _else = self.compile(schema.get("else", True))
+        return lambda instance: _then(instance) if _if(instance) else _else(instance)
+
+    def _oneOf(self, schemas, _):
+        checks = [self.compile(i) for i in schemas]
+        if not self._discriminator:
+            return lambda instance: sum(1 for check in checks if check(instance)) == 1
+        try:
+            constants = [self._discriminator(i) for i in schemas]
+        except Exception:
+            raise UnsupportedSchema(schemas)
+        cases = list(zip(constants, checks))
+
+        def check(instance):
+            const_path = None
+            for (const_path, const), _check in cases:
+                if const_path:
+                    value = instance
+                    for key in const_path:
+                        if not isinstance(value, dict):
+                            return False
+                        value = value.get(key, {})
+                    if not value:
+                        return False
+                    if value == const:
+                        return _check(instance)
+                elif not any(i(instance) for i in checks):
+                    return False
+            return not const_path
+
+        return check
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from pydantic import Extra
 from pydantic import Field
 from pydantic import parse_obj_as
+from requests.structures import CaseInsensitiveDict
 
 
 class Limit(BaseModel):
@@ -94,10 +95,12 @@ class ServiceResponse(BaseModel):
     content: Optional[Union[bytes, str]]
     data: Optional[Any]
     count: Optional[int] = 0
+    headers: Optional[CaseInsensitiveDict]
     _error: Optional[str] = None
 
     class Config:
         extra = Extra.allow
+        arbitrary_types_allowed = True
 
     def __init__(
         self, response=None, content_type=None, dispatcher: Callable = None, data=None
@@ -109,6 +112,7 @@ class ServiceResponse(BaseModel):
             "status": response.status_code,
             "reason": response.reason,
             "content": response.content,
+            "headers": CaseInsensitiveDict(response.headers),
         }
         try:
             response_json = response.json()
@@ -1,9 +1,12 @@
 import io
 from abc import ABC
+from concurrent.futures import Executor
 from abc import abstractmethod
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 
 from lib.core import entities
@@ -60,6 +63,16 @@ class BaseClient(ABC):
     ) -> ServiceResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_paginate(
+        self,
+        url: str,
+        item_type: Any,
+        chunk_size: int = 2000,
+        query_params: Dict[str, Any] = None,
+    ) -> Iterator[Any]:
+        raise NotImplementedError
+
 
 class SuperannotateServiceProvider(ABC):
     def __init__(self, client: BaseClient):
@@ -232,6 +245,10 @@ class BaseItemService(SuperannotateServiceProvider):
     def list(self, condition: Condition = None) -> ItemListResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def iterate(self, condition: Condition = None) -> Iterator[entities.BaseItemEntity]:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, project: entities.ProjectEntity, item: entities.BaseItemEntity):
         raise NotImplementedError
@@ -245,6 +262,15 @@ class BaseItemService(SuperannotateServiceProvider):
     ) -> ServiceResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def map_by_names(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        names: List[str],
+    ) -> ServiceResponse:
+        raise NotImplementedError
+
     @abstractmethod
     def attach(
         self,
@@ -309,9 +335,22 @@ class BaseAnnotationService(SuperannotateServiceProvider):
         items: List[str],
         reporter: Reporter,
         callback: Callable = None,
+        parse_executor: Executor = None,
     ) -> List[dict]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_small_annotations(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        items: List[str],
+        reporter: Reporter,
+        callback: Callable = None,
+        parse_executor: Executor = None,
+    ) -> AsyncIterator[dict]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_big_annotation(
         self, project: entities.ProjectEntity, item: dict, reporter: Reporter
@@ -348,6 +387,7 @@ class BaseAnnotationService(SuperannotateServiceProvider):
         postfix: str,
         items: List[str] = None,
         callback: Callable = None,
+        parse_executor: Executor = None,
     ):
         raise NotImplementedError
 
@@ -605,5 +645,17 @@ class BaseServiceProvider:
         folder: entities.FolderEntity = None,
         query: str = None,
         subset_id: int = None,
+        prefetch: int = None,
     ) -> ServiceResponse:
         raise NotImplementedError
+
+    @abstractmethod
+    def iter_saqul_query(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity = None,
+        query: str = None,
+        subset_id: int = None,
+        prefetch: int = None,
+    ) -> Iterator[ServiceResponse]:
+        raise NotImplementedError
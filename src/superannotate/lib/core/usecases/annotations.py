@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import concurrent.futures
 import copy
 import io
@@ -6,6 +7,7 @@ import json
 import os
 import platform
 import re
+import threading
 import time
 import traceback
 from dataclasses import dataclass
@@ -13,8 +15,10 @@ from datetime import datetime
 from itertools import islice
 from pathlib import Path
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Set
@@ -37,10 +41,13 @@ from lib.core.entities import TeamEntity
 from lib.core.exceptions import AppException
 from lib.core.reporter import Reporter
 from lib.core.response import Response
+from lib.core.schema_compiler import compile_schema
 from lib.core.service_types import UploadAnnotationAuthData
 from lib.core.serviceproviders import BaseServiceProvider
 from lib.core.types import PriorityScore
+from lib.core.usecases.base import BaseInteractiveUseCase
 from lib.core.usecases.base import BaseReportableUseCase
+from lib.core.usecases.base import map_folders
 from lib.core.video_convertor import VideoFrameGenerator
 from pydantic import BaseModel
 from superannotate.logger import get_default_logger
@@ -219,9 +226,14 @@ async def upload_big_annotations(
 
 
 class UploadAnnotationsUseCase(BaseReportableUseCase):
-    CHUNK_SIZE = 500
     CHUNK_SIZE_MB = 10 * 1024 * 1024
     URI_THRESHOLD = 4 * 1024 - 120
+    VALIDATION_WORKERS = 4
+    VALIDATION_CHUNK_SIZE = 100
+    BIG_FILES_WORKERS = 3
+    SMALL_FILES_WORKERS = 3
+    BIG_FILES_QUEUE_SIZE = 32
+    SMALL_FILES_QUEUE_SIZE = 1000
 
     def __init__(
         self,
@@ -244,76 +256,106 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
         if self._project.type == constants.ProjectType.PIXEL.value:
             raise ValidationError("Unsupported project type.")
 
-    def _validate_json(self, json_data: dict) -> list:
-        use_case = ValidateAnnotationUseCase(
+    def _validate_annotations(self, annotations: List[dict]) -> List[list]:
+        use_case = ValidateAnnotationsUseCase(
             reporter=self.reporter,
             team_id=self._project.team_id,
             project_type=self._project.type.value,
-            annotation=json_data,
+            annotations=annotations,
             service_provider=self._service_provider,
         )
         return use_case.execute().data
 
-    def list_existing_items(self, item_names: List[str]) -> List[BaseItemEntity]:
-        existing_items = []
-        for i in range(0, len(item_names), self.CHUNK_SIZE):
-            items_to_check = item_names[i : i + self.CHUNK_SIZE]  # noqa: E203
-            response = self._service_provider.items.list_by_names(
-                project=self._project, folder=self._folder, names=items_to_check
-            )
-            existing_items.extend(response.data)
-        return existing_items
+    def get_existing_name_item_mapping(
+        self, item_names: List[str]
+    ) -> Dict[str, BaseItemEntity]:
+        response = self._service_provider.items.map_by_names(
+            project=self._project, folder=self._folder, names=item_names
+        )
+        if not response.ok:
+            raise AppException(response.error)
+        return response.data
+
+    def _prepare(
+        self, items_to_upload: List[ItemToUpload]
+    ) -> List[Optional[ItemToUpload]]:
+        """
+        Serializes the chunk of annotations and validates the ones uploaded
+        as small files in one batch.
+        The annotations that can't be serialized or are invalid are returned as None.
+        """
+        prepared = []
+        for item_to_upload in items_to_upload:
+            item_to_upload.file = io.StringIO()
+            try:
+                json.dump(item_to_upload.annotation_json, item_to_upload.file)
+            except (TypeError, ValueError):
+                logger.debug(traceback.format_exc())
+                prepared.append(None)
+                continue
+            item_to_upload.file_size = item_to_upload.file.tell()
+            item_to_upload.file.seek(0)
+            prepared.append(item_to_upload)
+        small_items = [
+            item for item in prepared if item and item.file_size <= BIG_FILE_THRESHOLD
+        ]
+        errors = self._validate_annotations(
+            [item.annotation_json for item in small_items]
+        )
+        invalid_items = {
+            id(item) for item, item_errors in zip(small_items, errors) if item_errors
+        }
+        return [None if id(item) in invalid_items else item for item in prepared]
+
+    def _fail(self, item_to_upload: ItemToUpload):
+        self._report.failed_annotations.append(item_to_upload.item.name)
+        self.reporter.update_progress()
 
     async def distribute_queues(self, items_to_upload: List[ItemToUpload]):
-        data: List[List[ItemToUpload, bool]] = [[i, False] for i in items_to_upload]
-        items_count = len(items_to_upload)
-        processed_count = 0
-        while processed_count < items_count:
-            for idx, (item_to_upload, processed) in enumerate(data):
-                if not processed:
-                    try:
-                        item_to_upload.file = io.StringIO()
-                        json.dump(item_to_upload.annotation_json, item_to_upload.file)
-                        item_to_upload.file.seek(0, os.SEEK_END)
-                        item_to_upload.file_size = item_to_upload.file.tell()
-                        item_to_upload.file.seek(0)
-                        while True:
-                            if item_to_upload.file_size > BIG_FILE_THRESHOLD:
-                                if self._big_files_queue.qsize() > 32:
-                                    await asyncio.sleep(3)
-                                    continue
-                                self._big_files_queue.put_nowait(item_to_upload)
-                                break
-                            else:
-                                errors = self._validate_json(
-                                    item_to_upload.annotation_json
-                                )
-                                if errors:
-                                    self._report.failed_annotations.append(
-                                        item_to_upload.annotation_json["metadata"][
-                                            "name"
-                                        ]
-                                    )
-                                    break
-                                self._small_files_queue.put_nowait(item_to_upload)
-                                break
-                    except Exception:
-                        logger.debug(traceback.format_exc())
-                        self._report.failed_annotations.append(
-                            item_to_upload.annotation_json["metadata"]["name"]
+        """
+        Serializes and validates the chunks of annotations on a thread pool
+        and distributes them to the bounded upload queues in the given order.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = (
+            items_to_upload[i : i + self.VALIDATION_CHUNK_SIZE]  # noqa: E203
+            for i in range(0, len(items_to_upload), self.VALIDATION_CHUNK_SIZE)
+        )
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.VALIDATION_WORKERS
+        ) as executor:
+            pending = collections.deque(
+                (chunk, loop.run_in_executor(executor, self._prepare, chunk))
+                for chunk in islice(chunks, self.VALIDATION_WORKERS * 2)
+            )
+            while pending:
+                chunk, future = pending.popleft()
+                for next_chunk in islice(chunks, 1):
+                    pending.append(
+                        (
+                            next_chunk,
+                            loop.run_in_executor(executor, self._prepare, next_chunk),
                         )
-                        self.reporter.update_progress()
-                        data[idx][1] = True  # noqa
-                        processed_count += 1
-                    data[idx][1] = True  # noqa
-                    processed_count += 1
-        self._big_files_queue.put_nowait(None)
-        self._small_files_queue.put_nowait(None)
+                    )
+                try:
+                    prepared_chunk = await future
+                except Exception:
+                    logger.debug(traceback.format_exc())
+                    prepared_chunk = [None] * len(chunk)
+                for item_to_upload, prepared in zip(chunk, prepared_chunk):
+                    if not prepared:
+                        self._fail(item_to_upload)
+                    elif prepared.file_size > BIG_FILE_THRESHOLD:
+                        await self._big_files_queue.put(prepared)
+                    else:
+                        await self._small_files_queue.put(prepared)
+        await self._big_files_queue.put(None)
+        await self._small_files_queue.put(None)
 
     async def run_workers(self, items_to_upload: List[ItemToUpload]):
         self._big_files_queue, self._small_files_queue = (
-            asyncio.Queue(),
-            asyncio.Queue(),
+            asyncio.Queue(maxsize=self.BIG_FILES_QUEUE_SIZE),
+            asyncio.Queue(maxsize=self.SMALL_FILES_QUEUE_SIZE),
         )
         await asyncio.gather(
             self.distribute_queues(items_to_upload),
@@ -326,18 +368,19 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
                     report=self._report,
                     reporter=self.reporter,
                 )
-                for _ in range(3)
+                for _ in range(self.BIG_FILES_WORKERS)
+            ],
+            *[
+                upload_small_annotations(
+                    project=self._project,
+                    folder=self._folder,
+                    queue=self._small_files_queue,
+                    service_provider=self._service_provider,
+                    reporter=self.reporter,
+                    report=self._report,
+                )
+                for _ in range(self.SMALL_FILES_WORKERS)
             ],
-        )
-        await asyncio.gather(
-            upload_small_annotations(
-                project=self._project,
-                folder=self._folder,
-                queue=self._small_files_queue,
-                service_provider=self._service_provider,
-                reporter=self.reporter,
-                report=self._report,
-            )
         )
 
     def execute(self):
@@ -354,9 +397,10 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
                 f"Uploading {len(name_annotation_map)}/{len(self._annotations)} "
                 f"annotations to the project {self._project.name}."
             )
-            existing_items = self.list_existing_items(list(name_annotation_map.keys()))
-            name_item_map = {i.name: i for i in existing_items}
-            len_existing, len_provided = len(existing_items), len(name_annotation_map)
+            name_item_map = self.get_existing_name_item_mapping(
+                list(name_annotation_map.keys())
+            )
+            len_existing, len_provided = len(name_item_map), len(name_annotation_map)
             if len_existing < len_provided:
                 logger.warning(
                     f"Couldn't find {len_provided - len_existing}/{len_provided} "
@@ -408,13 +452,13 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
 
 class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
     MAX_WORKERS = 16
-    CHUNK_SIZE = 100
     CHUNK_SIZE_PATHS = 500
     CHUNK_SIZE_MB = 10 * 1024 * 1024
     STATUS_CHANGE_CHUNK_SIZE = 100
     AUTH_DATA_CHUNK_SIZE = 500
     THREADS_COUNT = 4
     URI_THRESHOLD = 4 * 1024 - 120
+    VALIDATION_CHUNK_SIZE = 100
 
     def __init__(
         self,
@@ -502,18 +546,17 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
         file.seek(0)
         return file
 
-    def prepare_annotation(self, annotation: dict, size) -> dict:
-        errors = None
-        if size < BIG_FILE_THRESHOLD:
-            use_case = ValidateAnnotationUseCase(
-                reporter=self.reporter,
-                team_id=self._project.team_id,
-                project_type=self._project.type.value,
-                annotation=annotation,
-                service_provider=self._service_provider,
-            )
-            errors = use_case.execute().data
+    def _validate_annotations(self, annotations: List[dict]) -> List[list]:
+        use_case = ValidateAnnotationsUseCase(
+            reporter=self.reporter,
+            team_id=self._project.team_id,
+            project_type=self._project.type.value,
+            annotations=annotations,
+            service_provider=self._service_provider,
+        )
+        return use_case.execute().data
 
+    def prepare_annotation(self, annotation: dict, errors: list = None) -> dict:
         if errors:
             logger.debug("Invalid json data")
             logger.debug("\n".join(["-".join(i) for i in errors]))
@@ -547,7 +590,6 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
         file.seek(0)
         size = file.getbuffer().nbytes
         annotation = json.load(file)
-        annotation = self.prepare_annotation(annotation, size)
         if not annotation:
             self.reporter.store_message("invalid_jsons", path)
             raise AppException("Invalid json")
@@ -570,16 +612,14 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
     def get_existing_name_item_mapping(
         self, name_path_mappings: Dict[str, str]
     ) -> dict:
-        item_names = list(name_path_mappings.keys())
-        existing_name_item_mapping = {}
-        for i in range(0, len(item_names), self.CHUNK_SIZE):
-            items_to_check = item_names[i : i + self.CHUNK_SIZE]  # noqa: E203
-            response = self._service_provider.items.list_by_names(
-                project=self._project, folder=self._folder, names=items_to_check
-            )
-            if response.ok:
-                existing_name_item_mapping.update({i.name: i for i in response.data})
-        return existing_name_item_mapping
+        response = self._service_provider.items.map_by_names(
+            project=self._project,
+            folder=self._folder,
+            names=list(name_path_mappings.keys()),
+        )
+        if response.ok:
+            return response.data
+        return {}
 
     @property
     def annotation_upload_data(self) -> UploadAnnotationAuthData:
@@ -629,39 +669,65 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
                 Body=item_data.mask,
             )
 
+    def _fail(self, item_to_upload: ItemToUpload):
+        self._report.failed_annotations.append(item_to_upload.item.name)
+        self.reporter.update_progress()
+
     async def distribute_queues(self, items_to_upload: List[ItemToUpload]):
-        data: List[List[Any, bool]] = [[i, False] for i in items_to_upload]
-        processed_count = 0
-        while processed_count < len(data):
-            for idx, (item_to_upload, processed) in enumerate(data):
-                if not processed:
-                    try:
-                        (
-                            annotation,
-                            item_to_upload.mask,
-                            item_to_upload.file_size,
-                        ) = await self.get_annotation(item_to_upload.path)
-                        item_to_upload.file = io.StringIO()
-                        json.dump(annotation, item_to_upload.file)
-                        item_to_upload.file.seek(0)
-                        while True:
-                            if item_to_upload.file_size > BIG_FILE_THRESHOLD:
-                                if self._big_files_queue.qsize() > 32:
-                                    await asyncio.sleep(3)
-                                    continue
-                                self._big_files_queue.put_nowait(item_to_upload)
-                                break
-                            else:
-                                self._small_files_queue.put_nowait(item_to_upload)
-                                break
-                    except Exception:
-                        logger.debug(traceback.format_exc())
-                        self._report.failed_annotations.append(item_to_upload.item.name)
-                        self.reporter.update_progress()
-                        data[idx][1] = True
-                        processed_count += 1
-                    data[idx][1] = True
-                    processed_count += 1
+        for i in range(0, len(items_to_upload), self.VALIDATION_CHUNK_SIZE):
+            chunk = []
+            for item_to_upload in items_to_upload[
+                i : i + self.VALIDATION_CHUNK_SIZE  # noqa: E203
+            ]:
+                try:
+                    (
+                        annotation,
+                        item_to_upload.mask,
+                        item_to_upload.file_size,
+                    ) = await self.get_annotation(item_to_upload.path)
+                    chunk.append((item_to_upload, annotation))
+                except Exception:
+                    logger.debug(traceback.format_exc())
+                    self._fail(item_to_upload)
+            # the small annotations of the chunk are validated in one batch
+            small_annotations = [
+                annotation
+                for item_to_upload, annotation in chunk
+                if item_to_upload.file_size < BIG_FILE_THRESHOLD
+            ]
+            try:
+                errors = dict(
+                    zip(
+                        map(id, small_annotations),
+                        self._validate_annotations(small_annotations),
+                    )
+                )
+            except Exception:
+                logger.debug(traceback.format_exc())
+                for item_to_upload, _ in chunk:
+                    self._fail(item_to_upload)
+                continue
+            for item_to_upload, annotation in chunk:
+                try:
+                    annotation = self.prepare_annotation(
+                        annotation, errors.get(id(annotation))
+                    )
+                    item_to_upload.file = io.StringIO()
+                    json.dump(annotation, item_to_upload.file)
+                    item_to_upload.file.seek(0)
+                    while True:
+                        if item_to_upload.file_size > BIG_FILE_THRESHOLD:
+                            if self._big_files_queue.qsize() > 32:
+                                await asyncio.sleep(3)
+                                continue
+                            self._big_files_queue.put_nowait(item_to_upload)
+                            break
+                        else:
+                            self._small_files_queue.put_nowait(item_to_upload)
+                            break
+                except Exception:
+                    logger.debug(traceback.format_exc())
+                    self._fail(item_to_upload)
         self._big_files_queue.put_nowait(None)
         self._small_files_queue.put_nowait(None)
 
@@ -989,6 +1055,9 @@ class UploadAnnotationUseCase(BaseReportableUseCase):
 
 
 class GetAnnotations(BaseReportableUseCase):
+    # threads parsing the large streamed frames off the event loop
+    PARSE_WORKERS = 2
+
     def __init__(
         self,
         reporter: Reporter,
@@ -1006,6 +1075,7 @@ class GetAnnotations(BaseReportableUseCase):
         self._show_process = show_process
         self._item_names_provided = True
         self._big_annotations_queue = None
+        self._parse_executor = None
 
     def validate_project_type(self):
         if self._project.type == constants.ProjectType.PIXEL.value:
@@ -1069,6 +1139,7 @@ class GetAnnotations(BaseReportableUseCase):
             folder=self._folder,
             items=item_names,
             reporter=self.reporter,
+            parse_executor=self._parse_executor,
         )
 
     async def distribute_to_queue(self, big_annotations):
@@ -1107,9 +1178,12 @@ class GetAnnotations(BaseReportableUseCase):
             )
             small_annotations = [x["name"] for x in items["small"]]
             try:
-                annotations = asyncio.run(
-                    self.run_workers(items["large"], small_annotations)
-                )
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.PARSE_WORKERS
+                ) as self._parse_executor:
+                    annotations = asyncio.run(
+                        self.run_workers(items["large"], small_annotations)
+                    )
             except Exception as e:
                 self.reporter.log_error(str(e))
                 self._response.errors = AppException("Can't get annotations.")
@@ -1124,6 +1198,104 @@ class GetAnnotations(BaseReportableUseCase):
         return self._response
 
 
+class IterAnnotations(GetAnnotations, BaseInteractiveUseCase):
+    """
+    Yields annotations as they arrive instead of collecting them into a list.
+    The stream is read only when the next annotation is requested,
+    so memory is bounded by batch_size rather than by the number of items.
+    Annotations are yielded in arrival order.
+    """
+
+    BIG_ANNOTATIONS_WINDOW = 3
+
+    def __init__(
+        self,
+        reporter: Reporter,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        item_names: Optional[List[str]],
+        service_provider: BaseServiceProvider,
+        batch_size: int = 1000,
+        show_process: bool = True,
+    ):
+        super().__init__(
+            reporter, project, folder, item_names, service_provider, show_process
+        )
+        self._batch_size = batch_size
+
+    def validate_batch_size(self):
+        if self._batch_size < 1:
+            raise AppException("The batch_size should be a positive number.")
+
+    async def _iterate(self) -> AsyncIterator[dict]:
+        annotations = self._service_provider.annotations
+        for i in range(0, len(self._item_names), self._batch_size):
+            items = annotations.sort_items_by_size(
+                project=self._project,
+                folder=self._folder,
+                item_names=self._item_names[i : i + self._batch_size],  # noqa
+            )
+            if items["small"]:
+                async for annotation in annotations.iter_small_annotations(
+                    project=self._project,
+                    folder=self._folder,
+                    items=[x["name"] for x in items["small"]],
+                    reporter=self.reporter,
+                    parse_executor=self._parse_executor,
+                ):
+                    yield annotation
+            large_items = items["large"]
+            for j in range(0, len(large_items), self.BIG_ANNOTATIONS_WINDOW):
+                for annotation in await asyncio.gather(
+                    *[
+                        annotations.get_big_annotation(
+                            project=self._project, item=item, reporter=self.reporter
+                        )
+                        for item in large_items[j : j + self.BIG_ANNOTATIONS_WINDOW]
+                    ]
+                ):
+                    yield annotation
+
+    @staticmethod
+    async def _next(iterator: AsyncIterator[dict]) -> Optional[dict]:
+        try:
+            return await iterator.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def execute(self) -> Iterator[dict]:
+        if not self.is_valid():
+            return
+        items_count = len(self._item_names)
+        if not items_count:
+            self.reporter.log_info("No annotations to download.")
+            return
+        self.reporter.log_info(
+            f"Getting {items_count} annotations from "
+            f"{self._project.name}{f'/{self._folder.name}' if self._folder.name != 'root' else ''}."
+        )
+        self.reporter.start_progress(items_count, disable=not self._show_process)
+        loop = asyncio.new_event_loop()
+        self._parse_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.PARSE_WORKERS
+        )
+        iterator = self._iterate()
+        try:
+            while True:
+                annotation = loop.run_until_complete(self._next(iterator))
+                if annotation is None:
+                    break
+                yield annotation
+        except Exception as e:
+            self.reporter.log_error(str(e))
+            self._response.errors = AppException("Can't get annotations.")
+        finally:
+            loop.run_until_complete(iterator.aclose())
+            loop.close()
+            self._parse_executor.shutdown()
+            self.reporter.finish_progress()
+
+
 class GetVideoAnnotationsPerFrame(BaseReportableUseCase):
     def __init__(
         self,
@@ -1271,6 +1443,9 @@ class UploadPriorityScoresUseCase(BaseReportableUseCase):
 
 
 class DownloadAnnotations(BaseReportableUseCase):
+    # threads parsing the large streamed frames off the event loops
+    PARSE_WORKERS = 2
+
     def __init__(
         self,
         reporter: Reporter,
@@ -1292,6 +1467,7 @@ class DownloadAnnotations(BaseReportableUseCase):
         self._callback = callback
         self._big_file_queues = []
         self._small_file_queues = []
+        self._parse_executor = None
 
     def validate_item_names(self):
         if self._item_names:
@@ -1398,6 +1574,7 @@ class DownloadAnnotations(BaseReportableUseCase):
             download_path=f"{export_path}{'/' + self._folder.name if not self._folder.is_root else ''}",
             postfix=postfix,
             callback=self._callback,
+            parse_executor=self._parse_executor,
         )
 
     async def distribute_to_queues(
@@ -1440,6 +1617,14 @@ class DownloadAnnotations(BaseReportableUseCase):
         except Exception as e:
             self.reporter.log_error(f"Error {str(e)}")
 
+    def _get_item_names(self, folder: FolderEntity) -> List[str]:
+        if self._item_names:
+            return self._item_names
+        condition = Condition("project_id", self._project.id, EQ) & Condition(
+            "folder_id", folder.id, EQ
+        )
+        return [item.name for item in self._service_provider.items.iterate(condition)]
+
     def execute(self):
         if self.is_valid():
             export_path = str(
@@ -1460,21 +1645,16 @@ class DownloadAnnotations(BaseReportableUseCase):
                 ).data
             if not folders:
                 folders.append(self._folder)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.PARSE_WORKERS
+            ) as self._parse_executor, concurrent.futures.ThreadPoolExecutor(
+                max_workers=5
+            ) as executor:
                 futures = []
-                for folder in folders:
-                    if not self._item_names:
-                        condition = Condition(
-                            "project_id", self._project.id, EQ
-                        ) & Condition("folder_id", folder.id, EQ)
-                        item_names = [
-                            item.name
-                            for item in self._service_provider.items.list(
-                                condition
-                            ).data
-                        ]
-                    else:
-                        item_names = self._item_names
+                # downloads of a folder start while the next folders are listed
+                for item_names, folder in zip(
+                    map_folders(self._get_item_names, folders), folders
+                ):
                     new_export_path = export_path
                     if not folder.is_root and self._folder.is_root:
                         new_export_path += f"/{folder.name}"
@@ -1503,6 +1683,7 @@ class DownloadAnnotations(BaseReportableUseCase):
 class ValidateAnnotationUseCase(BaseReportableUseCase):
     DEFAULT_VERSION = "V1.00"
     SCHEMAS: Dict[str, Draft7Validator] = {}
+    SCHEMAS_LOCK = threading.Lock()
     PATTERN_MAP = {
         "\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d:[0-5]\\d(?:\\.\\d{3})Z": "does not match YYYY-MM-DDTHH:MM:SS.fffZ",
         "^(?=.{1,254}$)(?=.{1,64}@)[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+(?:\\.[a-zA-Z0-9!#$%&'*+/=?^_`{|}~-]+)*@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$": "invalid email",
@@ -1656,8 +1837,24 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
                     real_path.append(item)
         return real_path
 
-    def _get_validator(self, version: str) -> Draft7Validator:
+    def _get_validator(
+        self, version: str
+    ) -> Tuple[Optional[Draft7Validator], Optional[Callable[[Any], bool]]]:
+        """
+        Returns the validator of the schema and its compiled fast path.
+        The fast path is None if the schema can't be compiled.
+        """
         key = f"{self._project_type}__{version}"
+        validator = ValidateAnnotationUseCase.SCHEMAS.get(key)
+        if validator:
+            return validator
+        # annotations are validated concurrently, fetch each schema only once
+        with ValidateAnnotationUseCase.SCHEMAS_LOCK:
+            return self._load_validator(key, version)
+
+    def _load_validator(
+        self, key: str, version: str
+    ) -> Tuple[Optional[Draft7Validator], Optional[Callable[[Any], bool]]]:
         validator = ValidateAnnotationUseCase.SCHEMAS.get(key)
         if not validator:
             schema_response = self._service_provider.annotations.get_schema(
@@ -1666,7 +1863,7 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
             if not schema_response.ok:
                 raise AppException(f"Schema {version} does not exist.")
             if not schema_response.data:
-                ValidateAnnotationUseCase.SCHEMAS[key] = lambda x: x
+                ValidateAnnotationUseCase.SCHEMAS[key] = None, None
                 return ValidateAnnotationUseCase.SCHEMAS[key]
             validator = jsonschema.Draft7Validator(schema_response.data)
             from functools import partial
@@ -1675,7 +1872,10 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
             validator.iter_errors = iter_errors
             validator.VALIDATORS["oneOf"] = self.oneOf
             validator.VALIDATORS["pattern"] = self._pattern
-            ValidateAnnotationUseCase.SCHEMAS[key] = validator
+            is_valid = compile_schema(
+                schema_response.data, discriminator=self._get_const
+            )
+            validator = ValidateAnnotationUseCase.SCHEMAS[key] = validator, is_valid
         return validator
 
     def extract_messages(self, path, error, report):
@@ -1696,14 +1896,23 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
                     )
                 )
 
-    def execute(self) -> Response:
+    def _get_errors(self, annotation: dict) -> List[Tuple[str, str]]:
         try:
-            version = self._annotation["version"]
+            version = annotation["version"]
         except KeyError:
             version = self.DEFAULT_VERSION
+        validator, is_valid = self._get_validator(version)
+        if not validator:
+            return []
+        if is_valid:
+            try:
+                if is_valid(annotation):
+                    return []
+            except Exception:
+                logger.debug(traceback.format_exc())
+        # the full validation is needed only to collect the error messages
         extract_path = ValidateAnnotationUseCase.extract_path
-        validator = self._get_validator(version)
-        errors = sorted(validator.iter_errors(self._annotation), key=lambda e: e.path)
+        errors = sorted(validator.iter_errors(annotation), key=lambda e: e.path)
         errors_report: Set[Tuple[str, str]] = set()
         if errors:
             for error in errors:
@@ -1713,6 +1922,36 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
                 if not error.context:
                     errors_report.add(("".join(real_path), error.message))
                 self.extract_messages(real_path, error, errors_report)
+        return list(sorted(errors_report, key=lambda x: x[0]))
 
-        self._response.data = list(sorted(errors_report, key=lambda x: x[0]))
+    def execute(self) -> Response:
+        self._response.data = self._get_errors(self._annotation)
+        return self._response
+
+
+class ValidateAnnotationsUseCase(ValidateAnnotationUseCase):
+    """
+    Validates a batch of annotations of the same project type,
+    the response data holds the errors of each annotation in the given order.
+    """
+
+    def __init__(
+        self,
+        reporter: Reporter,
+        team_id: int,
+        project_type: int,
+        annotations: List[dict],
+        service_provider: BaseServiceProvider,
+    ):
+        super().__init__(
+            reporter=reporter,
+            team_id=team_id,
+            project_type=project_type,
+            annotation={},
+            service_provider=service_provider,
+        )
+        self._annotations = annotations
+
+    def execute(self) -> Response:
+        self._response.data = [self._get_errors(i) for i in self._annotations]
         return self._response
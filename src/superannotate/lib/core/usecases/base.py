@@ -1,7 +1,13 @@
+import concurrent.futures
+import multiprocessing
+import os
+import sys
 from abc import ABC
 from abc import ABCMeta
 from abc import abstractmethod
+from typing import Callable
 from typing import Iterable
+from typing import Iterator
 from typing import List
 
 from lib.core.exceptions import AppValidationException
@@ -9,6 +15,42 @@ from lib.core.reporter import Reporter
 from lib.core.response import Response
 
 
+def get_process_executor(max_workers: int = None) -> concurrent.futures.Executor:
+    """
+    Returns a process pool where fork is available.
+    Elsewhere spawning would re-import the caller's script, so threads are used.
+    """
+    if sys.platform != "darwin" and "fork" in multiprocessing.get_all_start_methods():
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+        # fork the workers before the caller starts its threads
+        executor.submit(int).result()
+        return executor
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+
+FOLDER_WORKERS = 8
+
+
+def map_folders(func: Callable, folders: Iterable, max_workers: int = None) -> Iterator:
+    """
+    Calls func for each folder on a thread pool and yields the results in the folders order.
+    The pool size defaults to the SA_FOLDER_WORKERS environment variable.
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get("SA_FOLDER_WORKERS", FOLDER_WORKERS))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, folder) for folder in folders]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
 class BaseUseCase(ABC):
     def __init__(self):
         self._response = Response()
@@ -4,17 +4,18 @@ import io
 import json
 import os.path
 import random
-import tempfile
+import threading
 import time
 import uuid
 from collections import defaultdict
 from collections import namedtuple
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Dict
 from typing import List
 from typing import Optional
 
 import boto3
-import cv2
 import lib.core as constances
 import numpy as np
 import requests
@@ -32,8 +33,8 @@ from lib.core.enums import ProjectType
 from lib.core.exceptions import AppException
 from lib.core.exceptions import AppValidationException
 from lib.core.exceptions import ImageProcessingException
-from lib.core.plugin import ImagePlugin
-from lib.core.plugin import VideoPlugin
+from lib.core.label_map import LabelMap
+from lib.core.label_map import pack_color
 from lib.core.reporter import Progress
 from lib.core.reporter import Reporter
 from lib.core.repositories import BaseManageableRepository
@@ -44,6 +45,7 @@ from lib.core.types import AttachmentMeta
 from lib.core.usecases.base import BaseInteractiveUseCase
 from lib.core.usecases.base import BaseReportableUseCase
 from lib.core.usecases.base import BaseUseCase
+from lib.core.usecases.base import get_process_executor
 from PIL import UnidentifiedImageError
 from superannotate.logger import get_default_logger
 
@@ -122,20 +124,20 @@ class AttachFileUrlsUseCase(BaseUseCase):
         return self._upload_state_code
 
     def execute(self):
-        response = self._service_provider.items.list_by_names(
+        response = self._service_provider.items.map_by_names(
             project=self._project,
             folder=self._folder,
             names=[image.name for image in self._attachments],
         )
         if not response.ok:
             raise AppException(response.error)
-        duplications = [image.name for image in response.data]
+        duplications = list(response.data)
         meta = {}
         to_upload = []
         for image in self._attachments:
             if not image.name:
                 image.name = str(uuid.uuid4())
-            if image.name not in duplications:
+            if image.name not in response.data:
                 to_upload.append(Attachment(**{"name": image.name, "path": image.path}))
                 meta[image.name] = AttachmentMeta(
                     **{
@@ -445,6 +447,9 @@ class CreateFuseImageUseCase(BaseUseCase):
         return self._annotation_mask_path
 
     def execute(self):
+        import cv2
+        from lib.core.plugin import ImagePlugin
+
         with open(self._image_path, "rb") as file:
             class_color_map = {}
             Image = namedtuple("Image", ["type", "path", "content"])
@@ -547,6 +552,8 @@ class CreateFuseImageUseCase(BaseUseCase):
                 )
                 weight, height = image.get_size()
                 empty_image_arr = np.full((height, weight, 4), [0, 0, 0, 255], np.uint8)
+                label_map = LabelMap(annotation_mask)
+                fuse_pixels = empty_image_arr.reshape(-1, 4)
                 for annotation in self.annotations["instances"]:
                     if (not annotation.get("className")) or (
                         not class_color_map.get(annotation["className"])
@@ -554,9 +561,10 @@ class CreateFuseImageUseCase(BaseUseCase):
                         continue
                     fill_color = *class_color_map[annotation["className"]], 255
                     for part in annotation["parts"]:
-                        part_color = *self.generate_color(part["color"]), 255
-                        temp_mask = np.alltrue(annotation_mask == part_color, axis=2)
-                        empty_image_arr[temp_mask] = fill_color
+                        part_color = pack_color(
+                            (*self.generate_color(part["color"]), 255)
+                        )
+                        fuse_pixels[label_map.get_pixels(part_color)] = fill_color
 
                 images = [
                     Image(
@@ -850,7 +858,9 @@ class UploadImageToProject(BaseUseCase):
 
 class UploadImagesToProject(BaseInteractiveUseCase):
     MAX_WORKERS = 10
-    LIST_NAME_CHUNK_SIZE = 500
+    PROCESSING_WORKERS = min(8, os.cpu_count() or 1)
+    # fewer images are processed in the upload threads, forking would cost more
+    PARALLEL_IMAGES_COUNT = 50
 
     def __init__(
         self,
@@ -865,6 +875,8 @@ class UploadImagesToProject(BaseInteractiveUseCase):
         exclude_file_patterns: List[str] = constances.DEFAULT_FILE_EXCLUDE_PATTERNS,
         recursive_sub_folders: bool = False,
         image_quality_in_editor=None,
+        images: Dict[str, io.BytesIO] = None,
+        processing_executor: concurrent.futures.Executor = None,
     ):
         super().__init__()
 
@@ -886,6 +898,9 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             )
         self._exclude_file_patterns = exclude_file_patterns
         self._annotation_status = annotation_status
+        self._lock = threading.Lock()
+        self._images = images
+        self._processing_executor = processing_executor
 
     @property
     def extensions(self):
@@ -943,31 +958,41 @@ class UploadImagesToProject(BaseInteractiveUseCase):
 
     @property
     def auth_data(self):
-        if not self._auth_data:
-            response = self._service_provider.get_s3_upload_auth_token(
-                project=self._project, folder=self._folder
-            )
-            if not response.ok:
-                raise AppException(response.error)
-            self._auth_data = response.data
+        with self._lock:
+            if not self._auth_data:
+                response = self._service_provider.get_s3_upload_auth_token(
+                    project=self._project, folder=self._folder
+                )
+                if not response.ok:
+                    raise AppException(response.error)
+                self._auth_data = response.data
         return self._auth_data
 
     @property
     def s3_repository(self):
-        if not self._s3_repo_instance:
-            self._s3_repo_instance = self._s3_repo(
-                self.auth_data["accessKeyId"],
-                self.auth_data["secretAccessKey"],
-                self.auth_data["sessionToken"],
-                self.auth_data["bucket"],
-            )
+        auth_data = self.auth_data
+        with self._lock:
+            if not self._s3_repo_instance:
+                self._s3_repo_instance = self._s3_repo(
+                    auth_data["accessKeyId"],
+                    auth_data["secretAccessKey"],
+                    auth_data["sessionToken"],
+                    auth_data["bucket"],
+                )
         return self._s3_repo_instance
 
-    def _upload_image(self, image_path: str):
+    def _upload_image(
+        self,
+        image_path: str,
+        image_quality: int,
+        processing_executor: concurrent.futures.Executor = None,
+    ):
         ProcessedImage = namedtuple(
             "ProcessedImage", ["uploaded", "path", "entity", "name"]
         )
-        if self._from_s3_bucket:
+        if self._images is not None:
+            image_bytes = self._images[image_path]
+        elif self._from_s3_bucket:
             response = GetS3ImageUseCase(
                 s3_bucket=self._from_s3_bucket, image_path=image_path
             ).execute()
@@ -999,7 +1024,8 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             s3_repo=self.s3_repository,
             upload_path=self.auth_data["filePath"],
             service_provider=self._service_provider,
-            image_quality_in_editor=self._image_quality_in_editor,
+            image_quality=image_quality,
+            processing_executor=processing_executor,
         ).execute()
 
         if not upload_response.errors and upload_response.data:
@@ -1015,6 +1041,12 @@ class UploadImagesToProject(BaseInteractiveUseCase):
                 uploaded=False, path=image_path, entity=None, name=Path(image_path).name
             )
 
+    @classmethod
+    def get_processing_executor(cls) -> concurrent.futures.Executor:
+        # the derivatives are generated in forked processes, as resizing
+        # and encoding in the upload threads would be serialized by the GIL
+        return get_process_executor(max_workers=cls.PROCESSING_WORKERS)
+
     def filter_paths(self, paths: List[str]):
         paths = [
             path
@@ -1025,7 +1057,6 @@ class UploadImagesToProject(BaseInteractiveUseCase):
         for path in paths:
             name_path_map[Path(path).name].append(path)
 
-        CHUNK_SIZE = UploadImagesToProject.LIST_NAME_CHUNK_SIZE
         filtered_paths = []
         duplicated_paths = []
         for file_name in name_path_map:
@@ -1033,25 +1064,17 @@ class UploadImagesToProject(BaseInteractiveUseCase):
                 duplicated_paths.append(name_path_map[file_name][1:])
             filtered_paths.append(name_path_map[file_name][0])
 
-        image_list = []
-        for i in range(0, len(filtered_paths), CHUNK_SIZE):
-            response = self._service_provider.items.list_by_names(
-                project=self._project,
-                folder=self._folder,
-                names=[
-                    image.split("/")[-1] for image in filtered_paths[i : i + CHUNK_SIZE]
-                ],
-            )
-
-            if not response.ok:
-                raise AppException(response.error)
-            image_list.extend([image.name for image in response.data])
-
-        image_list = set(image_list)
+        response = self._service_provider.items.map_by_names(
+            project=self._project,
+            folder=self._folder,
+            names=[image.split("/")[-1] for image in filtered_paths],
+        )
+        if not response.ok:
+            raise AppException(response.error)
         images_to_upload = []
 
         for path in filtered_paths:
-            if Path(path).name not in image_list:
+            if Path(path).name not in response.data:
                 images_to_upload.append(path)
             else:
                 duplicated_paths.append(path)
@@ -1070,22 +1093,51 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             if not images_to_upload:
                 return self._response
 
+            # resolved before the workers start, so a settings error fails the upload
+            # before any image is pushed to S3 and left unattached
+            try:
+                image_quality = UploadImageS3UseCase.get_image_quality(
+                    self._service_provider,
+                    self._project,
+                    self._image_quality_in_editor,
+                )
+            except AppException as e:
+                logger.warning(f"Unable to upload images \n{e}")
+                failed_images = [Path(path).name for path in images_to_upload]
+                self._response.data = [], failed_images, duplications
+                return self._response
+
             uploaded_images = []
             failed_images = []
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.MAX_WORKERS
-            ) as executor:
-                results = [
-                    executor.submit(self._upload_image, image_path)
-                    for image_path in images_to_upload
-                ]
-                for future in concurrent.futures.as_completed(results):
-                    processed_image = future.result()
-                    if processed_image.uploaded and processed_image.entity:
-                        uploaded_images.append(processed_image)
-                    else:
-                        failed_images.append(processed_image.path)
-                    yield
+            # each upload thread holds a single image between the stages,
+            # so the number of images in memory is bounded by the pool size
+            upload_workers = max(self.MAX_WORKERS, 2 * self.PROCESSING_WORKERS)
+            if self._processing_executor:
+                processing_executor_context = nullcontext(self._processing_executor)
+            elif len(images_to_upload) >= self.PARALLEL_IMAGES_COUNT:
+                processing_executor_context = self.get_processing_executor()
+            else:
+                processing_executor_context = nullcontext()
+            with processing_executor_context as processing_executor:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=upload_workers
+                ) as executor:
+                    results = [
+                        executor.submit(
+                            self._upload_image,
+                            image_path,
+                            image_quality,
+                            processing_executor,
+                        )
+                        for image_path in images_to_upload
+                    ]
+                    for future in concurrent.futures.as_completed(results):
+                        processed_image = future.result()
+                        if processed_image.uploaded and processed_image.entity:
+                            uploaded_images.append(processed_image)
+                        else:
+                            failed_images.append(processed_image.path)
+                        yield
 
             uploaded = []
             for i in range(0, len(uploaded_images), 100):
@@ -1199,6 +1251,8 @@ class UploadImageS3UseCase(BaseUseCase):
         upload_path: str,
         service_provider: BaseServiceProvider,
         image_quality_in_editor: str = None,
+        image_quality: int = None,
+        processing_executor: concurrent.futures.Executor = None,
     ):
         super().__init__()
         self._project = project
@@ -1208,6 +1262,8 @@ class UploadImageS3UseCase(BaseUseCase):
         self._upload_path = upload_path
         self._service_provider = service_provider
         self._image_quality_in_editor = image_quality_in_editor
+        self._image_quality = image_quality
+        self._processing_executor = processing_executor
 
     @property
     def max_resolution(self) -> int:
@@ -1215,51 +1271,52 @@ class UploadImageS3UseCase(BaseUseCase):
             return constances.MAX_PIXEL_RESOLUTION
         return constances.MAX_VECTOR_RESOLUTION
 
+    @staticmethod
+    def get_image_quality(
+        service_provider: BaseServiceProvider,
+        project: ProjectEntity,
+        image_quality_in_editor: str = None,
+    ) -> int:
+        if image_quality_in_editor:
+            return ImageQuality.get_value(image_quality_in_editor)
+        response = service_provider.projects.list_settings(project)
+        if not response.ok:
+            raise AppException(response.error)
+        quality = ImageQuality.COMPRESSED.value
+        for setting in response.data:
+            if setting.attribute == "ImageQuality":
+                quality = setting.value
+        return quality
+
     def execute(self):
+        from lib.core.plugin import ImagePlugin
+
         image_name = Path(self._image_path).name
+        quality = self._image_quality
+        if quality is None:
+            try:
+                quality = self.get_image_quality(
+                    self._service_provider,
+                    self._project,
+                    self._image_quality_in_editor,
+                )
+            except AppException as e:
+                self._response.errors = e
+                return self._response
         try:
-            image_processor = ImagePlugin(self._image, self.max_resolution)
-            origin_width, origin_height = image_processor.get_size()
-            thumb_image, _, _ = image_processor.generate_thumb()
-            huge_image, huge_width, huge_height = image_processor.generate_huge()
-            quality = 60
-            if not self._image_quality_in_editor:
-                _response = self._service_provider.projects.list_settings(self._project)
-                if not _response.ok:
-                    self._response.errors = AppException(_response.error)
-                    return self._response
-                for setting in _response.data:
-                    if setting.attribute == "ImageQuality":
-                        quality = setting.value
-            else:
-                quality = ImageQuality.get_value(self._image_quality_in_editor)
-            if Path(image_name).suffix[1:].upper() in ("JPEG", "JPG"):
-                if quality == 100:
-                    self._image.seek(0)
-                    low_resolution_image = self._image
-                else:
-                    (
-                        low_resolution_image,
-                        _,
-                        _,
-                    ) = image_processor.generate_low_resolution(quality=quality)
+            self._image.seek(0)
+            args = (
+                self._image.read(),
+                image_name,
+                quality,
+                self.max_resolution,
+            )
+            if self._processing_executor:
+                derivatives = self._processing_executor.submit(
+                    ImagePlugin.generate_derivatives, *args
+                ).result()
             else:
-                if quality == 100:
-                    (
-                        low_resolution_image,
-                        _,
-                        _,
-                    ) = image_processor.generate_low_resolution(
-                        quality=quality, subsampling=0
-                    )
-                else:
-                    (
-                        low_resolution_image,
-                        _,
-                        _,
-                    ) = image_processor.generate_low_resolution(
-                        quality=quality, subsampling=-1
-                    )
+                derivatives = ImagePlugin.generate_derivatives(*args)
             image_key = (
                 self._upload_path + str(uuid.uuid4()) + Path(self._image_path).suffix
             )
@@ -1267,20 +1324,25 @@ class UploadImageS3UseCase(BaseUseCase):
             file_entity = S3FileEntity(uuid=image_key, data=self._image)
 
             thumb_image_name = image_key + "___thumb.jpg"
-            thumb_image_entity = S3FileEntity(uuid=thumb_image_name, data=thumb_image)
+            thumb_image_entity = S3FileEntity(
+                uuid=thumb_image_name, data=derivatives.thumb
+            )
             self._s3_repo.insert(thumb_image_entity)
 
             low_resolution_image_name = image_key + "___lores.jpg"
             low_resolution_file_entity = S3FileEntity(
-                uuid=low_resolution_image_name, data=low_resolution_image
+                uuid=low_resolution_image_name, data=derivatives.low_resolution
             )
             self._s3_repo.insert(low_resolution_file_entity)
 
             huge_image_name = image_key + "___huge.jpg"
             huge_file_entity = S3FileEntity(
                 uuid=huge_image_name,
-                data=huge_image,
-                metadata={"height": huge_width, "weight": huge_height},
+                data=derivatives.huge,
+                metadata={
+                    "height": derivatives.huge_width,
+                    "weight": derivatives.huge_height,
+                },
             )
             self._s3_repo.insert(huge_file_entity)
             file_entity.data.seek(0)
@@ -1288,7 +1350,7 @@ class UploadImageS3UseCase(BaseUseCase):
             self._response.data = ImageEntity(
                 name=image_name,
                 path=image_key,
-                meta=dict(width=origin_width, height=origin_height),
+                meta=dict(width=derivatives.width, height=derivatives.height),
             )
         except (ImageProcessingException, UnidentifiedImageError) as e:
             self._response.errors = e
@@ -1656,13 +1718,16 @@ class DeleteAnnotationClassUseCase(BaseUseCase):
 
 
 class ExtractFramesUseCase(BaseInteractiveUseCase):
+    # OpenCV releases the GIL while encoding, so threads scale with the cores
+    ENCODING_WORKERS = os.cpu_count() or 1
+
     def __init__(
         self,
         service_provider: BaseServiceProvider,
         project: ProjectEntity,
         folder: FolderEntity,
         video_path: str,
-        extract_path: str,
+        extract_path: Optional[str],
         start_time: float,
         end_time: float = None,
         target_fps: float = None,
@@ -1685,6 +1750,8 @@ class ExtractFramesUseCase(BaseInteractiveUseCase):
         self._limitation_response = None
 
     def validate_fps(self):
+        from lib.core.plugin import VideoPlugin
+
         fps = VideoPlugin.get_fps(self._video_path)
         if not self._target_fps:
             self._target_fps = fps
@@ -1745,16 +1812,22 @@ class ExtractFramesUseCase(BaseInteractiveUseCase):
             )
 
     def execute(self):
+        from lib.core.plugin import VideoPlugin
+
         if self.is_valid():
-            frames_generator = VideoPlugin.extract_frames(
-                video_path=self._video_path,
-                start_time=self._start_time,
-                end_time=self._end_time,
-                extract_path=self._extract_path,
-                limit=self.limit,
-                target_fps=self._target_fps,
-            )
-            yield from frames_generator
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.ENCODING_WORKERS
+            ) as executor:
+                frames_generator = VideoPlugin.extract_frames(
+                    video_path=self._video_path,
+                    start_time=self._start_time,
+                    end_time=self._end_time,
+                    extract_path=self._extract_path,
+                    limit=self.limit,
+                    target_fps=self._target_fps,
+                    executor=executor,
+                )
+                yield from frames_generator
 
 
 class UploadVideosAsImages(BaseReportableUseCase):
@@ -1834,24 +1907,18 @@ class UploadVideosAsImages(BaseReportableUseCase):
         self._paths = list(validated_paths)
 
     def execute(self) -> Response:
+        from lib.core.plugin import VideoPlugin
+
         if self.is_valid():
             data = []
-            for path in self._paths:
-                with tempfile.TemporaryDirectory() as temp_path:
-                    frame_names = VideoPlugin.get_extractable_frames(
-                        path, self._start_time, self._end_time, self._target_fps
-                    )
-                    duplicate_images = self._service_provider.items.list_by_names(
-                        project=self._project, folder=self._folder, names=frame_names
-                    ).data
-
-                    duplicate_images = [image.name for image in duplicate_images]
+            with UploadImagesToProject.get_processing_executor() as processing_executor:
+                for path in self._paths:
                     frames_generator_use_case = ExtractFramesUseCase(
                         service_provider=self._service_provider,
                         project=self._project,
                         folder=self._folder,
                         video_path=path,
-                        extract_path=temp_path,
+                        extract_path=None,
                         start_time=self._start_time,
                         end_time=self._end_time,
                         target_fps=self._target_fps,
@@ -1866,38 +1933,52 @@ class UploadVideosAsImages(BaseReportableUseCase):
 
                     frames_generator = frames_generator_use_case.execute()
 
-                    total_frames_count = len(frame_names)
-                    self.reporter.log_info(
-                        f"Video frame count is {total_frames_count}."
-                    )
-                    self.reporter.log_info(
-                        f"Extracted {total_frames_count} frames from video. Now uploading to platform.",
+                    # the frames are decoded once, the existing items are looked up
+                    # per extracted chunk, so the total is only an estimate
+                    estimated_frames_count = (
+                        VideoPlugin.estimate_extractable_frames_count(
+                            path, self._start_time, self._end_time, self._target_fps
+                        )
                     )
+                    if estimated_frames_count is not None:
+                        self.reporter.log_info(
+                            f"Video frame count is {estimated_frames_count}."
+                        )
                     self.reporter.log_info(
-                        f"Uploading {total_frames_count} images to project {str(self.upload_path)}."
+                        f"Extracting frames from video and uploading to project {str(self.upload_path)}."
                     )
-                    if len(duplicate_images):
-                        self.reporter.log_warning(
-                            f"{len(duplicate_images)} already existing images found that won't be uploaded."
-                        )
-                    if set(duplicate_images) == set(frame_names):
-                        continue
                     uploaded_paths = []
+                    extracted_frames_count = 0
+                    duplicates_count = 0
                     with Progress(
-                        total_frames_count, f"Uploading {Path(path).name}"
-                    ) as progress:
-                        for _ in frames_generator:
-                            use_case = UploadImagesFromFolderToProject(
+                        estimated_frames_count, f"Uploading {Path(path).name}"
+                    ) as progress, concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1
+                    ) as extractor:
+                        # the next chunk is extracted while the current one is uploaded
+                        next_frames = extractor.submit(next, frames_generator, None)
+                        while True:
+                            frames = next_frames.result()
+                            if frames is None:
+                                break
+                            next_frames = extractor.submit(next, frames_generator, None)
+                            extracted_frames_count += len(frames)
+                            use_case = UploadImagesToProject(
                                 project=self._project,
                                 folder=self._folder,
                                 service_provider=self._service_provider,
-                                folder_path=temp_path,
+                                paths=[name for name, _ in frames],
+                                images=dict(frames),
                                 s3_repo=self._s3_repo,
                                 annotation_status=self.annotation_status,
                                 image_quality_in_editor=self._image_quality_in_editor,
+                                processing_executor=processing_executor,
                             )
 
                             images_to_upload, duplicates = use_case.images_to_upload
+                            duplicates_count += len(duplicates)
+                            if duplicates:
+                                progress.update(len(duplicates))
                             if not len(images_to_upload):
                                 continue
                             if use_case.is_valid():
@@ -1910,12 +1991,15 @@ class UploadVideosAsImages(BaseReportableUseCase):
                                     self.reporter.log_warning(
                                         f"Failed {len(failed_images)}."
                                     )
-                                files = os.listdir(temp_path)
-                                image_paths = [f"{temp_path}/{f}" for f in files]
-                                for image_path in image_paths:
-                                    os.remove(image_path)
                             else:
                                 raise AppException(use_case.response.errors)
-                data.extend(uploaded_paths)
+                    self.reporter.log_info(
+                        f"Extracted {extracted_frames_count} frames from video."
+                    )
+                    if duplicates_count:
+                        self.reporter.log_warning(
+                            f"{duplicates_count} already existing images found that won't be uploaded."
+                        )
+                    data.extend(uploaded_paths)
             self._response.data = data
         return self._response
@@ -1,9 +1,11 @@
 import copy
+import itertools
 import traceback
 from collections import defaultdict
 from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
@@ -26,8 +28,10 @@ from lib.core.response import Response
 from lib.core.serviceproviders import BaseServiceProvider
 from lib.core.types import Attachment
 from lib.core.types import AttachmentMeta
+from lib.core.usecases.base import BaseInteractiveUseCase
 from lib.core.usecases.base import BaseReportableUseCase
 from lib.core.usecases.base import BaseUseCase
+from lib.core.usecases.base import map_folders
 from lib.core.usecases.folders import SearchFoldersUseCase
 from lib.infrastructure.utils import extract_project_folder
 from superannotate.logger import get_default_logger
@@ -134,6 +138,7 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
         service_provider: BaseServiceProvider,
         query: str,
         subset: str = None,
+        prefetch: int = None,
     ):
         super().__init__(reporter)
         self._project = project
@@ -141,6 +146,7 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
         self._service_provider = service_provider
         self._query = query
         self._subset = subset
+        self._prefetch = prefetch
 
     def validate_arguments(self):
         if self._query:
@@ -168,48 +174,79 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
                 "The folder name should be specified in the query string."
             )
 
+    def _get_query_kwargs(self) -> dict:
+        query_kwargs = {}
+        if self._prefetch:
+            query_kwargs["prefetch"] = self._prefetch
+        if self._subset:
+            subset: Optional[SubSetEntity] = None
+            response = self._service_provider.subsets.list(self._project)
+            if response.ok:
+                subset = next(
+                    (_sub for _sub in response.data if _sub.name == self._subset),
+                    None,
+                )
+            if not subset:
+                raise AppException(
+                    "Subset not found. Use the superannotate."
+                    "get_subsets() function to get a list of the available subsets."
+                )
+            query_kwargs["subset_id"] = subset.id
+        if self._query:
+            query_kwargs["query"] = self._query
+        query_kwargs["folder"] = None if self._folder.name == "root" else self._folder
+        return query_kwargs
+
+    def _serialize(self, item: dict) -> BaseItemEntity:
+        tmp_item = GetItem.serialize_entity(BaseItemEntity(**item), self._project)
+        folder_path = f"{'/' + item['folder_name'] if not item['is_root_folder'] else ''}"
+        tmp_item.path = f"{self._project.name}" + folder_path
+        return tmp_item
+
     def execute(self) -> Response:
         if self.is_valid():
-            query_kwargs = {}
-            if self._subset:
-                subset: Optional[SubSetEntity] = None
-                response = self._service_provider.subsets.list(self._project)
-                if response.ok:
-                    subset = next(
-                        (_sub for _sub in response.data if _sub.name == self._subset),
-                        None,
-                    )
-                if not subset:
-                    self._response.errors = AppException(
-                        "Subset not found. Use the superannotate."
-                        "get_subsets() function to get a list of the available subsets."
-                    )
-                    return self._response
-                query_kwargs["subset_id"] = subset.id
-            if self._query:
-                query_kwargs["query"] = self._query
-            query_kwargs["folder"] = (
-                None if self._folder.name == "root" else self._folder
-            )
+            try:
+                query_kwargs = self._get_query_kwargs()
+            except AppException as e:
+                self._response.errors = e
+                return self._response
             service_response = self._service_provider.saqul_query(
                 self._project,
                 **query_kwargs,
             )
             if service_response.ok:
-                data = []
-                for i, item in enumerate(service_response.data):
-                    tmp_item = GetItem.serialize_entity(
-                        BaseItemEntity(**item), self._project
-                    )
-                    folder_path = f"{'/' + item['folder_name'] if not item['is_root_folder'] else ''}"
-                    tmp_item.path = f"{self._project.name}" + folder_path
-                    data.append(tmp_item)
-                self._response.data = data
+                self._response.data = [
+                    self._serialize(item) for item in service_response.data
+                ]
             else:
-                self._response.errors = service_response.data
+                self._response.errors = AppException(service_response.error)
         return self._response
 
 
+class IterQueryEntitiesUseCase(QueryEntitiesUseCase, BaseInteractiveUseCase):
+    """
+    Yields the queried items page by page,
+    the next pages are requested while the current one is consumed.
+    """
+
+    def execute(self) -> Iterator[BaseItemEntity]:
+        if not self.is_valid():
+            return
+        try:
+            query_kwargs = self._get_query_kwargs()
+        except AppException as e:
+            self._response.errors = e
+            return
+        for response in self._service_provider.iter_saqul_query(
+            self._project, **query_kwargs
+        ):
+            if not response.ok:
+                self._response.errors = AppException(response.error)
+                return
+            for item in response.data:
+                yield self._serialize(item)
+
+
 class ListItems(BaseUseCase):
     def __init__(
         self,
@@ -239,6 +276,17 @@ class ListItems(BaseUseCase):
         ):
             raise AppException(constants.METADATA_DEPRICATED_FOR_PIXEL)
 
+    def _list_folder_items(self, folder: FolderEntity) -> List[BaseItemEntity]:
+        items = []
+        for item in self._service_provider.items.iterate(
+            copy.deepcopy(self._search_condition)
+            & Condition("folder_id", folder.id, EQ)
+        ):
+            item = GetItem.serialize_entity(item, self._project)
+            item.add_path(self._project.name, folder.name)
+            items.append(item)
+        return items
+
     def execute(self) -> Response:
         if self.is_valid():
             self._search_condition &= Condition("project_id", self._project.id, EQ)
@@ -247,33 +295,16 @@ class ListItems(BaseUseCase):
             )
 
             if not self._recursive:
-                self._search_condition &= Condition("folder_id", self._folder.id, EQ)
-                items_response = self._service_provider.items.list(
-                    self._search_condition
-                )
-                if not items_response.ok:
-                    raise AppException(items_response.error)
-                items = []
-                for item in items_response.data:
-                    item = GetItem.serialize_entity(item, self._project)
-                    item.add_path(self._project.name, self._folder.name)
-                    items.append(item)
+                items = self._list_folder_items(self._folder)
             else:
-                items = []
                 folders = self._service_provider.folders.list(
                     Condition("project_id", self._project.id, EQ)
                 ).data
-                for folder in folders:
-                    response = self._service_provider.items.list(
-                        copy.deepcopy(self._search_condition)
-                        & Condition("folder_id", folder.id, EQ)
+                items = list(
+                    itertools.chain.from_iterable(
+                        map_folders(self._list_folder_items, folders)
                     )
-                    if not response.ok:
-                        raise AppException(response.error)
-                    for item in response.data:
-                        item = GetItem.serialize_entity(item, self._project)
-                        item.add_path(self._project.name, folder.name)
-                        items.append(item)
+                )
             self._response.data = items
         return self._response
 
@@ -412,24 +443,26 @@ class AttachItems(BaseReportableUseCase):
 
     def execute(self) -> Response:
         if self.is_valid():
-            duplications = []
             attached = []
+            response = self._service_provider.items.map_by_names(
+                project=self._project,
+                folder=self._folder,
+                names=[attachment.name for attachment in self._attachments],
+            )
+            if not response.ok:
+                raise AppException(response.error)
+            existing_items = response.data
+            duplications = list(existing_items)
+            attached_items = set()
             self.reporter.start_progress(self.attachments_count, "Attaching URLs")
             for i in range(0, self.attachments_count, self.CHUNK_SIZE):
                 attachments = self._attachments[i : i + self.CHUNK_SIZE]  # noqa: E203
-                response = self._service_provider.items.list_by_names(
-                    project=self._project,
-                    folder=self._folder,
-                    names=[attachment.name for attachment in attachments],
-                )
-                if not response.ok:
-                    raise AppException(response.error)
-
-                duplications.extend([image.name for image in response.data])
                 to_upload: List[Attachment] = []
                 to_upload_meta: Dict[str, AttachmentMeta] = {}
                 for attachment in attachments:
-                    if attachment.name not in duplications:
+                    if attachment.name in attached_items:
+                        duplications.append(attachment.name)
+                    elif attachment.name not in existing_items:
                         to_upload.append(
                             Attachment(name=attachment.name, path=attachment.url)
                         )
@@ -447,6 +480,8 @@ class AttachItems(BaseReportableUseCase):
                         self._response.errors = AppException(backend_response.error)
                     else:
                         attached.extend([i.name for i in to_upload])
+                        # the names repeated in the later chunks are duplicates
+                        attached_items.update(i.name for i in to_upload)
                 self.reporter.update_progress(len(attachments))
             self.reporter.finish_progress()
             self._response.data = attached, duplications
@@ -495,6 +530,12 @@ class CopyItems(BaseReportableUseCase):
         if self._item_names:
             self._item_names = list(set(self._item_names))
 
+    def _get_existing_items(self, item_names: List[str]) -> Dict[str, BaseItemEntity]:
+        response = self._service_provider.items.map_by_names(
+            project=self._project, folder=self._to_folder, names=item_names
+        )
+        return response.data if response.ok else {}
+
     def execute(self):
         if self.is_valid():
             if self._item_names:
@@ -507,17 +548,7 @@ class CopyItems(BaseReportableUseCase):
                     item.name
                     for item in self._service_provider.items.list(condition).data
                 ]
-            existing_items = []
-            for i in range(0, len(items), self.CHUNK_SIZE):
-                cand_items = self._service_provider.items.list_by_names(
-                    project=self._project,
-                    folder=self._to_folder,
-                    names=items[i : i + self.CHUNK_SIZE],  # noqa
-                ).data
-                if isinstance(cand_items, dict):
-                    continue
-                existing_items += cand_items
-            duplications = [item.name for item in existing_items]
+            duplications = list(self._get_existing_items(items))
             items_to_copy = list(set(items) - set(duplications))
             skipped_items = duplications
             try:
@@ -547,18 +578,7 @@ class CopyItems(BaseReportableUseCase):
                     except BackendError as e:
                         self._response.errors = AppException(e)
                         return self._response
-                existing_items = []
-                for i in range(0, len(items), self.CHUNK_SIZE):
-                    cand_items = self._service_provider.items.list_by_names(
-                        project=self._project,
-                        folder=self._to_folder,
-                        names=items[i : i + self.CHUNK_SIZE],  # noqa
-                    )
-                    if isinstance(cand_items, dict):
-                        continue
-                    existing_items += cand_items.data
-
-                existing_item_names_set = {item.name for item in existing_items}
+                existing_item_names_set = set(self._get_existing_items(items_to_copy))
                 items_to_copy_names_set = set(items_to_copy)
                 copied_items = existing_item_names_set.intersection(
                     items_to_copy_names_set
@@ -677,25 +697,17 @@ class SetAnnotationStatues(BaseReportableUseCase):
                 item.name for item in self._service_provider.items.list(condition).data
             ]
             return
-        existing_items = []
-        for i in range(0, len(self._item_names), self.CHUNK_SIZE):
-            search_names = self._item_names[i : i + self.CHUNK_SIZE]  # noqa
-            response = self._service_provider.items.list_by_names(
-                project=self._project,
-                folder=self._folder,
-                names=search_names,
-            )
-            if not response.ok:
-                raise AppValidationException(response.error)
-
-            cand_items = response.data
-            existing_items += cand_items
+        response = self._service_provider.items.map_by_names(
+            project=self._project,
+            folder=self._folder,
+            names=self._item_names,
+        )
+        if not response.ok:
+            raise AppValidationException(response.error)
+        existing_items = response.data
         if not existing_items:
             raise AppValidationException(self.ERROR_MESSAGE)
-        if existing_items:
-            self._item_names = list(
-                {i.name for i in existing_items}.intersection(set(self._item_names))
-            )
+        self._item_names = list(set(existing_items).intersection(self._item_names))
 
     def execute(self):
         if self.is_valid():
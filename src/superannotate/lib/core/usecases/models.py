@@ -4,19 +4,15 @@ import tempfile
 import time
 import platform
 import zipfile
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List
 from tempfile import TemporaryDirectory
 
 import boto3
 import lib.core as constances
-import pandas as pd
 import requests
 from botocore.exceptions import ClientError
-from lib.app.analytics.aggregators import DataAggregator
-from lib.app.analytics.common import aggregate_image_annotations_as_df
-from lib.app.analytics.common import consensus_plot
-from lib.app.analytics.common import consensus
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
 from lib.core.entities import FolderEntity
@@ -30,6 +26,7 @@ from lib.core.reporter import Reporter
 from lib.core.serviceproviders import BaseServiceProvider
 from lib.core.usecases.base import BaseReportableUseCase
 from lib.core.usecases.base import BaseUseCase
+from lib.core.usecases.base import get_process_executor
 from lib.core.usecases.folders import GetFolderUseCase
 from lib.core.usecases.annotations import GetAnnotations, DownloadAnnotations
 from lib.core.usecases.classes import DownloadAnnotationClassesUseCase
@@ -342,6 +339,10 @@ class BenchmarkUseCase(BaseUseCase):
         self._show_plots = show_plots
 
     def execute(self):
+        import pandas as pd
+        from lib.app.analytics.common import aggregate_image_annotations_as_df
+        from lib.app.analytics.common import consensus_plot
+
         project_df = aggregate_image_annotations_as_df(self._export_dir)
         gt_project_df = project_df[
             project_df["folderName"] == self._ground_truth_folder_name
@@ -415,6 +416,9 @@ class BenchmarkUseCase(BaseUseCase):
 
 
 class ConsensusUseCase(BaseUseCase):
+    PARALLEL_ITEMS_COUNT = 1000
+    PROCESSING_WORKERS = min(8, os.cpu_count() or 1)
+
     def __init__(
         self,
         project: ProjectEntity,
@@ -478,6 +482,9 @@ class ConsensusUseCase(BaseUseCase):
 
 
     def execute(self):
+        from lib.app.analytics.aggregators import DataAggregator
+        from lib.app.analytics.common import calculate_consensus
+
         with TemporaryDirectory() as temp_dir:
             export_path = self._download_annotations(temp_dir)
             aggregator = DataAggregator(
@@ -535,17 +542,20 @@ class ConsensusUseCase(BaseUseCase):
             all_projects_df = all_projects_df.apply(aggregate_attributes).reset_index(
                 drop=True
             )
-            unique_images = set(all_projects_df["itemName"])
+        # tag consensus is computed in place, the pool would only fork the data
+        if (
+            self._instance_type != "tag"
+            and all_projects_df["itemName"].nunique() >= self.PARALLEL_ITEMS_COUNT
+        ):
+            executor_context = get_process_executor(
+                max_workers=self.PROCESSING_WORKERS
+            )
         else:
-            unique_images = all_projects_df["itemName"].unique()
-        all_consensus_data = []
-        for image_name in unique_images:
-            image_data = consensus(
-                all_projects_df, image_name, self._instance_type
+            executor_context = nullcontext()
+        with executor_context as executor:
+            consensus_df = calculate_consensus(
+                all_projects_df, self._instance_type, executor=executor
             )
-            all_consensus_data.append(pd.DataFrame(image_data))
-
-        consensus_df = pd.concat(all_consensus_data, ignore_index=True)
         if self._instance_type == "tag":
             consensus_df["score"]/=(len(self._folder_names) - 1)
 
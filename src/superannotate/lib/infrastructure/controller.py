@@ -508,6 +508,23 @@ class AnnotationManager(BaseManager):
         )
         return use_case.execute()
 
+    def iterate(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        item_names: Optional[List[str]],
+        batch_size: int,
+        verbose=True,
+    ):
+        return usecases.IterAnnotations(
+            reporter=Reporter(log_info=verbose, log_warning=verbose),
+            project=project,
+            folder=folder,
+            item_names=item_names,
+            service_provider=self.service_provider,
+            batch_size=batch_size,
+        )
+
     def download(
         self,
         project: ProjectEntity,
@@ -1295,3 +1312,24 @@ class Controller(BaseController):
             service_provider=self.service_provider,
         )
         return use_case.execute()
+
+    def iter_query_entities(
+        self,
+        project_name: str,
+        folder_name: str,
+        query: str = None,
+        subset: str = None,
+        prefetch: int = None,
+    ):
+        project = self.get_project(project_name)
+        folder = self.get_folder(project, folder_name)
+
+        return usecases.IterQueryEntitiesUseCase(
+            reporter=self.get_default_reporter(),
+            project=project,
+            folder=folder,
+            query=query,
+            subset=subset,
+            service_provider=self.service_provider,
+            prefetch=prefetch,
+        )
@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import lib.core as constants
+from superannotate.logger import get_default_logger
+
+logger = get_default_logger()
+
+
+class CachedSchema:
+    def __init__(self, schema: dict, etag: Optional[str], fetched_at: float):
+        self.schema = schema
+        self.etag = etag
+        self.fetched_at = fetched_at
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+
+class SchemaCache:
+    """
+    On-disk cache of the annotation schemas, one json file per
+    assets provider, project type and schema version.
+    The entries are revalidated with their ETag after the TTL expires,
+    in offline mode they are used regardless of their age.
+    SA_SCHEMA_CACHE_TTL sets the TTL in seconds,
+    SA_SCHEMA_CACHE_OFFLINE=True disables the schema requests.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, path: str = constants.SCHEMA_CACHE_LOCATION):
+        self._path = Path(path) / f"v{self.FORMAT_VERSION}"
+
+    @property
+    def ttl(self) -> int:
+        return int(os.environ.get("SA_SCHEMA_CACHE_TTL", self.DEFAULT_TTL))
+
+    @property
+    def offline(self) -> bool:
+        return os.environ.get("SA_SCHEMA_CACHE_OFFLINE", "False").lower() in (
+            "true",
+            "1",
+            "t",
+        )
+
+    def _get_path(self, host: str, project_type: int, version: str) -> Path:
+        return self._path / host / f"{project_type}__{version}.json"
+
+    def get(self, host: str, project_type: int, version: str) -> Optional[CachedSchema]:
+        path = self._get_path(host, project_type, version)
+        try:
+            with open(path) as file:
+                return CachedSchema(**json.load(file))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug(f"Invalid schema cache entry {path}.")
+            return None
+
+    def set(
+        self,
+        host: str,
+        project_type: int,
+        version: str,
+        schema: dict,
+        etag: Optional[str] = None,
+    ) -> CachedSchema:
+        entry = CachedSchema(schema=schema, etag=etag, fetched_at=time.time())
+        path = self._get_path(host, project_type, version)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # the entry is replaced atomically, concurrent readers never see a part
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as file:
+                    json.dump(entry.__dict__, file)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Can't write the schema cache entry {path}: {e}")
+        return entry
@@ -1,8 +1,12 @@
+import concurrent.futures
 import datetime
+import itertools
+import os
+from collections import deque
+from typing import Iterator
 from typing import List
 
 import lib.core as constants
-import requests
 from lib.core import entities
 from lib.core.conditions import Condition
 from lib.core.service_types import DownloadMLModelAuthDataResponse
@@ -15,6 +19,7 @@ from lib.infrastructure.services.annotation import AnnotationService
 from lib.infrastructure.services.annotation_class import AnnotationClassService
 from lib.infrastructure.services.custom_field import CustomFieldService
 from lib.infrastructure.services.folder import FolderService
+from lib.infrastructure.services.http_client import AsyncHttpClient
 from lib.infrastructure.services.http_client import HttpClient
 from lib.infrastructure.services.integration import IntegrationService
 from lib.infrastructure.services.item import ItemService
@@ -26,6 +31,7 @@ from lib.infrastructure.services.subset import SubsetService
 class ServiceProvider(BaseServiceProvider):
     MAX_ITEMS_COUNT = 50 * 1000
     SAQUL_CHUNK_SIZE = 50
+    SAQUL_PREFETCH_PAGES = 4
 
     URL_TEAM = "team"
     URL_GET_LIMITS = "project/{project_id}/limitationDetails"
@@ -45,10 +51,23 @@ class ServiceProvider(BaseServiceProvider):
 
     def __init__(self, client: HttpClient):
         self.client = client
+        self.async_client = AsyncHttpClient(
+            limit_per_host=int(
+                os.environ.get("SA_HTTP_LIMIT_PER_HOST", AsyncHttpClient.LIMIT_PER_HOST)
+            ),
+            dns_cache_ttl=int(
+                os.environ.get("SA_HTTP_DNS_CACHE_TTL", AsyncHttpClient.DNS_CACHE_TTL)
+            ),
+            keepalive_timeout=int(
+                os.environ.get(
+                    "SA_HTTP_KEEPALIVE_TIMEOUT", AsyncHttpClient.KEEPALIVE_TIMEOUT
+                )
+            ),
+        )
         self.projects = ProjectService(client)
         self.folders = FolderService(client)
         self.items = ItemService(client)
-        self.annotations = AnnotationService(client)
+        self.annotations = AnnotationService(client, self.async_client)
         self.annotation_classes = AnnotationClassService(client)
         self.custom_fields = CustomFieldService(client)
         self.subsets = SubsetService(client)
@@ -233,14 +252,21 @@ class ServiceProvider(BaseServiceProvider):
             self.URL_VALIDATE_SAQUL_QUERY, "post", params=params, data=data
         )
 
-    def saqul_query(
+    def iter_saqul_query(
         self,
         project: entities.ProjectEntity,
         folder: entities.FolderEntity = None,
         query: str = None,
         subset_id: int = None,
-    ) -> ServiceResponse:
-
+        prefetch: int = SAQUL_PREFETCH_PAGES,
+    ) -> Iterator[ServiceResponse]:
+        """
+        Yields the responses of the query pages in order.
+        Up to prefetch next pages are requested while the current one is processed,
+        the iteration stops after a short or a failed page.
+        """
+        # the base provider defaults to None, which would request all pages at once
+        prefetch = prefetch or self.SAQUL_PREFETCH_PAGES
         params = {
             "project_id": project.id,
             "includeFolderNames": True,
@@ -249,22 +275,46 @@ class ServiceProvider(BaseServiceProvider):
             params["folder_id"] = folder.id
         if subset_id:
             params["subset_id"] = subset_id
-        data = {"image_index": 0}
-        if query:
-            data["query"] = query
-        items = []
-        response = requests.Response()
-        for _ in range(0, self.MAX_ITEMS_COUNT, self.SAQUL_CHUNK_SIZE):
-            response = self.client.request(
+
+        def get_page(image_index: int) -> ServiceResponse:
+            data = {"image_index": image_index}
+            if query:
+                data["query"] = query
+            return self.client.request(
                 self.URL_SAQUL_QUERY, "post", params=params, data=data
             )
+
+        image_indexes = iter(range(0, self.MAX_ITEMS_COUNT, self.SAQUL_CHUNK_SIZE))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque(
+                executor.submit(get_page, i)
+                for i in itertools.islice(image_indexes, prefetch)
+            )
+            try:
+                while pending:
+                    response = pending.popleft().result()
+                    yield response
+                    if not response.ok or len(response.data) < self.SAQUL_CHUNK_SIZE:
+                        return
+                    for i in itertools.islice(image_indexes, 1):
+                        pending.append(executor.submit(get_page, i))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def saqul_query(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity = None,
+        query: str = None,
+        subset_id: int = None,
+        prefetch: int = SAQUL_PREFETCH_PAGES,
+    ) -> ServiceResponse:
+        items = []
+        for response in self.iter_saqul_query(
+            project, folder, query, subset_id, prefetch
+        ):
             if not response.ok:
-                break
-            response_items = response.data
-            items.extend(response_items)
-            if len(response_items) < self.SAQUL_CHUNK_SIZE:
-                service_response = ServiceResponse(response)
-                service_response.data = items
-                return service_response
-            data["image_index"] += self.SAQUL_CHUNK_SIZE
-        return ServiceResponse(response)
+                return response
+            items.extend(response.data)
+        return ServiceResponse(data=items)
@@ -2,20 +2,29 @@ import asyncio
 import copy
 import io
 import json
+import traceback
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
 from typing import List
 from urllib.parse import urljoin
+from urllib.parse import urlparse
 
+import aiofiles
 import aiohttp
 import lib.core as constants
 from lib.core import entities
 from lib.core.exceptions import AppException
 from lib.core.reporter import Reporter
+from lib.core.service_types import ServiceResponse
 from lib.core.service_types import UploadAnnotations
 from lib.core.service_types import UploadAnnotationsResponse
 from lib.core.serviceproviders import BaseAnnotationService
+from lib.core.serviceproviders import BaseClient
+from lib.infrastructure.schema_cache import SchemaCache
+from lib.infrastructure.services.http_client import AsyncHttpClient
 from lib.infrastructure.stream_data_handler import StreamedAnnotations
 from pydantic import parse_obj_as
 from superannotate.logger import get_default_logger
@@ -43,6 +52,16 @@ class AnnotationService(BaseAnnotationService):
     URL_DELETE_ANNOTATIONS_PROGRESS = "annotations/getRemoveStatus"
     URL_ANNOTATION_SCHEMAS = "items/annotations/schema"
 
+    def __init__(
+        self,
+        client: BaseClient,
+        async_client: AsyncHttpClient = None,
+        schema_cache: SchemaCache = None,
+    ):
+        super().__init__(client)
+        self.async_client = async_client if async_client else AsyncHttpClient()
+        self.schema_cache = schema_cache if schema_cache else SchemaCache()
+
     @property
     def assets_provider_url(self):
         if self.client.api_url != constants.BACKEND_URL:
@@ -50,14 +69,53 @@ class AnnotationService(BaseAnnotationService):
         return f"https://assets-provider.superannotate.com/api/{self.ASSETS_PROVIDER_VERSION}/"
 
     def get_schema(self, project_type: int, version: str):
-        return self.client.request(
-            urljoin(self.assets_provider_url, self.URL_ANNOTATION_SCHEMAS),
-            "get",
-            params={
-                "project_type": project_type,
-                "version": version,
-            },
-        )
+        """
+        Returns the schema from the on-disk cache while it is fresh,
+        otherwise revalidates the cached schema with its ETag.
+        A stale schema is still used if the request fails.
+        """
+        host = urlparse(self.assets_provider_url).netloc
+        cached = self.schema_cache.get(host, project_type, version)
+        if cached and (
+            self.schema_cache.offline or cached.is_fresh(self.schema_cache.ttl)
+        ):
+            return ServiceResponse(data=cached.schema)
+        if self.schema_cache.offline:
+            raise AppException(
+                f"Schema {version} is not cached, can't fetch it in offline mode."
+            )
+        try:
+            response = self.client.request(
+                urljoin(self.assets_provider_url, self.URL_ANNOTATION_SCHEMAS),
+                "get",
+                params={
+                    "project_type": project_type,
+                    "version": version,
+                },
+                headers={"If-None-Match": cached.etag}
+                if cached and cached.etag
+                else None,
+            )
+        except AppException:
+            if not cached:
+                raise
+            logger.debug(traceback.format_exc())
+            return ServiceResponse(data=cached.schema)
+        if cached and not response.ok:
+            if response.status == 304:
+                self.schema_cache.set(
+                    host, project_type, version, schema=cached.schema, etag=cached.etag
+                )
+            return ServiceResponse(data=cached.schema)
+        if response.ok and response.data:
+            self.schema_cache.set(
+                host,
+                project_type,
+                version,
+                schema=response.data,
+                etag=(response.headers or {}).get("ETag"),
+            )
+        return response
 
     async def _sync_large_annotation(self, team_id, project_id, item_id):
         sync_params = {
@@ -73,12 +131,9 @@ class AnnotationService(BaseAnnotationService):
             self.assets_provider_url,
             self.URL_SYNC_LARGE_ANNOTATION.format(item_id=item_id),
         )
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False),
-            headers=self.client.default_headers,
-            raise_for_status=True,
-        ) as session:
-            await session.post(sync_url, params=sync_params)
+        headers = self.client.default_headers
+        async with self.async_client.session() as session:
+            await session.post(sync_url, params=sync_params, headers=headers)
 
             sync_params.pop("current_source")
             sync_params.pop("desired_source")
@@ -89,7 +144,9 @@ class AnnotationService(BaseAnnotationService):
                 self.URL_SYNC_LARGE_ANNOTATION_STATUS.format(item_id=item_id),
             )
             while synced != "SUCCESS":
-                synced = await session.get(sync_status_url, params=sync_params)
+                synced = await session.get(
+                    sync_status_url, params=sync_params, headers=headers
+                )
                 synced = await synced.json()
                 synced = synced["status"]
                 await asyncio.sleep(1)
@@ -110,16 +167,13 @@ class AnnotationService(BaseAnnotationService):
             "version": "V1.00",
         }
 
-        await self._sync_large_annotation(
-            team_id=project.team_id, project_id=project.id, item_id=item["id"]
-        )
-
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False),
-            headers=self.client.default_headers,
-            raise_for_status=True,
-        ) as session:
-            start_response = await session.post(url, params=query_params)
+        async with self.async_client.session() as session:
+            await self._sync_large_annotation(
+                team_id=project.team_id, project_id=project.id, item_id=item["id"]
+            )
+            start_response = await session.post(
+                url, params=query_params, headers=self.client.default_headers
+            )
             large_annotation = await start_response.json()
 
         reporter.update_progress()
@@ -132,6 +186,7 @@ class AnnotationService(BaseAnnotationService):
         items: List[str],
         reporter: Reporter,
         callback: Callable = None,
+        parse_executor: Executor = None,
     ) -> List[dict]:
         query_params = {
             "team_id": project.team_id,
@@ -144,6 +199,8 @@ class AnnotationService(BaseAnnotationService):
             reporter,
             map_function=lambda x: {"image_names": x},
             callback=callback,
+            async_client=self.async_client,
+            parse_executor=parse_executor,
         )
 
         loop = asyncio.new_event_loop()
@@ -157,6 +214,35 @@ class AnnotationService(BaseAnnotationService):
             )
         )
 
+    def iter_small_annotations(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        items: List[str],
+        reporter: Reporter,
+        callback: Callable = None,
+        parse_executor: Executor = None,
+    ) -> AsyncIterator[dict]:
+        query_params = {
+            "team_id": project.team_id,
+            "project_id": project.id,
+            "folder_id": folder.id,
+        }
+        handler = StreamedAnnotations(
+            self.client.default_headers,
+            reporter,
+            map_function=lambda x: {"image_names": x},
+            callback=callback,
+            async_client=self.async_client,
+            parse_executor=parse_executor,
+        )
+        return handler.stream_data(
+            url=urljoin(self.assets_provider_url, self.URL_GET_ANNOTATIONS),
+            data=items,
+            params=query_params,
+            chunk_size=self.DEFAULT_CHUNK_SIZE,
+        )
+
     def sort_items_by_size(
         self,
         project: entities.ProjectEntity,
@@ -209,24 +295,21 @@ class AnnotationService(BaseAnnotationService):
             self.URL_DOWNLOAD_LARGE_ANNOTATION.format(item_id=item_id),
         )
 
-        await self._sync_large_annotation(
-            team_id=project.team_id, project_id=project.id, item_id=item_id
-        )
-
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False),
-            headers=self.client.default_headers,
-            raise_for_status=True,
-        ) as session:
-            start_response = await session.post(url, params=query_params)
+        async with self.async_client.session() as session:
+            await self._sync_large_annotation(
+                team_id=project.team_id, project_id=project.id, item_id=item_id
+            )
+            start_response = await session.post(
+                url, params=query_params, headers=self.client.default_headers
+            )
             res = await start_response.json()
             Path(download_path).mkdir(exist_ok=True, parents=True)
 
             dest_path = Path(download_path) / (item_name + postfix)
-            with open(dest_path, "w") as fp:
+            async with aiofiles.open(dest_path, "w") as fp:
                 if callback:
                     res = callback(res)
-                json.dump(res, fp)
+                await fp.write(json.dumps(res))
 
     async def download_small_annotations(
         self,
@@ -237,6 +320,7 @@ class AnnotationService(BaseAnnotationService):
         postfix: str,
         items: List[str] = None,
         callback: Callable = None,
+        parse_executor: Executor = None,
     ):
         query_params = {
             "team_id": project.team_id,
@@ -248,6 +332,8 @@ class AnnotationService(BaseAnnotationService):
             reporter=reporter,
             map_function=lambda x: {"image_names": x},
             callback=callback,
+            async_client=self.async_client,
+            parse_executor=parse_executor,
         )
 
         return await handler.download_data(
@@ -274,11 +360,7 @@ class AnnotationService(BaseAnnotationService):
 
         headers = copy.copy(self.client.default_headers)
         del headers["Content-Type"]
-        async with aiohttp.ClientSession(
-            headers=headers,
-            connector=aiohttp.TCPConnector(ssl=False),
-            raise_for_status=True,
-        ) as session:
+        async with self.async_client.session() as session:
             data = aiohttp.FormData(quote_fields=False)
             for key, file in items_name_file_map.items():
                 file.seek(0)
@@ -297,6 +379,7 @@ class AnnotationService(BaseAnnotationService):
                     "folder_id": folder.id,
                 },
                 data=data,
+                headers=headers,
             )
             if not _response.ok:
                 logger.debug(await _response.text())
@@ -316,11 +399,7 @@ class AnnotationService(BaseAnnotationService):
         data: io.StringIO,
         chunk_size: int,
     ) -> bool:
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False),
-            headers=self.client.default_headers,
-            raise_for_status=True,
-        ) as session:
+        async with self.async_client.session() as session:
             params = {
                 "team_id": project.team_id,
                 "project_id": project.id,
@@ -332,6 +411,7 @@ class AnnotationService(BaseAnnotationService):
                     self.URL_START_FILE_UPLOAD_PROCESS.format(item_id=item_id),
                 ),
                 params=params,
+                headers=self.client.default_headers,
             )
             if not start_response.ok:
                 raise AppException(str(await start_response.text()))
@@ -1,15 +1,24 @@
+import asyncio
+import concurrent.futures
+import functools
+import itertools
 import json
 import platform
 import threading
 import time
 import urllib.parse
+from collections import deque
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 from functools import lru_cache
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Tuple
 
+import aiohttp
 import pydantic
 import requests
 from lib.core.exceptions import AppException
@@ -33,11 +42,26 @@ class PydanticEncoder(json.JSONEncoder):
 
 class HttpClient(BaseClient):
     AUTH_TYPE = "sdk"
+    PAGINATION_WORKERS = 8
+    _pagination_executor = None
+    _pagination_executor_lock = threading.Lock()
 
     def __init__(self, api_url: str, token: str, verify_ssl: bool = True):
         super().__init__(api_url, token)
         self._verify_ssl = verify_ssl
 
+    @classmethod
+    def _get_pagination_executor(cls) -> concurrent.futures.Executor:
+        # a single long-lived pool is shared by all the listings, so listings run
+        # per folder don't multiply the threads and the per-thread sessions
+        with cls._pagination_executor_lock:
+            if cls._pagination_executor is None:
+                cls._pagination_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=cls.PAGINATION_WORKERS,
+                    thread_name_prefix="sa-pagination",
+                )
+            return cls._pagination_executor
+
     @lru_cache(maxsize=32)
     def _get_session(self, thread_id, ttl=None):  # noqa
         del ttl
@@ -128,15 +152,113 @@ class HttpClient(BaseClient):
             kwargs["data"] = json.dumps(data, cls=PydanticEncoder)
         if params:
             kwargs["params"].update(params)
+        if headers:
+            # the session is shared, so the request headers must not stick to it
+            kwargs["headers"] = headers
         session = self.get_session()
         if files and session.headers.get("Content-Type"):
             del session.headers["Content-Type"]
-        session.headers.update(headers if headers else {})
         response = self._request(_url, method, session=session, retried=0, **kwargs)
         if files:
             session.headers.update(self.default_headers)
         return content_type(response, dispatcher=dispatcher)
 
+    def _get_page(
+        self,
+        url: str,
+        offset: int,
+        item_type: Any = None,
+        query_params: Dict[str, Any] = None,
+        dispatcher: str = "data",
+    ) -> Tuple[ServiceResponse, list]:
+        splitter = "&" if "?" in url else "?"
+        response = self.request(
+            f"{url}{splitter}offset={offset}",
+            method="get",
+            params=query_params,
+        )
+        if not response.ok:
+            return response, []
+        if isinstance(response.data, dict):
+            data = response.data.get(dispatcher)
+        else:
+            data = response.data
+        data = data or []
+        if item_type:
+            data = pydantic.parse_obj_as(List[item_type], data)
+        return response, data
+
+    def _iter_pages(
+        self,
+        url: str,
+        item_type: Any = None,
+        chunk_size: int = 2000,
+        query_params: Dict[str, Any] = None,
+        dispatcher: str = "data",
+    ) -> Iterator[Tuple[ServiceResponse, list]]:
+        """
+        Yields (response, parsed page) pairs in offset order.
+        The pages announced by the first response's count are fetched concurrently,
+        with at most PAGINATION_WORKERS * 2 requests in flight.
+        The iteration stops on the first failed response, which is yielded last.
+        """
+        get_page = functools.partial(
+            self._get_page,
+            url,
+            item_type=item_type,
+            query_params=query_params,
+            dispatcher=dispatcher,
+        )
+        response, data = get_page(0)
+        yield response, data
+        if not response.ok or len(data) < chunk_size:
+            return
+        offset = len(data)
+        offsets = iter(range(offset, response.count or 0, chunk_size))
+        executor = self._get_pagination_executor()
+        pending = deque(
+            executor.submit(get_page, i)
+            for i in itertools.islice(offsets, self.PAGINATION_WORKERS * 2)
+        )
+        try:
+            while pending:
+                response, data = pending.popleft().result()
+                yield response, data
+                if not response.ok:
+                    return
+                offset += len(data)
+                for i in itertools.islice(offsets, 1):
+                    pending.append(executor.submit(get_page, i))
+        finally:
+            for future in pending:
+                future.cancel()
+        # the count may be outdated or missing, read the rest page by page
+        while len(data) == chunk_size:
+            response, data = get_page(offset)
+            yield response, data
+            if not response.ok:
+                return
+            offset += len(data)
+
+    def iter_paginate(
+        self,
+        url: str,
+        item_type: Any = None,
+        chunk_size: int = 2000,
+        query_params: Dict[str, Any] = None,
+        dispatcher: str = "data",
+    ) -> Iterator[Any]:
+        """
+        Iterator form of paginate, items are yielded as soon as their page is received.
+        Raises AppException if a page can not be fetched.
+        """
+        for response, data in self._iter_pages(
+            url, item_type, chunk_size, query_params, dispatcher
+        ):
+            if not response.ok:
+                raise AppException(response.error)
+            yield from data
+
     def paginate(
         self,
         url: str,
@@ -145,40 +267,72 @@ class HttpClient(BaseClient):
         query_params: Dict[str, Any] = None,
         dispatcher: str = "data",
     ) -> ServiceResponse:
-        offset = 0
         total = []
-        splitter = "&" if "?" in url else "?"
-
-        while True:
-            _url = f"{url}{splitter}offset={offset}"
-            _response = self.request(
-                _url,
-                method="get",
-                item_type=List[item_type],
-                params=query_params,
-            )
-            if _response.ok:
-                if isinstance(_response.data, dict):
-                    data = _response.data.get(dispatcher)
-                else:
-                    data = _response.data
-                if data:
-                    total.extend(data)
-                else:
-                    break
-                data_len = len(data)
-                offset += data_len
-                if data_len < chunk_size or _response.count - offset < 0:
-                    break
-            else:
-                break
-        if item_type:
-            response = ServiceResponse(
-                data=pydantic.parse_obj_as(List[item_type], total)
-            )
-        else:
-            response = ServiceResponse(data=total)
+        for _response, data in self._iter_pages(
+            url, item_type, chunk_size, query_params, dispatcher
+        ):
+            total.extend(data)
+        response = ServiceResponse(data=total)
         if not _response.ok:
             response.set_error(_response.error)
             response.status = _response.status
         return response
+
+
+class AsyncHttpClient:
+    """
+    Shares one pooled aiohttp session per event loop.
+    The session lives while at least one session() context is open on the loop,
+    so concurrent requests reuse the same keep-alive connections.
+    """
+
+    LIMIT_PER_HOST = 32
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 60
+
+    class _LoopSession:
+        def __init__(self, session: aiohttp.ClientSession):
+            self.session = session
+            self.users = 0
+
+    def __init__(
+        self,
+        verify_ssl: bool = False,
+        limit_per_host: int = LIMIT_PER_HOST,
+        dns_cache_ttl: int = DNS_CACHE_TTL,
+        keepalive_timeout: int = KEEPALIVE_TIMEOUT,
+    ):
+        self._verify_ssl = verify_ssl
+        self._limit_per_host = limit_per_host
+        self._dns_cache_ttl = dns_cache_ttl
+        self._keepalive_timeout = keepalive_timeout
+        self._sessions: Dict[
+            asyncio.AbstractEventLoop, AsyncHttpClient._LoopSession
+        ] = {}
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            ssl=None if self._verify_ssl else False,
+            limit_per_host=self._limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self._dns_cache_ttl,
+            keepalive_timeout=self._keepalive_timeout,
+        )
+        return aiohttp.ClientSession(connector=connector, raise_for_status=True)
+
+    @asynccontextmanager
+    async def session(self):
+        loop = asyncio.get_running_loop()
+        loop_session = self._sessions.get(loop)
+        if not loop_session or loop_session.session.closed:
+            loop_session = self._LoopSession(self._create_session())
+            self._sessions[loop] = loop_session
+        loop_session.users += 1
+        try:
+            yield loop_session.session
+        finally:
+            loop_session.users -= 1
+            if not loop_session.users:
+                if self._sessions.get(loop) is loop_session:
+                    del self._sessions[loop]
+                await loop_session.session.close()
@@ -1,3 +1,5 @@
+import concurrent.futures
+import functools
 import time
 from typing import Dict
 from typing import List
@@ -12,6 +14,7 @@ from lib.core.service_types import ImageResponse
 from lib.core.service_types import ClassificationResponse
 from lib.core.service_types import VideoResponse
 from lib.core.service_types import PointCloudResponse
+from lib.core.service_types import ServiceResponse
 from lib.core.service_types import TiledResponse
 from lib.core.serviceproviders import BaseItemService
 from lib.core.types import Attachment
@@ -20,6 +23,11 @@ from lib.core.enums import ProjectType
 
 
 class ItemService(BaseItemService):
+    LIST_BY_NAMES_CHUNK_SIZE = 200
+    LIST_BY_NAMES_WORKERS = 8
+    LIST_BY_NAMES_RETRIES = 3
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
     URL_LIST = "items"
     URL_GET = "image/{}"
     URL_LIST_BY_NAMES = "images/getBulk"
@@ -66,6 +74,15 @@ class ItemService(BaseItemService):
             item_type=entities.BaseItemEntity,
         )
 
+    def iterate(self, condition: Condition = None):
+        return self.client.iter_paginate(
+            url=f"{self.URL_LIST}?{condition.build_query()}"
+            if condition
+            else self.URL_LIST,
+            chunk_size=2000,
+            item_type=entities.BaseItemEntity,
+        )
+
     def update(self, project: entities.ProjectEntity, item: entities.BaseItemEntity):
         return self.client.request(
             self.URL_GET.format(item.id),
@@ -74,31 +91,74 @@ class ItemService(BaseItemService):
             params={"project_id": project.id},
         )
 
+    def _list_by_names_chunk(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        names: List[str],
+    ) -> ItemListResponse:
+        for retry in range(self.LIST_BY_NAMES_RETRIES):
+            if retry:
+                time.sleep(retry * 0.5)
+            try:
+                response = self.client.request(
+                    self.URL_LIST_BY_NAMES,
+                    "post",
+                    data={
+                        "project_id": project.id,
+                        "team_id": project.team_id,
+                        "folder_id": folder.id,
+                        "names": names,
+                    },
+                    content_type=ItemListResponse,
+                )
+            except AppException:
+                if retry + 1 == self.LIST_BY_NAMES_RETRIES:
+                    raise
+                continue
+            if response.ok or response.status not in self.RETRY_STATUSES:
+                break
+        return response
+
+    def map_by_names(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        names: List[str],
+    ) -> ServiceResponse:
+        """
+        Looks the names up in chunks requested concurrently,
+        data is the name -> item mapping of the existing items.
+        """
+        chunk_size = self.LIST_BY_NAMES_CHUNK_SIZE
+        chunks = [
+            names[i : i + chunk_size]  # noqa: E203
+            for i in range(0, len(names), chunk_size)
+        ]
+        list_chunk = functools.partial(self._list_by_names_chunk, project, folder)
+        name_item_map = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.LIST_BY_NAMES_WORKERS
+        ) as executor:
+            if len(chunks) > 1:
+                responses = executor.map(list_chunk, chunks)
+            else:
+                responses = map(list_chunk, chunks)
+            for response in responses:
+                if not response.ok:
+                    return response
+                name_item_map.update((item.name, item) for item in response.data)
+        return ServiceResponse(data=name_item_map)
+
     def list_by_names(
         self,
         project: entities.ProjectEntity,
         folder: entities.FolderEntity,
         names: List[str],
     ):
-        chunk_size = 200
-        items = []
-        response = None
-        for i in range(0, len(names), chunk_size):
-            response = self.client.request(
-                self.URL_LIST_BY_NAMES,
-                "post",
-                data={
-                    "project_id": project.id,
-                    "team_id": project.team_id,
-                    "folder_id": folder.id,
-                    "names": names[i : i + chunk_size],  # noqa
-                },
-                content_type=ItemListResponse,
-            )
-            if not response.ok:
-                return response
-            items.extend(response.data)
-        response.data = items
+        response = self.map_by_names(project, folder, names)
+        if response.ok:
+            response.data = list(response.data.values())
         return response
 
     def attach(
@@ -2,10 +2,16 @@ import asyncio
 import copy
 import json
 import os
+from concurrent.futures import Executor
+from typing import AsyncIterator
 from typing import Callable
+from typing import List
+from typing import Optional
 
+import aiofiles
 import aiohttp
 from lib.core.reporter import Reporter
+from lib.infrastructure.services.http_client import AsyncHttpClient
 
 _seconds = 2**10
 TIMEOUT = aiohttp.ClientTimeout(
@@ -13,8 +19,44 @@ TIMEOUT = aiohttp.ClientTimeout(
 )
 
 
+class FrameDecoder:
+    """
+    Incrementally splits a byte stream into delimiter separated frames.
+    Incoming chunks are appended to a single bytearray and only the bytes
+    that were not scanned yet are searched for the delimiter,
+    so the cost stays linear in the stream size.
+    """
+
+    def __init__(self, delimiter: bytes):
+        self._delimiter = delimiter
+        self._buffer = bytearray()
+        self._scan_from = 0
+
+    def feed(self, data: bytes) -> List[bytearray]:
+        self._buffer.extend(data)
+        frames = []
+        start = 0
+        while True:
+            index = self._buffer.find(self._delimiter, max(start, self._scan_from))
+            if index == -1:
+                break
+            if index > start:
+                frames.append(self._buffer[start:index])
+            start = index + len(self._delimiter)
+        if start:
+            del self._buffer[:start]
+        self._scan_from = max(0, len(self._buffer) - len(self._delimiter) + 1)
+        return frames
+
+    def flush(self) -> Optional[bytearray]:
+        frame, self._buffer, self._scan_from = self._buffer, bytearray(), 0
+        return frame if frame.strip() else None
+
+
 class StreamedAnnotations:
     DELIMITER = b"\\n;)\\n"
+    # frames from this size are parsed in the parse executor, if given
+    EXECUTOR_FRAME_SIZE = 2**20
 
     def __init__(
         self,
@@ -22,14 +64,30 @@ class StreamedAnnotations:
         reporter: Reporter,
         callback: Callable = None,
         map_function: Callable = None,
+        async_client: AsyncHttpClient = None,
+        parse_executor: Executor = None,
     ):
+        """
+        :param async_client: client providing the pooled session for the requests
+        :param parse_executor: if given, frames larger than EXECUTOR_FRAME_SIZE
+         are parsed in it, so the event loop keeps reading the other responses
+        """
         self._headers = headers
+        self._async_client = async_client if async_client else AsyncHttpClient()
         self._annotations = []
         self._reporter = reporter
         self._callback: Callable = callback
         self._map_function = map_function
+        self._parse_executor = parse_executor
         self._items_downloaded = 0
 
+    async def _parse(self, frame: bytearray) -> dict:
+        if self._parse_executor and len(frame) >= self.EXECUTOR_FRAME_SIZE:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor, json.loads, frame
+            )
+        return json.loads(frame)
+
     async def fetch(
         self,
         method: str,
@@ -41,25 +99,17 @@ class StreamedAnnotations:
         kwargs = {"params": params, "json": {"folder_id": params.pop("folder_id")}}
         if data:
             kwargs["json"].update(data)
-        response = await session._request(method, url, **kwargs, timeout=TIMEOUT)
-        buffer = b""
-        async for line in response.content.iter_any():
-            slices = line.split(self.DELIMITER)
-            if len(slices) == 2 and slices[0]:
+        response = await session._request(
+            method, url, **kwargs, headers=self._headers, timeout=TIMEOUT
+        )
+        decoder = FrameDecoder(self.DELIMITER)
+        async for chunk in response.content.iter_any():
+            for frame in decoder.feed(chunk):
                 self._reporter.update_progress()
-                buffer += slices[0]
-                yield json.loads(buffer)
-                buffer = b""
-            elif len(slices) > 2:
-                for _slice in slices[:-1]:
-                    if not _slice:
-                        continue
-                    self._reporter.update_progress()
-                    yield json.loads(buffer + _slice)
-                    buffer = b""
-            buffer += slices[-1]
-        if buffer:
-            yield json.loads(buffer)
+                yield await self._parse(frame)
+        frame = decoder.flush()
+        if frame:
+            yield await self._parse(frame)
             self._reporter.update_progress()
 
     async def process_chunk(
@@ -68,14 +118,8 @@ class StreamedAnnotations:
         url: str,
         data: dict = None,
         params: dict = None,
-        verify_ssl=False,
     ):
-        async with aiohttp.ClientSession(
-            headers=self._headers,
-            timeout=TIMEOUT,
-            connector=aiohttp.TCPConnector(ssl=verify_ssl, keepalive_timeout=2**32),
-            raise_for_status=True,
-        ) as session:
+        async with self._async_client.session() as session:
             async for annotation in self.fetch(
                 method,
                 session,
@@ -96,12 +140,7 @@ class StreamedAnnotations:
         data: dict = None,
         params: dict = None,
     ):
-        async with aiohttp.ClientSession(
-            headers=self._headers,
-            timeout=TIMEOUT,
-            connector=aiohttp.TCPConnector(ssl=False, keepalive_timeout=2**32),
-            raise_for_status=True,
-        ) as session:
+        async with self._async_client.session() as session:
             async for annotation in self.fetch(
                 method,
                 session,
@@ -109,10 +148,7 @@ class StreamedAnnotations:
                 self._process_data(data),
                 params=params,
             ):
-                self._annotations.append(
-                    self._callback(annotation) if self._callback else annotation
-                )
-                self._store_annotation(
+                await self._store_annotation(
                     download_path,
                     postfix,
                     annotation,
@@ -127,30 +163,58 @@ class StreamedAnnotations:
         method: str = "post",
         params=None,
         chunk_size: int = 5000,
-        verify_ssl: bool = False,
     ):
         params["limit"] = chunk_size
-        await asyncio.gather(
-            *[
-                self.process_chunk(
-                    method=method,
-                    url=url,
-                    data=data[i : i + chunk_size],
-                    params=copy.copy(params),
-                    verify_ssl=verify_ssl,
-                )
-                for i in range(0, len(data), chunk_size)
-            ]
-        )
+        async with self._async_client.session():
+            await asyncio.gather(
+                *[
+                    self.process_chunk(
+                        method=method,
+                        url=url,
+                        data=data[i : i + chunk_size],
+                        params=copy.copy(params),
+                    )
+                    for i in range(0, len(data), chunk_size)
+                ]
+            )
 
         return self._annotations
 
+    async def stream_data(
+        self,
+        url: str,
+        data: list,
+        method: str = "post",
+        params=None,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields annotations one by one, requesting the chunks sequentially.
+        The response is read only while the consumer asks for the next annotation,
+        so at most one chunk is in flight at a time.
+        """
+        params["limit"] = chunk_size
+        async with self._async_client.session() as session:
+            for i in range(0, len(data), chunk_size):
+                async for annotation in self.fetch(
+                    method,
+                    session,
+                    url,
+                    self._process_data(data[i : i + chunk_size]),  # noqa
+                    params=copy.copy(params),
+                ):
+                    yield self._callback(annotation) if self._callback else annotation
+
     @staticmethod
-    def _store_annotation(path, postfix, annotation: dict, callback: Callable = None):
+    async def _store_annotation(
+        path, postfix, annotation: dict, callback: Callable = None
+    ):
         os.makedirs(path, exist_ok=True)
-        with open(f"{path}/{annotation['metadata']['name']}{postfix}", "w") as file:
+        async with aiofiles.open(
+            f"{path}/{annotation['metadata']['name']}{postfix}", "w"
+        ) as file:
             annotation = callback(annotation) if callback else annotation
-            json.dump(annotation, file)
+            await file.write(json.dumps(annotation))
 
     def _process_data(self, data):
         if data and self._map_function:
@@ -171,17 +235,18 @@ class StreamedAnnotations:
         Returns the number of items downloaded
         """
         params["limit"] = chunk_size
-        await asyncio.gather(
-            *[
-                self.store_chunk(
-                    method=method,
-                    url=url,
-                    data=data[i : i + chunk_size],  # noqa
-                    params=copy.copy(params),
-                    download_path=download_path,
-                    postfix=postfix,
-                )
-                for i in range(0, len(data), chunk_size)
-            ]
-        )
+        async with self._async_client.session():
+            await asyncio.gather(
+                *[
+                    self.store_chunk(
+                        method=method,
+                        url=url,
+                        data=data[i : i + chunk_size],  # noqa
+                        params=copy.copy(params),
+                        download_path=download_path,
+                        postfix=postfix,
+                    )
+                    for i in range(0, len(data), chunk_size)
+                ]
+            )
         return self._items_downloaded
@@ -0,0 +1,41 @@
+"""
+Compares the vectorized COCO RLE string coding with the scalar reference.
+
+    python -m tests.benchmarks.coco_rle [masks count]
+"""
+import sys
+import time
+
+import numpy as np
+from src.superannotate.lib.app.input_converters.converters.coco_converters import (
+    coco_api,
+)
+from tests.unit.test_coco_rle import full_hd_mask
+from tests.unit.test_coco_rle import reference_from_string
+from tests.unit.test_coco_rle import reference_to_string
+
+
+def measure(func, items):
+    started = time.perf_counter()
+    results = [func(item) for item in items]
+    return time.perf_counter() - started, results
+
+
+def run(count: int = 20):
+    rng = np.random.default_rng(0)
+    counts = [coco_api._masktoRLE(full_hd_mask(rng))["counts"] for _ in range(count)]
+    reference_encode_time, expected = measure(reference_to_string, counts)
+    encode_time, rle_strings = measure(coco_api._toString, counts)
+    assert rle_strings == expected
+    reference_decode_time, expected = measure(reference_from_string, rle_strings)
+    decode_time, decoded = measure(coco_api._frString, rle_strings)
+    assert decoded == expected
+    print(f"full HD masks:     {count}")
+    print(f"reference encode:  {reference_encode_time:.3f}s")
+    print(f"vectorized encode: {encode_time:.3f}s")
+    print(f"reference decode:  {reference_decode_time:.3f}s")
+    print(f"vectorized decode: {decode_time:.3f}s")
+
+
+if __name__ == "__main__":
+    run(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""
+Compares the compiled annotation validation with the full jsonschema validation.
+
+    python -m tests.benchmarks.validate_annotations [count]
+"""
+import sys
+import time
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.reporter import Reporter
+from src.superannotate.lib.core.usecases import ValidateAnnotationsUseCase
+from src.superannotate.lib.core.usecases import ValidateAnnotationUseCase
+from tests.moks.annotations import generate_vector_annotation
+from tests.moks.annotations import get_vector_schema
+
+
+def get_use_case(annotations, compiled: bool):
+    ValidateAnnotationUseCase.SCHEMAS.clear()
+    service_provider = MagicMock()
+    service_provider.annotations.get_schema.return_value = MagicMock(
+        ok=True, data=get_vector_schema()
+    )
+    use_case = ValidateAnnotationsUseCase(
+        reporter=Reporter(),
+        team_id=1,
+        project_type=1,
+        annotations=annotations,
+        service_provider=service_provider,
+    )
+    validator, is_valid = use_case._get_validator(use_case.DEFAULT_VERSION)
+    if not compiled:
+        key = next(iter(ValidateAnnotationUseCase.SCHEMAS))
+        ValidateAnnotationUseCase.SCHEMAS[key] = validator, None
+    return use_case
+
+
+def run(count: int = 10000):
+    annotations = [generate_vector_annotation(i) for i in range(count)]
+    # every hundredth annotation is invalid and goes through the full validation
+    for annotation in annotations[::100]:
+        annotation["instances"][0]["probability"] = 101
+    results = {}
+    for compiled in (False, True):
+        use_case = get_use_case(annotations, compiled)
+        started = time.perf_counter()
+        errors = use_case.execute().data
+        results[compiled] = time.perf_counter() - started, errors
+    (jsonschema_time, expected), (compiled_time, errors) = results.values()
+    assert errors == expected
+    print(f"annotations:        {count}")
+    print(f"invalid:            {sum(map(bool, errors))}")
+    print(f"jsonschema:         {jsonschema_time:.2f}s")
+    print(f"compiled fast path: {compiled_time:.2f}s")
+    print(f"speedup:            {jsonschema_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    run(*map(int, sys.argv[1:]))
@@ -0,0 +1,46 @@
+"""
+Compares the cached argument validation of the SDK methods
+with building the pydantic validator on every call.
+
+    python -m tests.benchmarks.validate_arguments [calls count]
+"""
+import sys
+import timeit
+from typing import List
+from typing import Optional
+
+from pydantic import validate_arguments as pydantic_validate_arguments
+from src.superannotate.lib.app.interface.types import NotEmptyStr
+from src.superannotate.lib.app.interface.types import validate_arguments
+
+
+def get_item_metadata(
+    self,
+    project: NotEmptyStr,
+    item_name: NotEmptyStr,
+    include_custom_metadata: bool = False,
+    items: Optional[List[NotEmptyStr]] = None,
+):
+    return project, item_name
+
+
+def run(count: int = 500):
+    cached_get_item_metadata = validate_arguments(get_item_metadata)
+
+    def build_per_call():
+        pydantic_validate_arguments(get_item_metadata)(
+            None, "project", "item", items=["a", "b"]
+        )
+
+    def cached():
+        cached_get_item_metadata(None, "project", "item", items=["a", "b"])
+
+    per_call_time = timeit.timeit(build_per_call, number=count)
+    cached_time = timeit.timeit(cached, number=count)
+    print(f"calls:                  {count}")
+    print(f"validator per call:     {per_call_time:.3f}s")
+    print(f"cached validator:       {cached_time:.3f}s")
+
+
+if __name__ == "__main__":
+    run(*map(int, sys.argv[1:]))
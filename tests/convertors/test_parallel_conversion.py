@@ -0,0 +1,83 @@
+import filecmp
+import os
+import tempfile
+from os.path import dirname
+from pathlib import Path
+from unittest import TestCase
+
+from src.superannotate.lib.app.input_converters import convert_project_type
+from src.superannotate.lib.app.input_converters import export_annotation
+from src.superannotate.lib.app.input_converters import import_annotation
+
+
+class TestParallelConversion(TestCase):
+    TEST_FOLDER_PATH = "data_set"
+    COCO_PATH = "converter_test/COCO/input/fromSuperAnnotate"
+
+    @property
+    def folder_path(self):
+        return Path(os.path.join(dirname(dirname(__file__)), self.TEST_FOLDER_PATH))
+
+    def _assert_same_output(self, convert):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            serial, parallel = Path(tmp_dir) / "serial", Path(tmp_dir) / "parallel"
+            convert(serial, 1)
+            convert(parallel, 2)
+            self._assert_same_files(serial, parallel)
+
+    def _assert_same_files(self, left, right):
+        comparison = filecmp.dircmp(left, right)
+        self.assertEqual(comparison.left_only + comparison.right_only, [])
+        # the colors of the generated classes are random
+        files = [f for f in comparison.common_files if f != "classes.json"]
+        self.assertEqual(
+            filecmp.cmpfiles(left, right, files, shallow=False)[1:], ([], [])
+        )
+        for sub_dir in comparison.common_dirs:
+            self._assert_same_files(left / sub_dir, right / sub_dir)
+
+    def test_coco_instance_segmentation(self):
+        self._assert_same_output(
+            lambda out_dir, workers: export_annotation(
+                self.folder_path / self.COCO_PATH / "cats_dogs_vector_instance_segm",
+                out_dir,
+                "COCO",
+                "instance_test",
+                "Vector",
+                "instance_segmentation",
+                workers=workers,
+            )
+        )
+
+    def test_coco_panoptic_segmentation(self):
+        self._assert_same_output(
+            lambda out_dir, workers: export_annotation(
+                self.folder_path / self.COCO_PATH / "cats_dogs_panoptic_segm",
+                out_dir,
+                "COCO",
+                "panoptic_test",
+                "Pixel",
+                "panoptic_segmentation",
+                workers=workers,
+            )
+        )
+
+    def test_yolo_object_detection(self):
+        self._assert_same_output(
+            lambda out_dir, workers: import_annotation(
+                self.folder_path / "converter_test/YOLO/input/toSuperAnnotate",
+                out_dir,
+                "YOLO",
+                "",
+                "Vector",
+                "object_detection",
+                workers=workers,
+            )
+        )
+
+    def test_convert_project_type(self):
+        self._assert_same_output(
+            lambda out_dir, workers: convert_project_type(
+                self.folder_path / "sample_project_pixel", out_dir, workers
+            )
+        )
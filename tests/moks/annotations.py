@@ -0,0 +1,85 @@
+import json
+import random
+from pathlib import Path
+
+VECTOR_SCHEMA_PATH = (
+    Path(__file__).resolve().parents[1] / "data_set" / "vector_annotation_schema.json"
+)
+
+EMAILS = ["annotator@superannotate.com", "qa.user+1@example.co", "admin@sa.io"]
+ROLES = ["Admin", "Annotator", "QA", "Customer"]
+
+
+def get_vector_schema() -> dict:
+    with open(VECTOR_SCHEMA_PATH) as file:
+        return json.load(file)
+
+
+def _user(rnd):
+    return {"email": rnd.choice(EMAILS), "role": rnd.choice(ROLES)}
+
+
+def _instance(rnd, index):
+    instance_type = rnd.choice(["bbox", "polygon", "polyline", "point", "ellipse"])
+    instance = {
+        "type": instance_type,
+        "classId": rnd.randint(1, 20),
+        "className": f"class_{index % 20}",
+        "probability": rnd.randint(0, 100),
+        "attributes": [
+            {"id": i, "groupId": i // 2, "name": f"a_{i}", "groupName": f"g_{i // 2}"}
+            for i in range(rnd.randint(0, 3))
+        ],
+        "createdAt": "2022-03-12T10:20:30.123Z",
+        "createdBy": _user(rnd),
+        "creationType": "Manual",
+        "visible": True,
+        "locked": False,
+        "error": None,
+    }
+    if instance_type == "bbox":
+        instance["points"] = {
+            "x1": rnd.uniform(0, 100),
+            "y1": rnd.uniform(0, 100),
+            "x2": rnd.uniform(100, 200),
+            "y2": rnd.uniform(100, 200),
+        }
+    elif instance_type in ("polygon", "polyline"):
+        instance["points"] = [
+            rnd.uniform(0, 500) for _ in range(rnd.randint(3, 20) * 2)
+        ]
+    elif instance_type == "point":
+        instance.update(x=rnd.uniform(0, 500), y=rnd.uniform(0, 500))
+    else:
+        instance.update(cx=10.5, cy=20, rx=3, ry=4.5, angle=0)
+    return instance
+
+
+def generate_vector_annotation(index: int, instances_count: int = 20) -> dict:
+    rnd = random.Random(index)
+    return {
+        "metadata": {
+            "name": f"image_{index}.jpg",
+            "width": 1920,
+            "height": 1080,
+            "status": "InProgress",
+            "pinned": False,
+            "isPredicted": False,
+            "projectId": 1,
+            "annotatorEmail": rnd.choice(EMAILS),
+            "qaEmail": None,
+            "lastAction": {"email": rnd.choice(EMAILS), "timestamp": 1647080430123},
+        },
+        "instances": [_instance(rnd, i) for i in range(instances_count)],
+        "tags": ["tag_1", "tag_2"],
+        "comments": [
+            {
+                "x": 1,
+                "y": 2.5,
+                "resolved": False,
+                "createdAt": "2022-03-12T10:20:30.123Z",
+                "createdBy": _user(rnd),
+                "correspondence": [{"text": "check", "email": rnd.choice(EMAILS)}],
+            }
+        ],
+    }
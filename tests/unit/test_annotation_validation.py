@@ -0,0 +1,138 @@
+import copy
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.reporter import Reporter
+from src.superannotate.lib.core.schema_compiler import compile_schema
+from src.superannotate.lib.core.usecases import ValidateAnnotationsUseCase
+from src.superannotate.lib.core.usecases import ValidateAnnotationUseCase
+from tests.moks.annotations import generate_vector_annotation
+from tests.moks.annotations import get_vector_schema
+
+
+INVALID_CHANGES = [
+    lambda a: a.pop("metadata"),
+    lambda a: a["metadata"].update(name=""),
+    lambda a: a["metadata"].update(width=-1),
+    lambda a: a["metadata"].update(status="Unknown"),
+    lambda a: a["metadata"]["lastAction"].update(email="not an email"),
+    lambda a: a["metadata"].update(qaEmail=1),
+    lambda a: a["instances"][0].pop("type"),
+    lambda a: a["instances"][0].update(type="cuboid"),
+    lambda a: a["instances"][1].update(probability=101),
+    lambda a: a["instances"][2].update(classId=1.5),
+    lambda a: a["instances"][3].update(createdAt="2022-03-12"),
+    lambda a: a["instances"][4]["createdBy"].update(role=None),
+    lambda a: a["instances"][5].update(visible=1),
+    lambda a: a["instances"].append({"type": "bbox", "points": {"x1": 1}}),
+    lambda a: a["instances"].append({"type": "point", "x": True, "y": 1}),
+    lambda a: a["tags"].append("tag_1"),
+    lambda a: a["comments"][0]["correspondence"][0].pop("text"),
+    lambda a: a.update(instances={}),
+]
+
+
+class TestSchemaCompiler(TestCase):
+    def setUp(self) -> None:
+        ValidateAnnotationUseCase.SCHEMAS.clear()
+        self.schema = get_vector_schema()
+        self.service_provider = MagicMock()
+        self.service_provider.annotations.get_schema.return_value = MagicMock(
+            ok=True, data=self.schema
+        )
+
+    def _get_use_case(self, annotations):
+        return ValidateAnnotationsUseCase(
+            reporter=Reporter(),
+            team_id=1,
+            project_type=1,
+            annotations=annotations,
+            service_provider=self.service_provider,
+        )
+
+    def _get_annotations(self):
+        annotations = [generate_vector_annotation(i) for i in range(5)]
+        for change in INVALID_CHANGES:
+            annotation = generate_vector_annotation(len(annotations))
+            change(annotation)
+            annotations.append(annotation)
+        return annotations
+
+    def test_matches_jsonschema(self):
+        validator, is_valid = self._get_use_case([])._get_validator("V1.00")
+        self.assertIsNotNone(is_valid)
+        for annotation in self._get_annotations():
+            errors = list(validator.iter_errors(copy.deepcopy(annotation)))
+            self.assertEqual(is_valid(annotation), not errors, annotation)
+
+    def test_standard_one_of(self):
+        is_valid = compile_schema(
+            {"oneOf": [{"type": "integer"}, {"type": "number", "minimum": 2}]}
+        )
+        self.assertTrue(is_valid(1))
+        self.assertTrue(is_valid(2.5))
+        self.assertFalse(is_valid(3))
+        self.assertFalse(is_valid("3"))
+
+    def test_recursive_reference(self):
+        is_valid = compile_schema(
+            {
+                "definitions": {
+                    "node": {
+                        "type": "object",
+                        "properties": {
+                            "children": {
+                                "type": "array",
+                                "items": {"$ref": "#/definitions/node"},
+                            }
+                        },
+                        "additionalProperties": False,
+                    }
+                },
+                "$ref": "#/definitions/node",
+            }
+        )
+        self.assertTrue(is_valid({"children": [{"children": [{}]}]}))
+        self.assertFalse(is_valid({"children": [{"child": []}]}))
+
+    def test_unsupported_schema(self):
+        self.assertIsNone(compile_schema({"$ref": "https://example.com/schema.json"}))
+
+    def test_batch_validation(self):
+        annotations = self._get_annotations()
+        expected = [
+            ValidateAnnotationUseCase(
+                reporter=Reporter(),
+                team_id=1,
+                project_type=1,
+                annotation=annotation,
+                service_provider=self.service_provider,
+            )
+            .execute()
+            .data
+            for annotation in annotations
+        ]
+        self.assertEqual(self._get_use_case(annotations).execute().data, expected)
+        self.assertEqual(expected[:5], [[]] * 5)
+        self.assertTrue(all(expected[5:]))
+        self.assertIn(
+            ("metadata.lastAction.email", "not an email  invalid email"),
+            expected[5 + 4],
+        )
+        self.service_provider.annotations.get_schema.assert_called_once()
+
+    def test_fallback_without_compiled_schema(self):
+        self.schema["properties"]["version"] = {
+            "$ref": "https://example.com/version.json"
+        }
+        use_case = self._get_use_case(
+            [generate_vector_annotation(1), {"metadata": {"name": ""}}]
+        )
+        self.assertIsNone(use_case._get_validator("V1.00")[1])
+        errors = use_case.execute().data
+        self.assertEqual(errors[0], [])
+        self.assertTrue(errors[1])
+
+    def test_empty_schema(self):
+        self.service_provider.annotations.get_schema.return_value.data = {}
+        self.assertEqual(self._get_use_case([{"metadata": 1}]).execute().data, [[]])
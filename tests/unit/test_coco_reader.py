@@ -0,0 +1,137 @@
+import filecmp
+import json
+import os
+import tempfile
+from os.path import dirname
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.superannotate.lib.app.input_converters.converters.coco_converters import (
+    coco_reader,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_reader import (
+    CocoReader,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_reader import (
+    ImageGroups,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_to_sa_vector import (
+    coco_instance_segmentation_to_sa_vector,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_to_sa_vector import (
+    find_grouped_ids,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_to_sa_vector import (
+    read_coco_summary,
+)
+
+COCO_JSON = {
+    "info": {"description": "[nested], {values}", "year": 2022},
+    "images": [{"id": i, "file_name": f"{i}.jpg"} for i in range(20)],
+    "licenses": [],
+    "annotations": [
+        {"id": i, "image_id": i % 7, "segmentation": [[1.5, 2, 3e-05, 4]] * 3}
+        for i in range(50)
+    ],
+    "categories": [{"id": 1, "name": 'café "quoted"'}],
+    "count": 123456789,
+}
+
+
+class TestCocoReader(TestCase):
+    TEST_FOLDER_PATH = "data_set/converter_test/COCO/input/toSuperAnnotate"
+
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp_dir.name)
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    @property
+    def folder_path(self):
+        return Path(os.path.join(dirname(dirname(__file__)), self.TEST_FOLDER_PATH))
+
+    def _write(self, data, **kwargs):
+        path = self.path / "coco.json"
+        with open(path, "w") as file:
+            json.dump(data, file, **kwargs)
+        return path
+
+    def test_iter_arrays(self):
+        keys = ("annotations", "categories", "images")
+        expected = [
+            (key, item) for key in COCO_JSON if key in keys for item in COCO_JSON[key]
+        ]
+        for indent in (None, 2):
+            for chunk_size in (1, 5, 1024):
+                reader = CocoReader(self._write(COCO_JSON, indent=indent))
+                reader.CHUNK_SIZE = chunk_size
+                self.assertEqual(list(reader.iter_arrays(*keys)), expected)
+        self.assertEqual(reader.read_array("licenses"), [])
+        self.assertEqual(list(CocoReader(self._write({})).iter_arrays(*keys)), [])
+
+    def test_invalid_json(self):
+        path = self.path / "coco.json"
+        path.write_text('{"images": [{"id": 1}')
+        with self.assertRaises(ValueError):
+            CocoReader(path).read_array("images")
+
+    def test_image_groups(self):
+        images = [(image["id"], image) for image in COCO_JSON["images"]]
+        instances = [
+            (annotation["image_id"], annotation)
+            for annotation in COCO_JSON["annotations"]
+        ]
+        expected = {
+            image["id"]: [
+                a for a in COCO_JSON["annotations"] if a["image_id"] == image["id"]
+            ]
+            for image in COCO_JSON["images"]
+        }
+        for buckets_count in (1, 3):
+            with ImageGroups(buckets_count) as image_groups:
+                for image_id, image in images:
+                    image_groups.add_image(image_id, image)
+                for image_id, instance in instances:
+                    image_groups.add_instance(image_id, instance)
+                grouped = list(image_groups)
+            self.assertEqual(len(grouped), len(images))
+            self.assertEqual(
+                {image["id"]: annotations for image, annotations in grouped}, expected
+            )
+
+    def test_conversion_with_buckets(self):
+        coco_path = self.folder_path / "instance_segmentation" / "instances_test.json"
+        in_memory, buckets = self.path / "in_memory", self.path / "buckets"
+        in_memory.mkdir()
+        buckets.mkdir()
+        coco_instance_segmentation_to_sa_vector(coco_path, in_memory)
+        with patch.object(coco_reader, "BUCKET_SIZE", 1024):
+            self.assertGreater(CocoReader(coco_path).get_buckets_count(), 1)
+            coco_instance_segmentation_to_sa_vector(coco_path, buckets)
+        files = os.listdir(in_memory)
+        self.assertEqual(sorted(files), sorted(os.listdir(buckets)))
+        self.assertEqual(
+            filecmp.cmpfiles(in_memory, buckets, files, shallow=False)[1:], ([], [])
+        )
+
+    def test_summary_with_any_ids(self):
+        ids = ["a", "b", "a", 1.0, 1.0, 2**63, 2**63, 5]
+        coco_json = {
+            "images": [{"id": 1}],
+            "annotations": [{"id": id_, "image_id": 1} for id_ in ids],
+            "categories": [{"id": 1, "name": "cat"}],
+        }
+        reader = CocoReader(self._write(coco_json))
+        categories, counts, grouped_ids = read_coco_summary(reader, group_ids=True)
+        self.assertEqual(categories, coco_json["categories"])
+        self.assertEqual(counts["annotations"], len(ids))
+        self.assertEqual(grouped_ids, {"a", 1, 2**63})
+        self.assertEqual(read_coco_summary(reader)[2], set())
+
+    def test_grouped_ids(self):
+        ids = [3, 1, 3.0, -(2**63), -(2**63), 2, "2", 2**64, 2**64]
+        self.assertEqual(find_grouped_ids(ids), {3, -(2**63), 2**64})
+        self.assertEqual(find_grouped_ids([]), set())
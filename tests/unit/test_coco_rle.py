@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+from src.superannotate.lib.app.input_converters.converters.coco_converters import (
+    coco_api,
+)
+
+
+def reference_to_string(rle_counts):
+    """
+    Scalar COCO encoder, the reference for the vectorized one.
+    """
+    rle_string = ""
+    for i, count in enumerate(rle_counts):
+        count = int(count)
+        if i > 2:
+            count -= int(rle_counts[i - 2])
+        more = True
+        while more:
+            value = count & 0x1F
+            count >>= 5
+            more = count != -1 if value & 0x10 else count != 0
+            rle_string += chr(value + 48 + (0x20 if more else 0))
+    return rle_string
+
+
+def reference_from_string(rle_string):
+    counts = []
+    i = 0
+    while i < len(rle_string):
+        more = True
+        k = 0
+        count = 0
+        while more:
+            value = ord(rle_string[i]) - 48
+            count |= (value & 0x1F) << 5 * k
+            more = value & 0x20
+            i += 1
+            k += 1
+            if not more and (value & 0x10):
+                count |= -1 << 5 * k
+        if len(counts) > 2:
+            count += counts[len(counts) - 2]
+        counts.append(count)
+    return counts
+
+
+def full_hd_mask(rng):
+    mask = np.zeros((1080, 1920), dtype=np.uint8)
+    for _ in range(200):
+        center = tuple(int(i) for i in rng.integers(0, 1900, 2))
+        cv2.circle(mask, center, int(rng.integers(5, 80)), 1, -1)
+    return mask
+
+
+class TestCocoRLE(TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(0)
+
+    def test_matches_reference(self):
+        for _ in range(200):
+            height, width = self.rng.integers(2, 50, 2)
+            mask = (self.rng.random((height, width)) < self.rng.random()).astype(
+                np.uint8
+            )
+            if mask.min() == mask.max():
+                continue
+            rle = coco_api._masktoRLE(mask)
+            rle_string = coco_api._toString(rle["counts"])
+            self.assertEqual(rle_string, reference_to_string(rle["counts"]))
+            self.assertEqual(
+                coco_api._frString(rle_string), reference_from_string(rle_string)
+            )
+            decoded = coco_api.decode({"counts": rle_string, "size": rle["size"]})
+            self.assertTrue((decoded == mask).all())
+
+    def test_large_counts(self):
+        counts = self.rng.integers(0, 10**7, 1000)
+        rle_string = coco_api._toString(counts)
+        self.assertEqual(rle_string, reference_to_string(counts))
+        self.assertEqual(coco_api._frString(rle_string), counts.tolist())
+
+    def test_empty(self):
+        self.assertEqual(coco_api._toString([]), "")
+        self.assertEqual(coco_api._frString(""), [])
+
+    def test_full_hd(self):
+        counts = coco_api._masktoRLE(full_hd_mask(self.rng))["counts"]
+        rle_string = coco_api._toString(counts)
+        self.assertEqual(rle_string, reference_to_string(counts))
+        self.assertEqual(
+            coco_api._frString(rle_string), reference_from_string(rle_string)
+        )
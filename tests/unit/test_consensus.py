@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import pandas as pd
+from src.superannotate.lib.app.analytics.common import calculate_consensus
+from src.superannotate.lib.app.analytics.common import consensus
+
+
+class TestConsensus(TestCase):
+    @staticmethod
+    def _bbox(x1, y1, x2, y2):
+        return {"x1": x1, "y1": y1, "x2": x2, "y2": y2}
+
+    def _get_df(self):
+        rows = []
+        for item_name in ("a.jpg", "b.jpg"):
+            rows.extend(
+                [
+                    (item_name, "f1", self._bbox(0, 0, 10, 10), "car"),
+                    (item_name, "f1", self._bbox(50, 50, 60, 60), "car"),
+                    (item_name, "f2", self._bbox(50, 50, 60, 65), "car"),
+                    (item_name, "f2", self._bbox(0, 0, 10, 5), "car"),
+                    (item_name, "f2", self._bbox(0, 0, 10, 10), "person"),
+                ]
+            )
+        return pd.DataFrame(
+            [
+                {
+                    "itemName": item_name,
+                    "folderName": folder_name,
+                    "meta": meta,
+                    "className": class_name,
+                    "creatorEmail": f"{folder_name}@example.com",
+                    "attributes": None,
+                }
+                for item_name, folder_name, meta, class_name in rows
+            ]
+        )
+
+    def test_bbox_consensus(self):
+        df = calculate_consensus(self._get_df(), "bbox")
+        item_df = df[df["itemName"] == "a.jpg"]
+        self.assertEqual(item_df["instanceId"].tolist(), [0, 0, 1, 1, 2])
+        self.assertEqual(item_df["folderName"].tolist(), ["f1", "f2", "f1", "f2", "f2"])
+        self.assertEqual(item_df["area"].tolist(), [100, 50, 100, 150, 100])
+        self.assertEqual(item_df["score"].tolist(), [0.5, 0.5, 100 / 150, 100 / 150, 0])
+        self.assertEqual(
+            consensus(self._get_df(), "a.jpg", "bbox"), item_df.to_dict("list")
+        )
+
+    def test_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            df = calculate_consensus(
+                self._get_df(), "bbox", executor=executor, chunk_size=1
+            )
+        pd.testing.assert_frame_equal(df, calculate_consensus(self._get_df(), "bbox"))
+
+    def test_tag_consensus(self):
+        df = pd.DataFrame(
+            {
+                "itemName": ["a.jpg", "b.jpg", "a.jpg", "a.jpg", "a.jpg"],
+                "folderName": ["f1", "f1", "f2", "f3", "f3"],
+                "instanceId": [0, 0, 0, 0, 1],
+                "creatorEmail": ["f1", "f1", "f2", "f3", "f3"],
+                "className": ["tag", "tag", "tag", "tag", "tag"],
+                "attributeGroupName": ["g", "g", "g", "g", float("nan")],
+                "attributeName": ["x", "x", "x", "y", float("nan")],
+            }
+        )
+        data = calculate_consensus(df, "tag")
+        self.assertEqual(
+            data["itemName"].tolist(), ["a.jpg", "a.jpg", "a.jpg", "a.jpg", "b.jpg"]
+        )
+        self.assertEqual(data["score"].tolist(), [1, 1, 0, 0, 0])
@@ -0,0 +1,183 @@
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import aiohttp
+from src.superannotate.lib.core.entities import BaseItemEntity
+from src.superannotate.lib.infrastructure.serviceprovider import ServiceProvider
+from src.superannotate.lib.infrastructure.services.http_client import AsyncHttpClient
+from src.superannotate.lib.infrastructure.services.http_client import HttpClient
+
+
+class TestPaginate(TestCase):
+    CHUNK_SIZE = 10
+
+    def setUp(self) -> None:
+        self.client = HttpClient("https://api.example.com", "token=1234")
+        self.requested_offsets = []
+        self._lock = threading.Lock()
+        self.in_flight, self.max_in_flight = 0, 0
+        self.threads = set()
+
+    def _get_request(self, items_count, count=None, delay=0, fail_offset=None):
+        count = items_count if count is None else count
+
+        def request(url, method="get", params=None, **_):
+            offset = int(parse_qs(urlparse(url).query)["offset"][0])
+            with self._lock:
+                self.requested_offsets.append(offset)
+                self.threads.add(threading.get_ident())
+                self.in_flight += 1
+                self.max_in_flight = max(self.in_flight, self.max_in_flight)
+            # every other page is slower, so the responses arrive out of order
+            time.sleep(delay * (2 if offset % 20 else 1))
+            with self._lock:
+                self.in_flight -= 1
+            if offset == fail_offset:
+                return MagicMock(ok=False, error="Failed", status=500)
+            data = [
+                {"id": i, "name": f"item_{i}"}
+                for i in range(offset, min(offset + self.CHUNK_SIZE, items_count))
+            ]
+            return MagicMock(ok=True, data={"data": data, "count": count}, count=count)
+
+        return request
+
+    def _paginate(self, request, item_type=None):
+        with patch.object(HttpClient, "request", side_effect=request):
+            return self.client.paginate(
+                "items?project_id=1", item_type=item_type, chunk_size=self.CHUNK_SIZE
+            )
+
+    def test_paginate(self):
+        response = self._paginate(self._get_request(95, delay=0.01), BaseItemEntity)
+        self.assertTrue(response.ok)
+        self.assertEqual([i.id for i in response.data], list(range(95)))
+        self.assertTrue(all(isinstance(i, BaseItemEntity) for i in response.data))
+        self.assertEqual(sorted(self.requested_offsets), list(range(0, 100, 10)))
+
+    def test_paginate_full_last_page(self):
+        response = self._paginate(self._get_request(100))
+        self.assertEqual([i["id"] for i in response.data], list(range(100)))
+        self.assertEqual(sorted(self.requested_offsets), list(range(0, 110, 10)))
+
+    def test_paginate_outdated_count(self):
+        response = self._paginate(self._get_request(55, count=20))
+        self.assertEqual([i["id"] for i in response.data], list(range(55)))
+
+    def test_paginate_error(self):
+        response = self._paginate(self._get_request(95, fail_offset=50))
+        self.assertFalse(response.ok)
+        self.assertEqual(response.error, "Failed")
+        self.assertEqual([i["id"] for i in response.data], list(range(50)))
+
+    def test_iter_paginate(self):
+        with patch.object(HttpClient, "request", side_effect=self._get_request(35)):
+            items = self.client.iter_paginate(
+                "items", item_type=BaseItemEntity, chunk_size=self.CHUNK_SIZE
+            )
+            self.assertEqual(next(items).id, 0)
+            self.assertEqual([i.id for i in items], list(range(1, 35)))
+
+    def test_iter_paginate_error(self):
+        with patch.object(
+            HttpClient, "request", side_effect=self._get_request(35, fail_offset=20)
+        ):
+            items = self.client.iter_paginate("items", chunk_size=self.CHUNK_SIZE)
+            with self.assertRaisesRegex(Exception, "Failed"):
+                list(items)
+
+    def test_concurrent_requests(self):
+        request = self._get_request(800, delay=0.02)
+        response = self._paginate(request)
+        self.assertEqual(len(response.data), 800)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, HttpClient.PAGINATION_WORKERS)
+
+    def test_nested_paginations_share_workers(self):
+        callers = 4
+        request = self._get_request(200, delay=0.01)
+        with patch.object(
+            HttpClient, "request", side_effect=request
+        ), concurrent.futures.ThreadPoolExecutor(max_workers=callers) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: self.client.paginate(
+                        "items?project_id=1", chunk_size=self.CHUNK_SIZE
+                    ),
+                    range(8),
+                )
+            )
+        self.assertTrue(all(len(response.data) == 200 for response in responses))
+        # the first pages are requested by the callers, the rest by the shared pool
+        self.assertLessEqual(
+            self.max_in_flight, HttpClient.PAGINATION_WORKERS + callers
+        )
+        self.assertLessEqual(len(self.threads), HttpClient.PAGINATION_WORKERS + callers)
+
+
+class TestAsyncHttpClient(TestCase):
+    def setUp(self) -> None:
+        self.client = AsyncHttpClient()
+
+    def test_shared_session(self):
+        async def use_session():
+            async with self.client.session() as session:
+                await asyncio.sleep(0.01)
+                return session
+
+        async def run():
+            async with self.client.session() as outer:
+                async with self.client.session() as nested:
+                    self.assertIs(nested, outer)
+                concurrent = await asyncio.gather(*(use_session() for _ in range(3)))
+                self.assertTrue(all(session is outer for session in concurrent))
+                self.assertFalse(outer.closed)
+            # the last user closes the session
+            self.assertTrue(outer.closed)
+            self.assertFalse(self.client._sessions)
+            async with self.client.session() as session:
+                self.assertIsNot(session, outer)
+
+        asyncio.run(run())
+
+    def test_session_per_loop(self):
+        async def get_session():
+            async with self.client.session() as session:
+                await asyncio.sleep(0.05)
+                return session
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = list(
+                executor.map(lambda _: asyncio.run(get_session()), range(2))
+            )
+        self.assertIsNot(sessions[0], sessions[1])
+        self.assertTrue(all(session.closed for session in sessions))
+
+    def test_settings_from_environment(self):
+        async def run(client):
+            async with client.session():
+                pass
+
+        environ = {
+            "SA_HTTP_LIMIT_PER_HOST": "5",
+            "SA_HTTP_DNS_CACHE_TTL": "7",
+            "SA_HTTP_KEEPALIVE_TIMEOUT": "9",
+        }
+        with patch.dict(os.environ, environ), patch.object(
+            aiohttp, "TCPConnector", wraps=aiohttp.TCPConnector
+        ) as connector:
+            service_provider = ServiceProvider(MagicMock())
+            asyncio.run(run(service_provider.async_client))
+        connector.assert_called_once()
+        kwargs = connector.call_args.kwargs
+        self.assertEqual(kwargs["limit_per_host"], 5)
+        self.assertEqual(kwargs["ttl_dns_cache"], 7)
+        self.assertEqual(kwargs["keepalive_timeout"], 9)
@@ -0,0 +1,52 @@
+import io
+from unittest import TestCase
+
+from PIL import Image
+from src.superannotate.lib.core.plugin import ImagePlugin
+
+
+class TestGenerateDerivatives(TestCase):
+    @staticmethod
+    def _image_bytes(size, image_format="JPEG", orientation=None):
+        buffer = io.BytesIO()
+        image = Image.linear_gradient("L").resize(size).convert("RGB")
+        exif = Image.Exif()
+        if orientation:
+            exif[ImagePlugin.EXIF_ORIENTATION] = orientation
+        image.save(buffer, image_format, exif=exif.tobytes())
+        return buffer.getvalue()
+
+    def test_jpeg_original_is_kept(self):
+        data = self._image_bytes((2400, 1200))
+        derivatives = ImagePlugin.generate_derivatives(data, "image.jpg", 100, 10**8)
+        self.assertEqual((derivatives.width, derivatives.height), (2400, 1200))
+        self.assertEqual(derivatives.low_resolution.getvalue(), data)
+        self.assertEqual(Image.open(derivatives.huge).size, (600, 300))
+        self.assertEqual(Image.open(derivatives.thumb).size, ImagePlugin.THUMB_SIZE)
+
+    def test_matches_plugin_output(self):
+        data = self._image_bytes((1000, 800), "PNG")
+        derivatives = ImagePlugin.generate_derivatives(data, "image.png", 60, 10**8)
+        plugin = ImagePlugin(io.BytesIO(data), 10**8)
+        huge, huge_width, huge_height = plugin.generate_huge()
+        low_resolution, _, _ = plugin.generate_low_resolution(quality=60)
+        self.assertEqual(
+            (derivatives.huge_width, derivatives.huge_height), (huge_width, huge_height)
+        )
+        self.assertEqual(Image.open(derivatives.huge).size, Image.open(huge).size)
+        self.assertEqual(
+            derivatives.low_resolution.getvalue(), low_resolution.getvalue()
+        )
+
+    def test_exif_rotation(self):
+        data = self._image_bytes((1200, 600), orientation=6)
+        derivatives = ImagePlugin.generate_derivatives(data, "image.jpg", 100, 10**8)
+        self.assertEqual((derivatives.width, derivatives.height), (1200, 600))
+        self.assertEqual((derivatives.huge_width, derivatives.huge_height), (600, 1200))
+        self.assertEqual(Image.open(derivatives.huge).size, (600, 1200))
+
+    def test_max_resolution(self):
+        with self.assertRaisesRegex(Exception, "too large"):
+            ImagePlugin.generate_derivatives(
+                self._image_bytes((100, 100)), "image.jpg", 60, 100
+            )
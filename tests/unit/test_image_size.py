@@ -0,0 +1,64 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+from PIL import Image
+from src.superannotate.lib.app.common import get_image_size
+
+
+class TestImageSize(TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp_dir.name)
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _save(self, name, height, width, orientation=None):
+        path = self.path / name
+        image = Image.fromarray(np.zeros((height, width, 3), dtype=np.uint8))
+        exif = Image.Exif()
+        if orientation:
+            exif[0x0112] = orientation
+        image.save(path, exif=exif)
+        return path
+
+    def test_matches_cv2(self):
+        for name in ("image.jpg", "image.png"):
+            for orientation in (None, 1, 3, 6, 8):
+                path = self._save(name, 10, 20, orientation)
+                self.assertEqual(
+                    get_image_size(path, memo=False), cv2.imread(str(path)).shape[:2]
+                )
+                self.assertEqual(
+                    get_image_size(path, oriented=False, memo=False),
+                    cv2.imread(str(path), cv2.IMREAD_UNCHANGED).shape[:2],
+                )
+
+    def test_memo(self):
+        path = self._save("image.png", 10, 20)
+        self.assertEqual(get_image_size(path), (10, 20))
+        self._save("image.png", 30, 40)
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(get_image_size(path), (30, 40))
+
+    def test_decompression_bomb(self):
+        path = self._save("image.png", 100, 200)
+        with patch.object(Image, "MAX_IMAGE_PIXELS", 1000):
+            with self.assertRaises(Image.DecompressionBombError):
+                Image.open(path)
+            self.assertEqual(get_image_size(path, memo=False), (100, 200))
+            self.assertEqual(
+                get_image_size(path, oriented=False, memo=False), (100, 200)
+            )
+
+    def test_missing_image(self):
+        with self.assertRaises(OSError):
+            get_image_size(self.path / "missing.jpg")
+        (self.path / "invalid.jpg").write_bytes(b"not an image")
+        with self.assertRaises(OSError):
+            get_image_size(self.path / "invalid.jpg")
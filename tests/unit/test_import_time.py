@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+
+SRC_PATH = Path(__file__).resolve().parents[2] / "src"
+
+HEAVY_MODULES = ("pandas", "plotly", "cv2", "ffmpeg", "flask", "PIL.Image")
+
+
+class TestImportTime(TestCase):
+    # generous on purpose, the eager imports took about a second
+    IMPORT_TIME_BUDGET = 0.5
+
+    @staticmethod
+    def _run(code, *args):
+        env = dict(os.environ, SA_VERSION_CHECK="False", PYTHONPATH=str(SRC_PATH))
+        return subprocess.run(
+            [sys.executable, *args, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def _get_loaded_heavy_modules(self, statement):
+        output = self._run(
+            f"import sys\n{statement}\n"
+            f"import json\n"
+            f"print(json.dumps([i for i in {HEAVY_MODULES!r} if i in sys.modules]))"
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_package_import_is_lazy(self):
+        self.assertEqual(self._get_loaded_heavy_modules("import superannotate"), [])
+
+    def test_client_import_is_lazy(self):
+        self.assertEqual(
+            self._get_loaded_heavy_modules("from superannotate import SAClient"), []
+        )
+
+    def test_lazy_attributes(self):
+        output = self._run(
+            "import superannotate\n"
+            "print(superannotate.enums.ProjectType.VECTOR.name)\n"
+            "print(callable(superannotate.import_annotation))\n"
+            "print('SAClient' in dir(superannotate))"
+        ).stdout
+        self.assertEqual(output.split(), ["Vector", "True", "True"])
+        with self.assertRaises(subprocess.CalledProcessError):
+            self._run("import superannotate\nsuperannotate.unknown")
+
+    def test_import_time_budget(self):
+        stderr = self._run("import superannotate", "-X", "importtime").stderr
+        # import time: self [us] | cumulative | imported package
+        cumulative = next(
+            int(line.split("|")[1])
+            for line in stderr.splitlines()
+            if line.split("|")[-1].strip() == "superannotate"
+        )
+        self.assertLess(cumulative / 10**6, self.IMPORT_TIME_BUDGET)
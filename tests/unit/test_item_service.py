@@ -0,0 +1,116 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.superannotate.lib.core.entities import AttachmentEntity
+from src.superannotate.lib.core.entities import BaseItemEntity
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases import AttachItems
+from src.superannotate.lib.infrastructure.services.item import ItemService
+
+
+class TestMapByNames(TestCase):
+    def setUp(self) -> None:
+        self.project = ProjectEntity(id=1, team_id=1, name="project", type=1)
+        self.folder = FolderEntity(id=1, name="root", project_id=1)
+        self.existing_names = {f"item_{i}" for i in range(0, 1000, 3)}
+        self.client = MagicMock()
+        self.service = ItemService(self.client)
+        self.failures = {}
+        self._lock = threading.Lock()
+        self.in_flight, self.max_in_flight = 0, 0
+
+    def _request(self, url, method, data, **_):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+            failures = self.failures.get(data["names"][0], 0)
+            if failures:
+                self.failures[data["names"][0]] -= 1
+                return MagicMock(ok=False, status=503, error="Unavailable")
+        return MagicMock(
+            ok=True,
+            status=200,
+            data=[
+                BaseItemEntity(name=name)
+                for name in data["names"]
+                if name in self.existing_names
+            ],
+        )
+
+    def _map_by_names(self, names):
+        self.client.request.side_effect = self._request
+        return self.service.map_by_names(self.project, self.folder, names)
+
+    def test_mapping(self):
+        names = [f"item_{i}" for i in range(1000)]
+        response = self._map_by_names(names)
+        self.assertTrue(response.ok)
+        # the 5 chunks are requested concurrently
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, ItemService.LIST_BY_NAMES_WORKERS)
+        self.assertEqual(self.client.request.call_count, 5)
+        self.assertEqual(
+            list(response.data), [i for i in names if i in self.existing_names]
+        )
+        self.assertEqual(response.data["item_3"].name, "item_3")
+
+    def test_list_by_names(self):
+        self.client.request.side_effect = self._request
+        response = self.service.list_by_names(
+            self.project, self.folder, ["item_0", "item_1", "item_3"]
+        )
+        self.assertEqual([i.name for i in response.data], ["item_0", "item_3"])
+        self.assertEqual(
+            self.service.list_by_names(self.project, self.folder, []).data, []
+        )
+
+    @patch("time.sleep", lambda *_: None)
+    def test_retry(self):
+        self.failures["item_200"] = ItemService.LIST_BY_NAMES_RETRIES - 1
+        response = self._map_by_names([f"item_{i}" for i in range(400)])
+        self.assertTrue(response.ok)
+        self.assertEqual(len(response.data), 134)
+        self.assertEqual(
+            self.client.request.call_count, ItemService.LIST_BY_NAMES_RETRIES + 1
+        )
+
+    @patch("time.sleep", lambda *_: None)
+    def test_error(self):
+        self.failures["item_200"] = ItemService.LIST_BY_NAMES_RETRIES
+        response = self._map_by_names([f"item_{i}" for i in range(400)])
+        self.assertFalse(response.ok)
+        self.assertEqual(response.error, "Unavailable")
+
+
+class TestAttachItems(TestCase):
+    def test_names_repeated_across_chunks(self):
+        service_provider = MagicMock()
+        service_provider.items.map_by_names.return_value = MagicMock(
+            ok=True, data={"existing": BaseItemEntity(name="existing")}
+        )
+        service_provider.items.attach.return_value = MagicMock(ok=True)
+        names = ["existing", "item_0", "item_1", "item_0", "item_2", "item_1"]
+        use_case = AttachItems(
+            reporter=MagicMock(),
+            project=ProjectEntity(id=1, team_id=1, name="project", type=2),
+            folder=FolderEntity(id=1, name="root", project_id=1),
+            attachments=[
+                AttachmentEntity(name=name, url=f"https://host/{i}")
+                for i, name in enumerate(names)
+            ],
+            annotation_status="NotStarted",
+            service_provider=service_provider,
+        )
+        use_case.CHUNK_SIZE = 2
+        use_case._validate = lambda: None
+        attached, duplications = use_case.execute().data
+        self.assertEqual(attached, ["item_0", "item_1", "item_2"])
+        self.assertEqual(duplications, ["existing", "item_0", "item_1"])
+        self.assertEqual(service_provider.items.attach.call_count, 3)
@@ -0,0 +1,59 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.reporter import Reporter
+from src.superannotate.lib.core.usecases import IterAnnotations
+
+
+class TestIterAnnotations(TestCase):
+    def setUp(self) -> None:
+        self.requested = []
+
+        async def iter_small_annotations(items, **_):
+            for name in items:
+                self.requested.append(name)
+                yield {"metadata": {"name": name}}
+
+        async def get_big_annotation(item, **_):
+            return {"metadata": {"name": item["name"]}}
+
+        def sort_items_by_size(item_names, **_):
+            return {
+                "small": [{"name": i} for i in item_names if not i.startswith("big")],
+                "large": [{"name": i} for i in item_names if i.startswith("big")],
+            }
+
+        self.service_provider = MagicMock()
+        annotations = self.service_provider.annotations
+        annotations.iter_small_annotations.side_effect = iter_small_annotations
+        annotations.get_big_annotation.side_effect = get_big_annotation
+        annotations.sort_items_by_size.side_effect = sort_items_by_size
+
+    def _use_case(self, item_names, batch_size):
+        return IterAnnotations(
+            reporter=Reporter(log_info=False, log_warning=False),
+            project=ProjectEntity(id=1, team_id=1, name="p", type=1),
+            folder=FolderEntity(id=1, name="root"),
+            item_names=item_names,
+            service_provider=self.service_provider,
+            batch_size=batch_size,
+            show_process=False,
+        )
+
+    def test_yields_all_annotations(self):
+        names = ["a", "b", "big_c", "d", "big_e"]
+        use_case = self._use_case(names, batch_size=2)
+        received = [i["metadata"]["name"] for i in use_case.execute()]
+        self.assertEqual(sorted(received), sorted(names))
+        self.assertFalse(use_case.response.errors)
+        self.assertEqual(
+            self.service_provider.annotations.sort_items_by_size.call_count, 3
+        )
+
+    def test_stream_is_read_lazily(self):
+        iterator = self._use_case(["a", "b", "c"], batch_size=10).execute()
+        next(iterator)
+        self.assertEqual(self.requested, ["a"])
+        iterator.close()
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+from src.superannotate.lib.core.label_map import LabelMap
+from src.superannotate.lib.core.label_map import pack_color
+
+
+class TestLabelMap(TestCase):
+    def setUp(self) -> None:
+        random = np.random.RandomState(0)
+        palette = np.array(
+            [[0, 0, 0, 0], [0, 0, 1, 255], [0, 0, 2, 255], [255, 0, 0, 255]],
+            dtype=np.uint8,
+        )
+        self.image = palette[random.randint(0, len(palette), (30, 40))]
+        self.image[0, :] = palette[3]
+        self.colors = [pack_color(color) for color in palette]
+
+    def _get_reference_mask(self, color):
+        packed = np.array(
+            [pack_color(pixel) for pixel in self.image.reshape(-1, 4)]
+        ).reshape(self.image.shape[:2])
+        return (packed == color).astype(np.uint8) * 255
+
+    def test_get_pixels(self):
+        label_map = LabelMap(self.image)
+        for color in self.colors:
+            expected = np.flatnonzero(self._get_reference_mask(color))
+            self.assertEqual(label_map.get_pixels(color).tolist(), expected.tolist())
+        self.assertEqual(label_map.get_pixels(pack_color((1, 2, 3, 4))).size, 0)
+
+    def test_get_mask_contours(self):
+        label_map = LabelMap(self.image)
+        for color in self.colors:
+            expected, _ = cv2.findContours(
+                self._get_reference_mask(color),
+                cv2.RETR_EXTERNAL,
+                cv2.CHAIN_APPROX_SIMPLE,
+            )
+            mask, offset = label_map.get_mask(color)
+            contours, _ = cv2.findContours(
+                mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=offset
+            )
+            self.assertEqual(
+                [contour.tolist() for contour in contours],
+                [contour.tolist() for contour in expected],
+            )
+        self.assertIsNone(label_map.get_mask(pack_color((1, 2, 3, 4))))
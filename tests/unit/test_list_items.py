@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.superannotate.lib.core.conditions import Condition
+from src.superannotate.lib.core.entities import BaseItemEntity
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases import ListItems
+from src.superannotate.lib.core.usecases.base import map_folders
+
+
+class TestMapFolders(TestCase):
+    def test_order(self):
+        def func(delay):
+            time.sleep(delay)
+            return delay
+
+        delays = [0.03, 0.01, 0.02, 0]
+        self.assertEqual(list(map_folders(func, delays)), delays)
+
+    def test_concurrency_cap(self):
+        lock = threading.Lock()
+        running, max_running = 0, 0
+
+        def func(folder):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(running, max_running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return folder
+
+        with patch.dict(os.environ, {"SA_FOLDER_WORKERS": "3"}):
+            self.assertEqual(list(map_folders(func, range(12))), list(range(12)))
+        self.assertEqual(max_running, 3)
+
+
+class TestListItems(TestCase):
+    FOLDERS_COUNT = 20
+    ITEMS_COUNT = 5
+
+    def setUp(self) -> None:
+        self.project = ProjectEntity(id=1, name="project", type=1)
+        self.root = FolderEntity(id=0, name="root", project_id=1, is_root=True)
+        self.folders = [self.root] + [
+            FolderEntity(id=i, name=f"folder_{i}", project_id=1)
+            for i in range(1, self.FOLDERS_COUNT)
+        ]
+        self.service_provider = MagicMock()
+        self.service_provider.folders.list.return_value.data = self.folders
+        self.service_provider.items.iterate.side_effect = self._iterate
+        self._lock = threading.Lock()
+        self.in_flight, self.max_in_flight = 0, 0
+
+    def _iterate(self, condition: Condition):
+        query = condition.build_query()
+        folder_id = int(query.split("folder_id=")[1].split("&")[0])
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        return (
+            BaseItemEntity(id=folder_id * 100 + i, name=f"{folder_id}_{i}.jpg")
+            for i in range(self.ITEMS_COUNT)
+        )
+
+    def test_recursive(self):
+        response = ListItems(
+            project=self.project,
+            folder=self.root,
+            service_provider=self.service_provider,
+            search_condition=Condition.get_empty_condition(),
+            recursive=True,
+        ).execute()
+        # the folders are listed concurrently
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertEqual(
+            [i.name for i in response.data],
+            [
+                f"{folder.id}_{i}.jpg"
+                for folder in self.folders
+                for i in range(self.ITEMS_COUNT)
+            ],
+        )
+        self.assertEqual(response.data[0].path, "project")
+        self.assertEqual(response.data[-1].path, "project/folder_19")
+
+    def test_not_recursive(self):
+        response = ListItems(
+            project=self.project,
+            folder=self.folders[3],
+            service_provider=self.service_provider,
+            search_condition=Condition.get_empty_condition(),
+        ).execute()
+        self.assertEqual(
+            [i.name for i in response.data],
+            [f"3_{i}.jpg" for i in range(self.ITEMS_COUNT)],
+        )
+        self.service_provider.folders.list.assert_not_called()
@@ -0,0 +1,143 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.app.interface.sdk_interface import SAClient
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.reporter import Reporter
+from src.superannotate.lib.core.usecases import IterQueryEntitiesUseCase
+from src.superannotate.lib.core.usecases import QueryEntitiesUseCase
+from src.superannotate.lib.infrastructure.controller import Controller
+from src.superannotate.lib.infrastructure.serviceprovider import ServiceProvider
+
+
+class TestSaqulQuery(TestCase):
+    ITEMS_COUNT = 1020
+
+    def setUp(self) -> None:
+        self.project = ProjectEntity(id=1, team_id=1, name="project", type=1)
+        self.folder = FolderEntity(id=1, name="root", project_id=1, is_root=True)
+        self.client = MagicMock()
+        self.client.request.side_effect = self._request
+        self.service_provider = ServiceProvider(self.client)
+        self.requested_indexes = []
+        self.fail_index = None
+        self._lock = threading.Lock()
+        self.in_flight, self.max_in_flight = 0, 0
+
+    def _request(self, url, method, params=None, data=None, **_):
+        if url == ServiceProvider.URL_VALIDATE_SAQUL_QUERY:
+            return MagicMock(
+                ok=True, data={"isValidQuery": True, "parsedQuery": data["query"]}
+            )
+        image_index = data["image_index"]
+        with self._lock:
+            self.requested_indexes.append(image_index)
+            self.in_flight += 1
+            self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        if image_index == self.fail_index:
+            return MagicMock(ok=False, error="Failed")
+        return MagicMock(
+            ok=True,
+            data=[
+                {
+                    "name": f"item_{i}",
+                    "folder_name": "folder" if i % 2 else "root",
+                    "is_root_folder": not i % 2,
+                }
+                for i in range(
+                    image_index,
+                    min(
+                        image_index + ServiceProvider.SAQUL_CHUNK_SIZE, self.ITEMS_COUNT
+                    ),
+                )
+            ],
+        )
+
+    def test_saqul_query(self):
+        response = self.service_provider.saqul_query(self.project, query="q")
+        self.assertTrue(response.ok)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, ServiceProvider.SAQUL_PREFETCH_PAGES)
+        self.assertEqual(
+            [i["name"] for i in response.data],
+            [f"item_{i}" for i in range(self.ITEMS_COUNT)],
+        )
+        # the prefetched pages after the last one are not awaited
+        self.assertLessEqual(
+            max(self.requested_indexes),
+            self.ITEMS_COUNT + ServiceProvider.SAQUL_CHUNK_SIZE * 3,
+        )
+
+    def test_saqul_query_default_prefetch(self):
+        response = self.service_provider.saqul_query(
+            self.project, query="q", prefetch=None
+        )
+        self.assertEqual(len(response.data), self.ITEMS_COUNT)
+        self.assertLessEqual(self.max_in_flight, ServiceProvider.SAQUL_PREFETCH_PAGES)
+        self.assertLessEqual(
+            max(self.requested_indexes),
+            self.ITEMS_COUNT + ServiceProvider.SAQUL_CHUNK_SIZE * 3,
+        )
+
+    def test_saqul_query_error(self):
+        self.fail_index = 500
+        response = self.service_provider.saqul_query(self.project, query="q")
+        self.assertFalse(response.ok)
+        self.assertEqual(response.error, "Failed")
+
+    def _get_use_case(self, use_case_class):
+        return use_case_class(
+            reporter=Reporter(),
+            project=self.project,
+            folder=self.folder,
+            service_provider=self.service_provider,
+            query="q",
+            prefetch=2,
+        )
+
+    def test_query_entities(self):
+        response = self._get_use_case(QueryEntitiesUseCase).execute()
+        self.assertEqual(len(response.data), self.ITEMS_COUNT)
+        self.assertEqual(response.data[0].path, "project")
+        self.assertEqual(response.data[1].path, "project/folder")
+
+    def test_iter_query_entities(self):
+        use_case = self._get_use_case(IterQueryEntitiesUseCase)
+        self.assertTrue(use_case.is_valid())
+        items = use_case.execute()
+        self.assertEqual(next(items).name, "item_0")
+        # only the first pages are requested
+        self.assertLess(len(self.requested_indexes), 5)
+        self.assertEqual(
+            [i.name for i in items],
+            [f"item_{i}" for i in range(1, self.ITEMS_COUNT)],
+        )
+        self.assertFalse(use_case.response.errors)
+
+    def test_iter_query_entities_error(self):
+        self.fail_index = 100
+        use_case = self._get_use_case(IterQueryEntitiesUseCase)
+        self.assertEqual(len(list(use_case.execute())), 100)
+        self.assertIn("Failed", str(use_case.response.errors))
+
+    def test_iter_query_prefetch(self):
+        controller = MagicMock(service_provider=self.service_provider)
+        controller.get_project.return_value = self.project
+        controller.get_folder.return_value = self.folder
+        controller.iter_query_entities.side_effect = (
+            lambda *args: Controller.iter_query_entities(controller, *args)
+        )
+        client = MagicMock(controller=controller)
+        items = list(SAClient.iter_query(client, "project", "q", prefetch=2))
+        self.assertEqual(len(items), self.ITEMS_COUNT)
+        self.assertEqual(controller.iter_query_entities.call_args.args[-1], 2)
+        self.assertLessEqual(self.max_in_flight, 2)
+        for prefetch in (0, -1, "2"):
+            with self.assertRaisesRegex(Exception, "prefetch"):
+                SAClient.iter_query(client, "project", "q", prefetch=prefetch)
@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from requests import Response
+from src.superannotate.lib.core.service_types import ServiceResponse
+from src.superannotate.lib.infrastructure.schema_cache import SchemaCache
+from src.superannotate.lib.infrastructure.services import annotation
+from src.superannotate.lib.infrastructure.services.annotation import (
+    AnnotationService,
+)
+
+SCHEMA = {"type": "object", "required": ["metadata"]}
+
+
+class TestSchemaCache(TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.client = MagicMock()
+        self.client.request.return_value = MagicMock(
+            ok=True, status=200, data=SCHEMA, headers={"ETag": '"v1"'}
+        )
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _get_schema(self, **env):
+        service = AnnotationService(
+            self.client, MagicMock(), SchemaCache(self._tmp_dir.name)
+        )
+        with patch.dict(os.environ, env):
+            return service.get_schema(1, "V1.00")
+
+    def test_cold_start_from_disk(self):
+        self.assertEqual(self._get_schema().data, SCHEMA)
+        self.assertEqual(self._get_schema().data, SCHEMA)
+        self.client.request.assert_called_once()
+        self.assertIsNone(self.client.request.call_args.kwargs["headers"])
+
+    def test_revalidation(self):
+        self._get_schema()
+        self.client.request.return_value = MagicMock(ok=False, status=304)
+        self.assertEqual(self._get_schema(SA_SCHEMA_CACHE_TTL="0").data, SCHEMA)
+        self.assertEqual(
+            self.client.request.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+        # the revalidated entry is fresh again
+        self._get_schema()
+        self.assertEqual(self.client.request.call_count, 2)
+
+    def test_changed_schema(self):
+        self._get_schema()
+        changed = {**SCHEMA, "required": []}
+        self.client.request.return_value = MagicMock(
+            ok=True, status=200, data=changed, headers={"ETag": '"v2"'}
+        )
+        self.assertEqual(self._get_schema(SA_SCHEMA_CACHE_TTL="0").data, changed)
+        self.assertEqual(self._get_schema().data, changed)
+        self.assertEqual(self.client.request.call_count, 2)
+
+    def test_lowercase_etag_header(self):
+        response = Response()
+        response.status_code = 200
+        response.headers["etag"] = '"v1"'
+        response._content = json.dumps(SCHEMA).encode()
+        self.client.request.return_value = ServiceResponse(response)
+        self._get_schema()
+        self.client.request.return_value = MagicMock(ok=False, status=304)
+        self.assertEqual(self._get_schema(SA_SCHEMA_CACHE_TTL="0").data, SCHEMA)
+        self.assertEqual(
+            self.client.request.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+
+    def test_stale_schema_on_network_error(self):
+        self._get_schema()
+        # the service catches the exception class of its own import path
+        self.client.request.side_effect = annotation.AppException("Unknown exception.")
+        self.assertEqual(self._get_schema(SA_SCHEMA_CACHE_TTL="0").data, SCHEMA)
+
+    def test_offline(self):
+        with self.assertRaisesRegex(Exception, "offline"):
+            self._get_schema(SA_SCHEMA_CACHE_OFFLINE="True")
+        self._get_schema()
+        response = self._get_schema(
+            SA_SCHEMA_CACHE_OFFLINE="True", SA_SCHEMA_CACHE_TTL="0"
+        )
+        self.assertEqual(response.data, SCHEMA)
+        self.client.request.assert_called_once()
+
+    def test_invalid_entry(self):
+        self._get_schema()
+        for root, _, files in os.walk(self._tmp_dir.name):
+            for file in files:
+                with open(os.path.join(root, file), "w") as f:
+                    f.write("{")
+        self.assertEqual(self._get_schema().data, SCHEMA)
+        self.assertEqual(self.client.request.call_count, 2)
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import threading
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.superannotate.lib.infrastructure.stream_data_handler import FrameDecoder
+from src.superannotate.lib.infrastructure.stream_data_handler import StreamedAnnotations
+
+
+class TestFrameDecoder(TestCase):
+    DELIMITER = StreamedAnnotations.DELIMITER
+
+    def _decode(self, chunks):
+        decoder = FrameDecoder(self.DELIMITER)
+        frames = []
+        for chunk in chunks:
+            frames.extend(json.loads(frame) for frame in decoder.feed(chunk))
+        tail = decoder.flush()
+        if tail:
+            frames.append(json.loads(tail))
+        return frames
+
+    def test_frames_in_single_chunk(self):
+        payload = self.DELIMITER.join(json.dumps({"id": i}).encode() for i in range(3))
+        self.assertEqual(self._decode([payload]), [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_frame_split_across_chunks(self):
+        payload = (
+            self.DELIMITER.join(
+                json.dumps({"id": i, "data": "x" * 100}).encode() for i in range(5)
+            )
+            + self.DELIMITER
+        )
+        for size in (1, 3, 7, len(self.DELIMITER), 64):
+            chunks = [payload[i : i + size] for i in range(0, len(payload), size)]
+            frames = self._decode(chunks)
+            self.assertEqual([frame["id"] for frame in frames], list(range(5)))
+
+    def test_delimiter_on_chunk_boundary(self):
+        first, second = json.dumps({"id": 1}).encode(), json.dumps({"id": 2}).encode()
+        frames = self._decode([first, self.DELIMITER + second, self.DELIMITER])
+        self.assertEqual(frames, [{"id": 1}, {"id": 2}])
+
+
+class TestStoreChunk(TestCase):
+    class FakeClient:
+        @asynccontextmanager
+        async def session(self):
+            yield None
+
+    def test_annotations_are_written_through(self):
+        names = [f"image_{i}.jpg" for i in range(10)]
+
+        async def fetch(*_, **__):
+            for name in names:
+                yield {"metadata": {"name": name}}
+
+        handler = StreamedAnnotations({}, MagicMock(), async_client=self.FakeClient())
+        handler.fetch = fetch
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            asyncio.run(handler.store_chunk("post", "url", tmp_dir, "___objects.json"))
+            self.assertEqual(
+                sorted(os.listdir(tmp_dir)),
+                sorted(f"{name}___objects.json" for name in names),
+            )
+        self.assertEqual(handler._items_downloaded, len(names))
+        self.assertFalse(handler._annotations)
+
+
+class TestParseFrames(TestCase):
+    def test_large_frames_are_parsed_in_executor(self):
+        frames = [b'{"id": 0}', json.dumps({"data": "x" * 100}).encode()]
+        threads = []
+        json_loads = json.loads
+
+        def loads(frame):
+            threads.append(threading.current_thread())
+            return json_loads(frame)
+
+        async def parse(handler):
+            return [await handler._parse(frame) for frame in frames]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            handler = StreamedAnnotations({}, MagicMock(), parse_executor=executor)
+            handler.EXECUTOR_FRAME_SIZE = 50
+            with patch("json.loads", side_effect=loads):
+                self.assertEqual(
+                    asyncio.run(parse(handler)), [{"id": 0}, {"data": "x" * 100}]
+                )
+        self.assertIs(threads[0], threading.main_thread())
+        self.assertIsNot(threads[1], threading.main_thread())
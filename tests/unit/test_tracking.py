@@ -0,0 +1,75 @@
+import json
+import os
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
+
+from src.superannotate.lib.app.interface.base_interface import TrackingQueue
+
+
+class TestTrackingQueue(TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock(host="https://api.example.com")
+        self.client.controller.team_data.creator_id = "user@example.com"
+        self.client.controller.team_data.name = "team"
+
+    @staticmethod
+    def _get_queue(max_size=TrackingQueue.MAX_SIZE):
+        tracking_queue = TrackingQueue()
+        tracking_queue._queue.maxsize = max_size
+        # keep the events in the queue until they are flushed
+        tracking_queue._thread = MagicMock()
+        tracking_queue._consumer = MagicMock()
+        return tracking_queue
+
+    def test_flush(self):
+        tracking_queue = self._get_queue()
+        for i in range(3):
+            self.assertTrue(
+                tracking_queue.put(self.client, "get_item_metadata", {"index": i})
+            )
+        tracking_queue._consumer.send.assert_not_called()
+        tracking_queue.flush()
+        self.assertEqual(tracking_queue._consumer.send.call_count, 3)
+        tracking_queue._consumer.flush.assert_called_once()
+        endpoint, message = tracking_queue._consumer.send.call_args[0]
+        event = json.loads(message)
+        self.assertEqual(endpoint, "events")
+        self.assertEqual(event["event"], "get_item_metadata")
+        self.assertEqual(event["properties"]["index"], 2)
+        self.assertEqual(event["properties"]["Team"], "team")
+
+    def test_event_time_taken_at_put(self):
+        tracking_queue = self._get_queue()
+        with patch("time.time", return_value=1000.5):
+            tracking_queue.put(self.client, "get_item_metadata", {})
+        with patch("time.time", return_value=2000):
+            tracking_queue.flush()
+        event = json.loads(tracking_queue._consumer.send.call_args[0][1])
+        self.assertEqual(event["properties"]["time"], 1000)
+
+    def test_team_resolved_on_send(self):
+        team_data = PropertyMock(return_value=self.client.controller.team_data)
+        type(self.client.controller).team_data = team_data
+        tracking_queue = self._get_queue()
+        tracking_queue.put(self.client, "get_item_metadata", {})
+        team_data.assert_not_called()
+        tracking_queue.flush()
+        team_data.assert_called_once()
+        event = json.loads(tracking_queue._consumer.send.call_args[0][1])
+        self.assertEqual(event["properties"]["Team"], "team")
+
+    def test_drop_on_overflow(self):
+        tracking_queue = self._get_queue(max_size=2)
+        results = [
+            tracking_queue.put(self.client, "get_item_metadata", {}) for _ in range(5)
+        ]
+        self.assertEqual(results, [True, True, False, False, False])
+        self.assertEqual(tracking_queue.dropped_count, 3)
+
+    def test_disable(self):
+        with patch.dict(os.environ, {"SA_TRACKING": "False"}):
+            self.assertFalse(TrackingQueue.is_enabled())
+        with patch.dict(os.environ, {"SA_TRACKING": "True"}):
+            self.assertTrue(TrackingQueue.is_enabled())
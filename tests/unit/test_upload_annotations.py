@@ -0,0 +1,189 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import BaseItemEntity
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.reporter import Reporter
+from src.superannotate.lib.core.usecases import UploadAnnotationsFromFolderUseCase
+from src.superannotate.lib.core.usecases import UploadAnnotationsUseCase
+
+
+class BaseUploadAnnotationsTest(TestCase):
+    ITEMS_COUNT = 40
+
+    def setUp(self) -> None:
+        self.project = ProjectEntity(id=1, team_id=1, name="project", type=1)
+        self.folder = FolderEntity(id=1, name="root", project_id=1, is_root=True)
+        self.service_provider = MagicMock()
+        self.service_provider.items.map_by_names.side_effect = self._map_by_names
+        self.service_provider.annotations.upload_small_annotations.side_effect = (
+            self._upload_small_annotations
+        )
+        self.service_provider.annotations.get_schema.return_value = MagicMock(
+            ok=True,
+            data={
+                "type": "object",
+                "properties": {"instances": {"type": "array"}},
+            },
+        )
+        self.events = []
+        self.validated_chunks = []
+
+    @staticmethod
+    def _map_by_names(project, folder, names):
+        return MagicMock(
+            ok=True,
+            data={
+                name: BaseItemEntity(id=i, name=name) for i, name in enumerate(names)
+            },
+        )
+
+    async def _upload_small_annotations(self, project, folder, items_name_file_map):
+        self.events.append(("upload", time.time()))
+        await asyncio.sleep(0.05)
+        return MagicMock(
+            ok=True,
+            data=MagicMock(
+                failed_items=[],
+                missing_resources=MagicMock(
+                    classes=[], attribute_groups=[], attributes=[]
+                ),
+            ),
+        )
+
+    def _get_annotations(self, invalid=()):
+        return [
+            {
+                "metadata": {"name": f"item_{i}.jpg"},
+                "instances": "invalid" if i in invalid else [],
+            }
+            for i in range(self.ITEMS_COUNT)
+        ]
+
+
+class TestUploadAnnotations(BaseUploadAnnotationsTest):
+    def _get_use_case(self, annotations):
+        use_case = UploadAnnotationsUseCase(
+            reporter=Reporter(log_info=False, log_warning=False),
+            project=self.project,
+            folder=self.folder,
+            annotations=annotations,
+            service_provider=self.service_provider,
+            keep_status=True,
+        )
+        # small chunks, so the uploads can start while the rest is validated
+        use_case.VALIDATION_CHUNK_SIZE = 5
+        validate_annotations = use_case._validate_annotations
+
+        def _validate_annotations(annotations):
+            time.sleep(0.01 * len(annotations))
+            self.events.append(("validate", time.time()))
+            self.validated_chunks.append(len(annotations))
+            return validate_annotations(annotations)
+
+        use_case._validate_annotations = _validate_annotations
+        return use_case
+
+    def test_upload(self):
+        response = self._get_use_case(self._get_annotations()).execute()
+        self.assertFalse(response.errors)
+        self.assertEqual(
+            sorted(response.data["succeeded"]),
+            sorted(f"item_{i}.jpg" for i in range(self.ITEMS_COUNT)),
+        )
+        self.assertEqual(response.data["failed"], [])
+        self.assertEqual(sum(self.validated_chunks), self.ITEMS_COUNT)
+        self.assertTrue(all(size <= 5 for size in self.validated_chunks))
+
+    def test_upload_overlaps_validation(self):
+        # names are long enough to split the small annotations into several chunks
+        annotations = self._get_annotations()
+        for annotation in annotations:
+            metadata = annotation["metadata"]
+            metadata["name"] = f"{'x' * 500}_{metadata['name']}"
+        self._get_use_case(annotations).execute()
+        first_upload = min(t for e, t in self.events if e == "upload")
+        last_validation = max(t for e, t in self.events if e == "validate")
+        self.assertLess(first_upload, last_validation)
+
+    def test_invalid_annotations(self):
+        use_case = self._get_use_case(self._get_annotations(invalid=(3, 7)))
+        response = use_case.execute()
+        self.assertEqual(sorted(response.data["failed"]), ["item_3.jpg", "item_7.jpg"])
+        self.assertEqual(len(response.data["succeeded"]), self.ITEMS_COUNT - 2)
+        uploaded = [
+            name
+            for call in (
+                self.service_provider.annotations.upload_small_annotations.call_args_list
+            )
+            for name in call.kwargs["items_name_file_map"]
+        ]
+        self.assertNotIn("item_3.jpg", uploaded)
+        self.assertEqual(len(uploaded), self.ITEMS_COUNT - 2)
+
+
+class TestUploadAnnotationsFromFolder(BaseUploadAnnotationsTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _get_use_case(self, annotations):
+        paths = []
+        for annotation in annotations:
+            path = os.path.join(
+                self.tmp_dir.name, f"{annotation['metadata']['name']}___objects.json"
+            )
+            with open(path, "w") as file:
+                json.dump(annotation, file)
+            paths.append(path)
+        use_case = UploadAnnotationsFromFolderUseCase(
+            reporter=Reporter(log_info=False, log_warning=False),
+            project=self.project,
+            folder=self.folder,
+            team=MagicMock(creator_id="user@example.com"),
+            annotation_paths=paths,
+            service_provider=self.service_provider,
+            keep_status=True,
+        )
+        use_case.VALIDATION_CHUNK_SIZE = 5
+        validate_annotations = use_case._validate_annotations
+
+        def _validate_annotations(annotations):
+            self.validated_chunks.append(len(annotations))
+            return validate_annotations(annotations)
+
+        use_case._validate_annotations = _validate_annotations
+        return use_case
+
+    def test_upload(self):
+        uploaded, failed, missing = (
+            self._get_use_case(self._get_annotations()).execute().data
+        )
+        self.assertEqual(
+            sorted(uploaded), sorted(f"item_{i}.jpg" for i in range(self.ITEMS_COUNT))
+        )
+        self.assertEqual((failed, missing), ([], []))
+        self.assertEqual(self.validated_chunks, [5] * (self.ITEMS_COUNT // 5))
+
+    def test_invalid_annotations(self):
+        _, failed, _ = (
+            self._get_use_case(self._get_annotations(invalid=(3, 7))).execute().data
+        )
+        self.assertEqual(sorted(failed), ["item_3.jpg", "item_7.jpg"])
+        uploaded = [
+            name
+            for call in (
+                self.service_provider.annotations.upload_small_annotations.call_args_list
+            )
+            for name in call.kwargs["items_name_file_map"]
+        ]
+        self.assertEqual(len(uploaded), self.ITEMS_COUNT - 2)
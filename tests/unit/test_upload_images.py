@@ -0,0 +1,115 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from PIL import Image
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases import UploadImagesToProject
+
+
+class TestUploadImagesToProject(TestCase):
+    IMAGES_COUNT = 20
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(self.IMAGES_COUNT):
+            path = os.path.join(self.tmp_dir.name, f"image_{i}.jpg")
+            Image.new("RGB", (64, 48)).save(path)
+            self.paths.append(path)
+        self.service_provider = MagicMock()
+        self.service_provider.get_s3_upload_auth_token.return_value = MagicMock(
+            ok=True,
+            data={
+                "accessKeyId": "",
+                "secretAccessKey": "",
+                "sessionToken": "",
+                "bucket": "",
+                "filePath": "",
+                "availableImageCount": self.IMAGES_COUNT,
+            },
+        )
+        self.service_provider.projects.list_settings.return_value = MagicMock(
+            ok=True, data=[MagicMock(attribute="ImageQuality", value=100)]
+        )
+        self.service_provider.items.map_by_names.return_value = MagicMock(
+            ok=True, data={}
+        )
+        self.service_provider.get_limitations.return_value = MagicMock(
+            ok=False, error="Attaching is not tested."
+        )
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_shared_data_is_requested_once(self):
+        s3_repo = MagicMock()
+        use_case = UploadImagesToProject(
+            project=ProjectEntity(id=1, team_id=1, name="p", type=1, upload_state=1),
+            folder=FolderEntity(id=1, name="root"),
+            s3_repo=s3_repo,
+            service_provider=self.service_provider,
+            paths=self.paths,
+        )
+        use_case._validate = lambda: None
+        uploaded = len(list(use_case.execute()))
+        self.assertEqual(uploaded, self.IMAGES_COUNT)
+        self.service_provider.projects.list_settings.assert_called_once()
+        self.service_provider.get_s3_upload_auth_token.assert_called_once()
+        s3_repo.assert_called_once()
+
+    def test_upload_in_memory_images(self):
+        images = {}
+        for path in self.paths:
+            with open(path, "rb") as file:
+                images[os.path.basename(path)] = io.BytesIO(file.read())
+        s3_repo = MagicMock()
+        use_case = UploadImagesToProject(
+            project=ProjectEntity(id=1, team_id=1, name="p", type=1, upload_state=1),
+            folder=FolderEntity(id=1, name="root"),
+            s3_repo=s3_repo,
+            service_provider=self.service_provider,
+            paths=list(images),
+            images=images,
+        )
+        use_case._validate = lambda: None
+        with patch("builtins.open") as open_mock:
+            list(use_case.execute())
+        open_mock.assert_not_called()
+        self.assertEqual(s3_repo.return_value.insert.call_count, 4 * self.IMAGES_COUNT)
+
+    def test_few_images_are_processed_in_threads(self):
+        use_case = UploadImagesToProject(
+            project=ProjectEntity(id=1, team_id=1, name="p", type=1, upload_state=1),
+            folder=FolderEntity(id=1, name="root"),
+            s3_repo=MagicMock(),
+            service_provider=self.service_provider,
+            paths=self.paths,
+        )
+        use_case._validate = lambda: None
+        with patch.object(UploadImagesToProject, "get_processing_executor") as pool:
+            self.assertEqual(len(list(use_case.execute())), self.IMAGES_COUNT)
+        pool.assert_not_called()
+
+    def test_settings_error_fails_before_uploading(self):
+        self.service_provider.projects.list_settings.return_value = MagicMock(
+            ok=False, error="Failed"
+        )
+        s3_repo = MagicMock()
+        use_case = UploadImagesToProject(
+            project=ProjectEntity(id=1, team_id=1, name="p", type=1, upload_state=1),
+            folder=FolderEntity(id=1, name="root"),
+            s3_repo=s3_repo,
+            service_provider=self.service_provider,
+            paths=self.paths,
+        )
+        use_case._validate = lambda: None
+        list(use_case.execute())
+        uploaded, failed_images, _ = use_case.response.data
+        self.assertEqual(uploaded, [])
+        self.assertEqual(len(failed_images), self.IMAGES_COUNT)
+        s3_repo.return_value.insert.assert_not_called()
@@ -0,0 +1,61 @@
+from typing import List
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydantic import validate_arguments as pydantic_validate_arguments
+from src.superannotate.lib.app.interface import types
+from src.superannotate.lib.app.interface.types import NotEmptyStr
+from src.superannotate.lib.app.interface.types import validate_arguments
+
+
+class Interface:
+    @validate_arguments
+    def get_item_metadata(
+        self,
+        project: NotEmptyStr,
+        item_name: NotEmptyStr,
+        include_custom_metadata: bool = False,
+        items: Optional[List[NotEmptyStr]] = None,
+    ):
+        return project, item_name
+
+    def get_item_metadata_unvalidated(
+        self,
+        project: NotEmptyStr,
+        item_name: NotEmptyStr,
+        include_custom_metadata: bool = False,
+        items: Optional[List[NotEmptyStr]] = None,
+    ):
+        return project, item_name
+
+
+class TestValidateArguments(TestCase):
+    CALLS = 50
+
+    def test_validation(self):
+        interface = Interface()
+        self.assertEqual(interface.get_item_metadata("p", "i"), ("p", "i"))
+        with self.assertRaisesRegex(Exception, "item_name"):
+            interface.get_item_metadata("p", "")
+        with self.assertRaisesRegex(Exception, "items"):
+            interface.get_item_metadata("p", "i", items=[1])
+
+    def test_validator_is_built_once(self):
+        with patch.object(
+            types, "pydantic_validate_arguments", wraps=pydantic_validate_arguments
+        ) as build_validator:
+
+            class CountedInterface(Interface):
+                get_item_metadata = validate_arguments(
+                    Interface.get_item_metadata_unvalidated
+                )
+
+            # the validator is built on the first call, not at class creation
+            build_validator.assert_not_called()
+            interface = CountedInterface()
+            for _ in range(self.CALLS):
+                interface.get_item_metadata("project", "item", items=["a", "b"])
+            with self.assertRaisesRegex(Exception, "item_name"):
+                interface.get_item_metadata("project", "")
+        build_validator.assert_called_once()
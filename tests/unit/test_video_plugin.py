@@ -0,0 +1,213 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.plugin import VideoPlugin
+from src.superannotate.lib.core.reporter import Reporter
+from src.superannotate.lib.core.usecases import UploadImagesToProject
+from src.superannotate.lib.core.usecases import UploadVideosAsImages
+
+
+class TestVideoPlugin(TestCase):
+    FRAMES_COUNT = 37
+    FPS = 10
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.video_path = os.path.join(cls.tmp_dir.name, "video.avi")
+        writer = cv2.VideoWriter(
+            cls.video_path, cv2.VideoWriter_fourcc(*"MJPG"), cls.FPS, (64, 48)
+        )
+        for i in range(cls.FRAMES_COUNT):
+            writer.write(np.full((48, 64, 3), i, np.uint8))
+        writer.release()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmp_dir.cleanup()
+
+    def test_frames_count(self):
+        self.assertEqual(
+            VideoPlugin.get_frames_count(self.video_path), self.FRAMES_COUNT
+        )
+
+    def test_extractable_frames_count(self):
+        for start_time, end_time, target_fps in (
+            (0.0, None, None),
+            (0.0, None, 3),
+            (0.0, None, 0.7),
+            (1.0, 2.5, 4),
+            (0.5, None, 20),
+        ):
+            expected = sum(
+                1
+                for _ in VideoPlugin.frames_generator(
+                    self.video_path, start_time, end_time, target_fps, log=False
+                )
+            )
+            self.assertEqual(
+                VideoPlugin.get_extractable_frames_count(
+                    self.video_path, start_time, end_time, target_fps
+                ),
+                expected,
+            )
+
+    def test_extractable_frames_with_inexact_metadata(self):
+        expected = sum(
+            1
+            for _ in VideoPlugin.frames_generator(
+                self.video_path, 1.0, 3.0, None, log=False
+            )
+        )
+        # the count follows the decoded frames, not the container metadata
+        with patch.object(VideoPlugin, "get_fps", return_value=25), patch.object(
+            VideoPlugin, "get_frames_count", return_value=100
+        ):
+            count = VideoPlugin.get_extractable_frames_count(
+                self.video_path, 1.0, 3.0, None
+            )
+        self.assertEqual(count, expected)
+
+    def test_estimated_frames_count(self):
+        for start_time, end_time, target_fps in (
+            (0.0, None, None),
+            (0.0, None, 3),
+            (1.0, 2.5, 4),
+            (0.5, None, 20),
+        ):
+            expected = VideoPlugin.get_extractable_frames_count(
+                self.video_path, start_time, end_time, target_fps
+            )
+            estimated = VideoPlugin.estimate_extractable_frames_count(
+                self.video_path, start_time, end_time, target_fps
+            )
+            self.assertLessEqual(abs(estimated - expected), 1)
+
+    def test_extract_frames(self):
+        with tempfile.TemporaryDirectory() as extract_path:
+            paths = [
+                path
+                for chunk in VideoPlugin.extract_frames(
+                    self.video_path, 0.0, None, extract_path, 100, 5
+                )
+                for path in chunk
+            ]
+            names = VideoPlugin.get_extractable_frames(self.video_path, 0.0, None, 5)
+            self.assertEqual([os.path.basename(path) for path in paths], names)
+
+    def test_extract_frames_in_memory(self):
+        with tempfile.TemporaryDirectory() as extract_path, ThreadPoolExecutor(
+            max_workers=4
+        ) as executor:
+            paths = next(
+                VideoPlugin.extract_frames(
+                    self.video_path, 0.0, None, extract_path, 100, None
+                )
+            )
+            frames = next(
+                VideoPlugin.extract_frames(
+                    self.video_path, 0.0, None, None, 100, None, executor=executor
+                )
+            )
+            self.assertEqual(len(frames), self.FRAMES_COUNT)
+            for path, (name, data) in zip(paths, frames):
+                self.assertEqual(os.path.basename(path), name)
+                with open(path, "rb") as file:
+                    self.assertEqual(file.read(), data.getvalue())
+
+    def test_extract_frames_limit(self):
+        frames = [
+            frame
+            for chunk in VideoPlugin.extract_frames(
+                self.video_path, 0.0, None, None, 25, None, chunk_size=10
+            )
+            for frame in chunk
+        ]
+        self.assertEqual(len(frames), 25)
+
+
+class TestUploadVideosAsImages(TestCase):
+    FRAMES_COUNT = 12
+    EXISTING_COUNT = 5
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.video_path = os.path.join(self.tmp_dir.name, "video.avi")
+        writer = cv2.VideoWriter(
+            self.video_path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48)
+        )
+        for i in range(self.FRAMES_COUNT):
+            writer.write(np.full((48, 64, 3), i, np.uint8))
+        writer.release()
+        self.service_provider = MagicMock()
+        self.service_provider.get_s3_upload_auth_token.return_value = MagicMock(
+            ok=True,
+            data={
+                "accessKeyId": "",
+                "secretAccessKey": "",
+                "sessionToken": "",
+                "bucket": "",
+                "filePath": "",
+                "availableImageCount": self.FRAMES_COUNT,
+            },
+        )
+        self.service_provider.projects.list_settings.return_value = MagicMock(
+            ok=True, data=[MagicMock(attribute="ImageQuality", value=100)]
+        )
+        existing = {f"video_{i:02d}.jpg": 1 for i in range(1, self.EXISTING_COUNT + 1)}
+        self.service_provider.items.map_by_names.side_effect = lambda **kwargs: (
+            MagicMock(
+                ok=True,
+                data={name: 1 for name in kwargs["names"] if name in existing},
+            )
+        )
+        self.service_provider.items.attach.side_effect = lambda **kwargs: MagicMock(
+            data=[{"name": attachment.name} for attachment in kwargs["attachments"]]
+        )
+        limit = MagicMock(remaining_image_count=100)
+        self.service_provider.get_limitations.return_value = MagicMock(
+            ok=True,
+            data=MagicMock(folder_limit=limit, project_limit=limit, user_limit=None),
+        )
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_video_is_decoded_once(self):
+        use_case = UploadVideosAsImages(
+            reporter=Reporter(log_info=False, log_warning=False),
+            service_provider=self.service_provider,
+            project=ProjectEntity(id=1, team_id=1, name="p", type=1, upload_state=1),
+            folder=FolderEntity(id=1, name="root"),
+            s3_repo=MagicMock(),
+            paths=[self.video_path],
+            target_fps=None,
+            annotation_status="NotStarted",
+        )
+        # the test process has started the cv2 threads, forked workers would block
+        with patch(
+            "lib.core.plugin.VideoPlugin._grab_frames",
+            side_effect=VideoPlugin._grab_frames,
+        ) as grab_frames, patch.object(
+            UploadImagesToProject,
+            "get_processing_executor",
+            return_value=ThreadPoolExecutor(max_workers=2),
+        ):
+            response = use_case.execute()
+        self.assertFalse(response.errors)
+        grab_frames.assert_called_once()
+        self.assertEqual(
+            sorted(response.data),
+            [
+                f"video_{i:02d}.jpg"
+                for i in range(self.EXISTING_COUNT + 1, self.FRAMES_COUNT + 1)
+            ],
+        )
@@ -0,0 +1,77 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+from PIL import Image
+from src.superannotate.lib.app.input_converters.converters.yolo_converters.yolo_to_sa_vector import (
+    yolo_object_detection_to_sa_vector,
+)
+
+
+class TestYoloConversion(TestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self._tmp_dir.name) / "yolo"
+        self.output_dir = Path(self._tmp_dir.name) / "output"
+        self.data_path.mkdir()
+        self.output_dir.mkdir()
+        (self.data_path / "classes.txt").write_text("cat\ndog\n")
+
+    def tearDown(self) -> None:
+        self._tmp_dir.cleanup()
+
+    def _add_image(self, name, height=10, width=20):
+        image = Image.fromarray(np.zeros((height, width, 3), dtype=np.uint8))
+        image.save(self.data_path / name)
+
+    def _add_labels(self, name, text="0 0.5 0.5 0.5 0.5\n"):
+        (self.data_path / name).write_text(text)
+
+    def _get_instances(self, name):
+        with open(self.output_dir / f"{name}___objects.json") as file:
+            return json.load(file)["instances"]
+
+    def test_conversion(self):
+        self._add_image("image.jpg")
+        self._add_labels("image.txt", "0 0.5 0.5 0.5 0.5\n\n1 0.25 0.75 0.1 0.2 0.9\n")
+        classes = yolo_object_detection_to_sa_vector(self.data_path, self.output_dir)
+        self.assertEqual(classes, {0: "cat", 1: "dog"})
+        instances = self._get_instances("image.jpg")
+        self.assertEqual([i["className"] for i in instances], ["cat", "dog"])
+        self.assertEqual(
+            instances[0]["points"], {"x1": 5.0, "y1": 2.5, "x2": 15.0, "y2": 7.5}
+        )
+        self.assertEqual(
+            instances[1]["points"],
+            {
+                "x1": 0.25 * 20 - 0.1 * 20 / 2,
+                "y1": 0.75 * 10 - 0.2 * 10 / 2,
+                "x2": 0.25 * 20 + 0.1 * 20 / 2,
+                "y2": 0.75 * 10 + 0.2 * 10 / 2,
+            },
+        )
+
+    def test_image_matching(self):
+        self._add_image("image.v2.png")
+        self._add_labels("image.v2.txt")
+        self._add_image("[image].jpg")
+        self._add_labels("[image].txt")
+        self._add_labels("missing.txt")
+        self._add_image("multiple.jpg")
+        self._add_image("multiple.png")
+        self._add_labels("multiple.txt")
+        self._add_labels("empty.txt", "")
+        self._add_image("empty.jpg")
+        yolo_object_detection_to_sa_vector(self.data_path, self.output_dir, workers=2)
+        self.assertEqual(
+            sorted(path.name for path in self.output_dir.iterdir()),
+            [
+                "[image].jpg___objects.json",
+                "empty.jpg___objects.json",
+                "image.v2.png___objects.json",
+            ],
+        )
+        self.assertEqual(len(self._get_instances("image.v2.png")), 1)
+        self.assertEqual(self._get_instances("empty.jpg"), [])